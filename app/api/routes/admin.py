@@ -1,13 +1,16 @@
 # 관리자 대시보드
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from urllib.parse import quote
 from pydantic import BaseModel
 from datetime import datetime
-import csv
+from typing import Optional
 import json
-import os
 from app.core.jwt_utils import get_authenticated_user
-from app.database.mysql_connect import get_connection
+from app.database.mysql_connect import get_connection, db_cursor
 from app.core.email_utils import send_email
+from app.services.broadcast import start_broadcast, get_broadcast
+from app.services.road_export import build_export, EXPORT_FORMATS
+from app.services.model_registry import model_registry
 from app.api.socket import *
 
 router = APIRouter()
@@ -20,6 +23,14 @@ class FileRequest(BaseModel):
     req_date: datetime
 
 
+class BroadcastRequest(BaseModel):
+    subject: str
+    body: str
+    is_html: bool = False
+    jurisdiction: Optional[str] = None  # 없으면 전체
+    user_dept: Optional[str] = None
+
+
 # ✅ 파일 요청 확인
 @router.get("/file-requests")
 def get_file_requests(token: str = Depends(get_authenticated_user)):
@@ -50,10 +61,16 @@ def get_file_requests(token: str = Depends(get_authenticated_user)):
 
 # ✅ 파일 승인
 @router.post("/file-requests/approve/{log_id}")
-def approve_file_request(log_id: int, user: dict = Depends(get_authenticated_user)):
-    """승인 메일"""
+def approve_file_request(
+    log_id: int,
+    format: str = Query("csv"),
+    user: dict = Depends(get_authenticated_user),
+):
+    """승인 메일 (format: csv / csv.gz / xlsx)"""
     if not user.get("admin"):
         raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
 
     try:
         connection = get_connection()
@@ -72,43 +89,13 @@ def approve_file_request(log_id: int, user: dict = Depends(get_authenticated_use
         user_email = request["user_email"]
         recommended_data = json.loads(request["recommended_roads"])
 
-        # rds_rg와 recommended_roads 추출
-        rds_rg = recommended_data["rds_rg"]
-        recommended_roads = recommended_data["recommended_roads"]
-
-        # CSV 파일명 설정 (동 이름 포함)
-        csv_filename = f"{rds_rg}_도로추천.csv"
-        csv_filepath = f"./{csv_filename}"  # Temporary directory
-
-        with open(csv_filepath, mode="w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                [
-                    "rds_id",
-                    "road_name",
-                    "rbp",
-                    "rep",
-                    "rd_slope",
-                    "acc_occ",
-                    "acc_sc",
-                    "rd_fr",
-                    "pred_idx",
-                ]
-            )
-            for road in recommended_roads:
-                writer.writerow(
-                    [
-                        road["rds_id"],
-                        road["road_name"],
-                        road["rbp"],
-                        road["rep"],
-                        road["rd_slope"],
-                        road["acc_occ"],
-                        road["acc_sc"],
-                        road["rd_fr"],
-                        road["pred_idx"],
-                    ]
-                )
+        # 추천 결과 파일 (메모리에서 생성, log_id별 캐시)
+        attachment = build_export(
+            log_id,
+            recommended_data["rds_rg"],
+            recommended_data["recommended_roads"],
+            format,
+        )
 
         # 승인 메일 전송
         email_subject = "도로 추천 결과 파일"
@@ -117,12 +104,9 @@ def approve_file_request(log_id: int, user: dict = Depends(get_authenticated_use
             to_email=user_email,
             subject=email_subject,
             body=email_body,
-            attachment_path=csv_filepath,
+            attachments=[attachment],
         )
 
-        # 파일 삭제
-        os.remove(csv_filepath)
-
         # approve 상태를 1로 변경
         update_query = "UPDATE rec_road_log SET approve = 1 WHERE log_id = %s"
         cursor.execute(update_query, (log_id,))
@@ -177,3 +161,100 @@ def reject_file_request(log_id: int, user: dict = Depends(get_authenticated_user
     finally:
         cursor.close()
         connection.close()
+
+
+# ✅ 추천 결과 파일 다운로드
+@router.get("/file-requests/{log_id}/export")
+def download_file_request(
+    log_id: int,
+    format: str = Query("csv"),
+    user: dict = Depends(get_authenticated_user),
+):
+    """추천 결과 파일 다운로드 (format: csv / csv.gz / xlsx)"""
+    if not user.get("admin"):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
+
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute(
+            "SELECT recommended_roads FROM rec_road_log WHERE log_id = %s", (log_id,)
+        )
+        request = cursor.fetchone()
+
+    if not request:
+        raise HTTPException(status_code=404, detail="해당 요청을 찾을 수 없습니다.")
+
+    recommended_data = json.loads(request["recommended_roads"])
+    filename, data, mimetype = build_export(
+        log_id,
+        recommended_data["rds_rg"],
+        recommended_data["recommended_roads"],
+        format,
+    )
+    return Response(
+        content=data,
+        media_type=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"
+        },
+    )
+
+
+# ✅ 공지 메일 일괄 발송
+@router.post("/broadcast", status_code=202)
+def create_broadcast(
+    request: BroadcastRequest, user: dict = Depends(get_authenticated_user)
+):
+    """전체 또는 관할/부서별 사용자에게 공지 메일 발송 (백그라운드, 진행 상황은 조회 API로)"""
+    if not user.get("admin"):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+
+    broadcast = start_broadcast(
+        request.subject,
+        request.body,
+        is_html=request.is_html,
+        jurisdiction=request.jurisdiction,
+        user_dept=request.user_dept,
+    )
+    return {"message": "공지 메일 발송을 시작했습니다.", "broadcast_id": broadcast.id}
+
+
+# ✅ 공지 메일 발송 진행 상황
+@router.get("/broadcast/{broadcast_id}")
+def get_broadcast_progress(
+    broadcast_id: str,
+    include_results: bool = False,
+    user: dict = Depends(get_authenticated_user),
+):
+    """발송 진행 상황 (include_results=true면 수신자별 결과 포함)"""
+    if not user.get("admin"):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+
+    progress = get_broadcast(broadcast_id, include_results)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="발송 기록을 찾을 수 없습니다.")
+    return progress
+
+
+# ✅ 도로 추천 모델 상태 / 교체
+@router.get("/model")
+def get_model_status(user: dict = Depends(get_authenticated_user)):
+    """현재 사용 중인 추천 모델 버전 / 적재 시간"""
+    if not user.get("admin"):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+    return model_registry.stats()
+
+
+@router.post("/model/reload")
+def reload_model(user: dict = Depends(get_authenticated_user)):
+    """
+    모델 파일을 다시 읽어 무중단 교체 (적재 + 시험 추론 성공 후 교체)
+    실패하면 기존 모델을 그대로 사용, 성공하면 다른 워커도 이벤트를 받아 같은 파일로 교체
+    """
+    if not user.get("admin"):
+        raise HTTPException(status_code=403, detail="관리자만 접근 가능합니다.")
+    try:
+        return model_registry.reload()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"모델 교체 실패: {e}")
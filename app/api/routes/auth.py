@@ -1,12 +1,13 @@
-from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi import APIRouter, HTTPException, Header, Query, Depends
 from fastapi.responses import HTMLResponse, RedirectResponse
 from pydantic import BaseModel, EmailStr, field_validator
 from datetime import datetime, timedelta, timezone
+import asyncio
 import redis
 import json
 from mysql.connector import Error
-from app.database.mysql_connect import get_connection
-from app.core.security import hash_password, verify_password
+from app.database.mysql_connect import get_connection, db_cursor
+from app.core.security import hash_password_async, verify_password_async
 from app.core.email_utils import (
     generate_verification_code,
     send_verification_email,
@@ -14,6 +15,15 @@ from app.core.email_utils import (
 )
 from app.core.jwt_utils import create_access_token, verify_token, create_refresh_token
 from app.core.token_blacklist import add_token_to_blacklist, is_token_blacklisted
+from app.core.rate_limit import rate_limit
+from app.services import presence
+from app.services.user_cache import get_user_profile, get_admin_level, invalidate_user
+from app.services.verification_store import (
+    save_verification_code,
+    check_verification_code,
+    CODE_OK,
+    CODE_LOCKED,
+)
 
 router = APIRouter()
 
@@ -24,10 +34,6 @@ except Exception as e:
     print(f"Redis connection failed: {e}")
     redis_client = None
 
-# 인증번호 임시 저장
-verification_codes = {}
-
-
 # 요청 모델 정의
 class SignUpRequest(BaseModel):
     email: EmailStr
@@ -116,38 +122,30 @@ class ResetPasswordRequest(BaseModel):
         return value
 
 
-# 사용자 확인
+# 사용자 확인 (user_data + 권한, 캐시 경유)
 def find_user_by_email(email: str):
     try:
-        connection = get_connection()
-        cursor = connection.cursor(dictionary=True)
-        query = "SELECT * FROM user_data WHERE user_email = %s"
-        cursor.execute(query, (email,))
-        user = cursor.fetchone()
-        return user
+        return get_user_profile(email)
+    except Error as e:
+        print(f"Database error: {e}")
+        raise HTTPException(status_code=500, detail="Database connection failed.")
+
+
+# 저장된 비밀번호 (캐시하지 않고 로그인 확인 시에만 DB에서 조회)
+def get_stored_password(email: str):
+    try:
+        with db_cursor() as cursor:
+            cursor.execute("SELECT user_ps FROM user_data WHERE user_email = %s", (email,))
+            row = cursor.fetchone()
+        return row[0] if row else None
     except Error as e:
         print(f"Database error: {e}")
         raise HTTPException(status_code=500, detail="Database connection failed.")
-    finally:
-        if "cursor" in locals() and cursor:
-            cursor.close()
-        if "connection" in locals() and connection.is_connected():
-            connection.close()
 
 
 # 관리자 확인
 def is_admin(email: str):
-    try:
-        connection = get_connection()
-        cursor = connection.cursor(dictionary=True)
-        query = "SELECT is_admin FROM permissions WHERE user_email = %s"
-        cursor.execute(query, (email,))
-        result = cursor.fetchone()
-        return result and result["is_admin"]
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+    return get_admin_level(email)
 
 
 # 1. 이메일 중복 및 형식 확인
@@ -164,15 +162,18 @@ def check_email(request: EmailCheckRequest):
 
 
 # 2. 비밀번호 검증 및 회원가입 인증 이메일 전송
-@router.post("/signup/send-code")
-def signup_send_code(request: SignUpRequest):
+@router.post(
+    "/signup/send-code", dependencies=[Depends(rate_limit("signup_send_code"))]
+)
+async def signup_send_code(request: SignUpRequest):
     """
     비밀번호 검증 및 회원가입 인증 이메일 전송
     - 비밀번호 검증 실패 시 오류 반환\n
     - 이메일 중복 확인 후 인증 이메일 전송\n
     - Redis에 사용자 정보 저장 (10분 유지)
     """
-    hashed_password = hash_password(request.password)
+    # bcrypt는 전용 풀에서 - 기다리는 동안 라우트 스레드를 잡지 않음
+    hashed_password = await hash_password_async(request.password)
 
     token = create_access_token(
         data={"sub": request.email}, expires_delta=timedelta(minutes=10)
@@ -184,11 +185,14 @@ def signup_send_code(request: SignUpRequest):
         "jurisdiction": request.jurisdiction,
         "department": request.department,
     }
-    redis_client.setex(
-        f"signup_data:{request.email}", timedelta(minutes=10), json.dumps(user_data)
+    await asyncio.to_thread(
+        redis_client.setex,
+        f"signup_data:{request.email}",
+        timedelta(minutes=10),
+        json.dumps(user_data),
     )
 
-    if not send_signup_email(request.email, token):
+    if not await asyncio.to_thread(send_signup_email, request.email, token):
         raise HTTPException(status_code=500, detail="인증 이메일 발송에 실패했습니다.")
 
     return {
@@ -239,9 +243,8 @@ def confirm_email(token: str = Query(...)):
             cursor.execute(query, values)
             connection.commit()
         finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
+            cursor.close()
+            connection.close()
 
         # 레디스에서 데이터 삭제
         redis_client.delete(f"signup_data:{email}")
@@ -287,23 +290,31 @@ def signup_error(error_type: str = Query("unknown")):
     )
 
 
-# ✅ 로그인
-@router.post("/login")
-def login_user(request: LoginRequest):
-    user = find_user_by_email(request.email)
+def _load_login(email: str):
+    """로그인 확인에 필요한 값 (사용자, 관리자 권한 값, 저장된 비밀번호) - DB/캐시 조회"""
+    user = find_user_by_email(email)
     if not user:
-        raise HTTPException(status_code=404, detail="존재하지 않는 이메일입니다.")
-
+        return None, None, None
     # 관리자 권한 값 조회 (일반 사용자: 1, 개발자: 2 등)
-    admin_value = is_admin(request.email)
+    return user, is_admin(email), get_stored_password(email)
+
+
+# ✅ 로그인
+@router.post("/login", dependencies=[Depends(rate_limit("login"))])
+async def login_user(request: LoginRequest):
+    user, admin_value, stored_password = await asyncio.to_thread(
+        _load_login, request.email
+    )
+    if not user or stored_password is None:
+        raise HTTPException(status_code=404, detail="존재하지 않는 이메일입니다.")
 
     # is_admin이 2 (개발자 계정)일 때는 비밀번호 해시 검증 대신 평문 비교를 사용
     if admin_value == 2:
-        if request.password != user["user_ps"]:
+        if request.password != stored_password:
             raise HTTPException(status_code=401, detail="비밀번호가 일치하지 않습니다.")
     else:
         # 일반 사용자: 해시된 비밀번호 검증
-        if not verify_password(request.password, user["user_ps"]):
+        if not await verify_password_async(request.password, stored_password):
             raise HTTPException(status_code=401, detail="비밀번호가 일치하지 않습니다.")
 
     # 토큰 생성 시, 관리자 여부 값을 payload에 포함
@@ -314,8 +325,8 @@ def login_user(request: LoginRequest):
     refresh_token = create_refresh_token(
         data={"sub": request.email}, expires_delta=timedelta(days=7)
     )
-    # ✅ 로그인 성공 시 online_users Set에 등록
-    redis_client.sadd("online_users", request.email)
+    # ✅ 로그인 성공 시 접속자로 기록 (쓰기 제한 무시)
+    await asyncio.to_thread(presence.touch, request.email, force=True)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -338,7 +349,7 @@ def logout(request: LogoutRequest):
 
     # ✅ 접속자 목록에서 제거
     email = payload.get("sub")
-    redis_client.srem("online_users", email)
+    presence.remove(email)
 
     return {"message": "로그아웃 되었습니다."}
 
@@ -387,7 +398,7 @@ def protected_route(token: str = Header(...)):
 
 
 # ✅ 비밀번호 찾기
-@router.post("/findpwd")
+@router.post("/findpwd", dependencies=[Depends(rate_limit("findpwd"))])
 def findpwd(request: EmailCheckRequest):
     """비밀번호 재설정 위한 인증번호 이메일로 보내기"""
     user = find_user_by_email(request.email)
@@ -395,7 +406,7 @@ def findpwd(request: EmailCheckRequest):
         raise HTTPException(status_code=400, detail="존재하지 않는 이메일입니다.")
 
     code = generate_verification_code()
-    verification_codes[request.email] = code
+    save_verification_code(request.email, code)
 
     if not send_verification_email(request.email, code):
         raise HTTPException(
@@ -409,10 +420,13 @@ def findpwd(request: EmailCheckRequest):
 @router.post("/verify-code")
 def verify_code(request: VerifyCodeRequest):
     """인증번호 입력 후 확인"""
-    if (
-        request.email not in verification_codes
-        or verification_codes[request.email] != request.code
-    ):
+    result = check_verification_code(request.email, request.code)
+    if result == CODE_LOCKED:
+        raise HTTPException(
+            status_code=429,
+            detail="인증 시도 횟수를 초과했습니다. 인증번호를 다시 발송하세요.",
+        )
+    if result != CODE_OK:
         raise HTTPException(status_code=400, detail="유효하지 않은 인증번호입니다.")
 
     user = find_user_by_email(request.email)
@@ -430,35 +444,38 @@ def verify_code(request: VerifyCodeRequest):
     }
 
 
+def _update_password(email: str, hashed_password: str):
+    try:
+        connection = get_connection()
+        cursor = connection.cursor()
+        query = "UPDATE user_data SET user_ps = %s WHERE user_email = %s"
+        cursor.execute(query, (hashed_password, email))
+        connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
+    invalidate_user(email)
+
+
 # ✅ 비밀번호 재설정
 @router.post("/reset-password")
-def reset_password(request: ResetPasswordRequest):
+async def reset_password(request: ResetPasswordRequest):
     """비밀번호 재설정하기"""
-    payload = verify_token(request.reset_token)
+    payload = await asyncio.to_thread(verify_token, request.reset_token)
     if not payload or payload.get("action") != "password_reset":
         raise HTTPException(
             status_code=401, detail="인증이 만료되었습니다. 인증번호를 다시 발송하세요."
         )
 
     email = payload.get("sub")
-    user = find_user_by_email(email)
+    user = await asyncio.to_thread(find_user_by_email, email)
     if not user:
         raise HTTPException(status_code=400, detail="존재하지 않는 이메일입니다.")
 
     if request.new_password != request.confirm_password:
         raise HTTPException(status_code=400, detail="비밀번호가 일치하지 않습니다.")
 
-    hashed_password = hash_password(request.new_password)
-
-    try:
-        connection = get_connection()
-        cursor = connection.cursor()
-        query = "UPDATE user_data SET user_ps = %s WHERE user_email = %s"
-        cursor.execute(query, (hashed_password, email))
-        connection.commit()
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+    hashed_password = await hash_password_async(request.new_password)
+    await asyncio.to_thread(_update_password, email, hashed_password)
 
     return {"message": "비밀번호가 성공적으로 재설정되었습니다."}
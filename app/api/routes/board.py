@@ -11,6 +11,7 @@ import os
 import subprocess
 from typing import List, Optional
 from app.database.mysql_connect import get_connection
+from app.database.async_mysql import async_cursor
 from app.core.jwt_utils import get_authenticated_user
 from app.api.socket import *
 
@@ -72,6 +73,82 @@ class AnswerRequest(BaseModel):
     answer: str
 
 
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+ALLOWED_EXTENSIONS = ["png", "jpg", "jpeg", "gif"]
+
+
+async def read_uploads(files: Optional[List[UploadFile]]) -> list:
+    """
+    업로드 파일 검사 (크기 / 확장자 / MIME) - 디스크나 DB를 건드리기 전에 전부 확인
+    return: [(파일명, 내용, MIME), ...]
+    """
+    uploads = []
+    for file in files or []:
+        content = await file.read()
+        if len(content) > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"파일 {file.filename}의 최대 크기는 10MB입니다.",
+            )
+
+        if "." not in file.filename:
+            raise HTTPException(
+                status_code=400,
+                detail=f"파일 {file.filename}에 확장자가 없습니다.",
+            )
+        ext = file.filename.rsplit(".", 1)[-1].lower()
+        if ext not in ALLOWED_EXTENSIONS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"파일 {file.filename}: 허용되지 않은 확장자입니다.",
+            )
+
+        detected_mime = magic.Magic(mime=True).from_buffer(content)
+        if not detected_mime.startswith("image/"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"파일 {file.filename}: 허용되지 않은 파일 형식입니다.",
+            )
+        uploads.append((file.filename, content, detected_mime))
+    return uploads
+
+
+async def save_uploads(cursor, post_id: int, uploads: list, user_email: str, written: list):
+    """검사를 마친 파일을 디스크에 쓰고 메타데이터 INSERT (쓴 경로는 written에 추가)"""
+    saved = []
+    for file_name, content, detected_mime in uploads:
+        file_path = os.path.join(UPLOAD_FOLDER, file_name)
+        with open(file_path, "wb") as f:
+            f.write(content)
+        written.append(file_path)
+
+        await cursor.execute(
+            """
+            INSERT INTO file_metadata (post_id, file_name, file_path, file_size, file_type, user_email, upload_time)
+            VALUES (%s, %s, %s, %s, %s, %s, NOW())
+            """,
+            (post_id, file_name, file_path, len(content), detected_mime, user_email),
+        )
+        saved.append(
+            {
+                "file_name": file_name,
+                "file_path": file_path,
+                "file_size": len(content),
+                "file_type": detected_mime,
+            }
+        )
+    return saved
+
+
+def remove_files(paths):
+    for path in paths:
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            print(f"파일 삭제 실패 ({path}): {e}")
+
+
 # ✅ 1. 전체 게시글 조회 (조회수 실시간 반영)
 @router.get("/")
 def get_all_posts(user: dict = Depends(get_authenticated_user)):
@@ -164,114 +241,56 @@ async def create_post_with_file(
     user: dict = Depends(get_authenticated_user),
 ):
     """게시글 작성 + 파일 업로드"""
-    connection = get_connection()
-    cursor = None
-
     try:
-        cursor = connection.cursor()
-
-        # 1. 게시글을 먼저 DB에 저장
-        query = """
-            INSERT INTO Posts (board_id, user_email, post_title, post_category, post_text, post_time, views)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
-        """
-        cursor.execute(
-            query,
-            (
-                board_id,
-                user["sub"],
-                post_title,
-                post_category,
-                post_text,
-                datetime.now(),
-                0,
-            ),
-        )
-        connection.commit()
-
-        # 2. 방금 저장한 `post_id` 가져오기
-        cursor.execute("SELECT LAST_INSERT_ID()")
-        post_id = cursor.fetchone()[0]
-
-        # 3. 파일이 있을 경우 처리
-        uploaded_files_data = []
-        if files:
-            MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-            allowed_extensions = ["png", "jpg", "jpeg", "gif"]
-
-            for file in files:
-                content = await file.read()
-                file_size = len(content)
-                if file_size > MAX_FILE_SIZE:
-                    raise HTTPException(
-                        status_code=400, detail=f"업로드 파일의 최대 크기는 10MB입니다."
-                    )
-
-                if "." not in file.filename:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}에 확장자가 없습니다.",
-                    )
-                ext = file.filename.rsplit(".", 1)[-1].lower()
-                if ext not in allowed_extensions:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}: 허용되지 않은 확장자입니다.",
-                    )
-
-                file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-                with open(file_path, "wb") as f:
-                    f.write(content)
-
-                mime = magic.Magic(mime=True)
-                detected_mime = mime.from_file(file_path)
-                if not detected_mime.startswith("image/"):
-                    os.remove(file_path)
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}: 허용되지 않은 파일 형식입니다.",
-                    )
-
-                file_query = """
-                    INSERT INTO file_metadata (post_id, file_name, file_path, file_size, file_type, user_email, upload_time)
-                    VALUES (%s, %s, %s, %s, %s, %s, NOW())
+        # 파일 검사를 먼저 끝내고 (실패하면 아무것도 저장하지 않음)
+        uploads = await read_uploads(files)
+        written = []  # 이번 요청에서 쓴 파일 (트랜잭션 실패 시 삭제)
+
+        try:
+            async with async_cursor(commit=True) as cursor:
+                # 1. 게시글을 먼저 DB에 저장
+                query = """
+                    INSERT INTO Posts (board_id, user_email, post_title, post_category, post_text, post_time, views)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
                 """
-                cursor.execute(
-                    file_query,
+                await cursor.execute(
+                    query,
                     (
-                        post_id,
-                        file.filename,
-                        file_path,
-                        file_size,
-                        detected_mime,
+                        board_id,
                         user["sub"],
+                        post_title,
+                        post_category,
+                        post_text,
+                        datetime.now(),
+                        0,
                     ),
                 )
-                connection.commit()
 
-                uploaded_files_data.append(
-                    {
-                        "file_name": file.filename,
-                        "file_path": file_path,
-                        "file_size": file_size,
-                        "file_type": detected_mime,
-                    }
+                # 2. 방금 저장한 `post_id` 가져오기
+                post_id = cursor.lastrowid
+
+                # 3. 파일이 있을 경우 저장
+                uploaded_files_data = await save_uploads(
+                    cursor, post_id, uploads, user["sub"], written
                 )
 
-        # 4. 생성된 게시글 데이터 가져오기
-        cursor.execute("SELECT * FROM Posts WHERE post_id = %s", (post_id,))
-        new_post = cursor.fetchone()
+                # 4. 생성된 게시글 데이터 가져오기
+                await cursor.execute("SELECT * FROM Posts WHERE post_id = %s", (post_id,))
+                new_post = await cursor.fetchone()
+        except BaseException:
+            remove_files(written)
+            raise
 
         # 5. WebSocket을 통해 새 게시글 알림 (파일 정보 포함)
         post_data = {
-            "post_id": new_post[0],
-            "board_id": new_post[1],
-            "user_email": new_post[2],
-            "post_title": new_post[3],
-            "post_category": new_post[4],
-            "post_text": new_post[5],
-            "post_time": new_post[6].isoformat(),
-            "views": new_post[7],
+            "post_id": new_post["post_id"],
+            "board_id": new_post["board_id"],
+            "user_email": new_post["user_email"],
+            "post_title": new_post["post_title"],
+            "post_category": new_post["post_category"],
+            "post_text": new_post["post_text"],
+            "post_time": new_post["post_time"].isoformat(),
+            "views": new_post["views"],
             "files": uploaded_files_data,
         }
         await notify_new_post(post_data)
@@ -285,23 +304,15 @@ async def create_post_with_file(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        if cursor:
-            cursor.close()
-            connection.close()
-
 
 # ✅ 4. 게시글 수정 권한 확인
 @router.get("/{post_id}/edit")
 async def get_post_for_edit(post_id: int, user: dict = Depends(get_authenticated_user)):
     """게시글 수정 페이지 접근 - 권한 확인 및 기존 데이터 반환"""
-    try:
-        connection = get_connection()
-        cursor = connection.cursor(dictionary=True)
-
+    async with async_cursor() as cursor:
         # 1. 게시글 가져오기 (작성자만 접근 가능)
-        cursor.execute("SELECT * FROM Posts WHERE post_id = %s", (post_id,))
-        post = cursor.fetchone()
+        await cursor.execute("SELECT * FROM Posts WHERE post_id = %s", (post_id,))
+        post = await cursor.fetchone()
         if not post:
             raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
 
@@ -309,16 +320,13 @@ async def get_post_for_edit(post_id: int, user: dict = Depends(get_authenticated
             raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
 
         # 2. 첨부 파일 목록 가져오기
-        cursor.execute(
+        await cursor.execute(
             "SELECT file_id, file_name, file_path FROM file_metadata WHERE post_id = %s",
             (post_id,),
         )
-        files = cursor.fetchall()
+        files = await cursor.fetchall()
 
         return {"post": post, "files": files}
-    finally:
-        cursor.close()
-        connection.close()
 
 
 # ✅ 4-1. 게시글 수정
@@ -333,127 +341,64 @@ async def update_post(
     user: dict = Depends(get_authenticated_user),
 ):
     """게시글 수정 + 기존 파일 삭제 후 새 파일 저장"""
-    connection = get_connection()
-    cursor = None
-
     try:
-        cursor = connection.cursor(dictionary=True)
-
-        # 1️. 게시글 내용 수정
-        update_query = """
-            UPDATE Posts
-            SET board_id = %s, post_title = %s, post_category = %s, post_text = %s, post_time = %s
-            WHERE post_id = %s
-        """
-        cursor.execute(
-            update_query,
-            (board_id, post_title, post_category, post_text, datetime.now(), post_id),
-        )
-        connection.commit()
-
-        # 2️. 기존 파일 삭제 (post_id에 속한 모든 파일 삭제)
-        cursor.execute(
-            "SELECT file_id, file_path FROM file_metadata WHERE post_id = %s",
-            (post_id,),
-        )
-        existing_files = cursor.fetchall()
-
-        for file in existing_files:
-            # 실제 파일 삭제
-            if os.path.exists(file["file_path"]):
-                os.remove(file["file_path"])
-
-            # DB에서 파일 메타데이터 삭제
-            cursor.execute(
-                "DELETE FROM file_metadata WHERE file_id = %s", (file["file_id"],)
-            )
-            connection.commit()
-
-        # 3. 파일 추가 (새 파일 업로드)
-        uploaded_files_data = []
-        if files:
-            MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-            allowed_extensions = ["png", "jpg", "jpeg", "gif"]
-
-            for file in files:
-                content = await file.read()
-                file_size = len(content)
-                if file_size > MAX_FILE_SIZE:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}의 최대 크기는 10MB입니다.",
-                    )
+        # 새 파일 검사를 먼저 끝내고 (실패하면 기존 게시글/파일 그대로)
+        uploads = await read_uploads(files)
+        written = []  # 이번 요청에서 쓴 파일 (트랜잭션 실패 시 삭제)
+        old_paths = []  # 커밋 후 삭제할 기존 파일
+
+        try:
+            async with async_cursor(commit=True) as cursor:
+                # 1️. 게시글 내용 수정
+                update_query = """
+                    UPDATE Posts
+                    SET board_id = %s, post_title = %s, post_category = %s, post_text = %s, post_time = %s
+                    WHERE post_id = %s
+                """
+                await cursor.execute(
+                    update_query,
+                    (board_id, post_title, post_category, post_text, datetime.now(), post_id),
+                )
 
-                if "." not in file.filename:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}에 확장자가 없습니다.",
-                    )
-                ext = file.filename.rsplit(".", 1)[-1].lower()
-                if ext not in allowed_extensions:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}: 허용되지 않은 확장자입니다.",
+                # 2️. 기존 파일 메타데이터 삭제 (실제 파일은 커밋 후에 삭제)
+                await cursor.execute(
+                    "SELECT file_id, file_path FROM file_metadata WHERE post_id = %s",
+                    (post_id,),
+                )
+                old_paths = [file["file_path"] for file in await cursor.fetchall()]
+                if old_paths:
+                    await cursor.execute(
+                        "DELETE FROM file_metadata WHERE post_id = %s", (post_id,)
                     )
 
-                file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-                with open(file_path, "wb") as f:
-                    f.write(content)
-
-                mime = magic.Magic(mime=True)
-                detected_mime = mime.from_file(file_path)
-                if not detected_mime.startswith("image/"):
-                    os.remove(file_path)
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"파일 {file.filename}: 허용되지 않은 파일 형식입니다.",
-                    )
+                # 3. 새 파일 저장
+                await save_uploads(cursor, post_id, uploads, user["sub"], written)
 
-                # DB에 새 파일 정보 저장
-                file_query = """
-                    INSERT INTO file_metadata (post_id, file_name, file_path, file_size, file_type, user_email, upload_time)
-                    VALUES (%s, %s, %s, %s, %s, %s, NOW())
-                """
-                cursor.execute(
-                    file_query,
-                    (
-                        post_id,
-                        file.filename,
-                        file_path,
-                        file_size,
-                        detected_mime,
-                        user["sub"],
-                    ),
-                )
-                connection.commit()
+                # 4. 수정된 게시글 데이터 조회
+                await cursor.execute("SELECT * FROM Posts WHERE post_id = %s", (post_id,))
+                updated_post = await cursor.fetchone()
 
-                uploaded_files_data.append(
-                    {
-                        "file_name": file.filename,
-                        "file_path": file_path,
-                        "file_size": file_size,
-                        "file_type": detected_mime,
-                    }
+                # 5️. 수정된 파일 목록 가져오기
+                await cursor.execute(
+                    """
+                    SELECT file_id, file_name, file_path, file_size, file_type, upload_time
+                    FROM file_metadata WHERE post_id = %s
+                """,
+                    (post_id,),
                 )
+                updated_files = await cursor.fetchall()
+        except BaseException:
+            # 롤백된 메타데이터가 가리키는 기존 파일(같은 경로)은 남겨둠
+            remove_files([path for path in written if path not in old_paths])
+            raise
 
-        # 4. 수정된 게시글 데이터 조회
-        cursor.execute("SELECT * FROM Posts WHERE post_id = %s", (post_id,))
-        updated_post = cursor.fetchone()
+        # 커밋된 뒤에만 기존 파일 삭제 (새 파일과 경로가 같으면 유지)
+        remove_files([path for path in old_paths if path not in written])
 
         # datetime 변환 (post_time)
         if updated_post and "post_time" in updated_post:
             updated_post["post_time"] = updated_post["post_time"].isoformat()
 
-        # 5️. 수정된 파일 목록 가져오기
-        cursor.execute(
-            """
-            SELECT file_id, file_name, file_path, file_size, file_type, upload_time
-            FROM file_metadata WHERE post_id = %s
-        """,
-            (post_id,),
-        )
-        updated_files = cursor.fetchall()
-
         # 파일의 datetime 변환 (upload_time)
         for file in updated_files:
             if "upload_time" in file:
@@ -482,11 +427,6 @@ async def update_post(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        if cursor:
-            cursor.close()
-            connection.close()
-
 
 # ✅ 5. 게시글 삭제
 @router.delete("/{post_id}")
@@ -571,31 +511,23 @@ async def add_comment(
     post_id: int, request: CommentRequest, user: dict = Depends(get_authenticated_user)
 ):
     """일반 댓글 작성"""
-    try:
-        connection = get_connection()
-        cursor = connection.cursor(dictionary=True)
-
+    async with async_cursor(commit=True) as cursor:
         # 댓글 삽입
         query = "INSERT INTO comments (post_id, user_email, comment, comment_date) VALUES (%s, %s, %s, NOW())"
-        cursor.execute(query, (post_id, user["sub"], request.comment))
-        connection.commit()
+        await cursor.execute(query, (post_id, user["sub"], request.comment))
 
         # 생성된 댓글 가져오기 - socket
-        cursor.execute(
-            "SELECT * FROM comments WHERE post_id = %s ORDER BY comment_date DESC LIMIT 1",
-            (post_id,),
+        await cursor.execute(
+            "SELECT * FROM comments WHERE comment_id = %s", (cursor.lastrowid,)
         )
-        new_comment = cursor.fetchone()
+        new_comment = await cursor.fetchone()
 
-        # datetime 변환 (comment_date)
-        if new_comment and "comment_date" in new_comment:
-            new_comment["comment_date"] = new_comment["comment_date"].isoformat()
-        await notify_new_comment(new_comment)
+    # datetime 변환 (comment_date)
+    if new_comment and "comment_date" in new_comment:
+        new_comment["comment_date"] = new_comment["comment_date"].isoformat()
+    await notify_new_comment(new_comment)
 
-        return {"message": "댓글이 등록되었습니다.", "comment": new_comment}
-    finally:
-        cursor.close()
-        connection.close()
+    return {"message": "댓글이 등록되었습니다.", "comment": new_comment}
 
 
 # ✅ 7-1. 댓글 삭제
@@ -604,39 +536,30 @@ async def delete_comment(
     post_id: int, comment_id: int, user: dict = Depends(get_authenticated_user)
 ):
     """댓글 삭제"""
-    try:
-        connection = get_connection()
-        cursor = connection.cursor()
-
+    async with async_cursor(commit=True) as cursor:
         # 댓글 존재 확인
-        cursor.execute(
+        await cursor.execute(
             "SELECT * FROM comments WHERE post_id = %s AND comment_id = %s",
             (post_id, comment_id),
         )
-        existing_comment = cursor.fetchone()
+        existing_comment = await cursor.fetchone()
         if not existing_comment:
             raise HTTPException(status_code=404, detail="댓글을 찾을 수 없습니다.")
 
         # 댓글 작성자 확인 (본인만 삭제 가능)
-        if existing_comment[2] != user["sub"] and not user.get(
-            "admin"
-        ):  # `user_email` 필드가 2번째 인덱스라고 가정
+        if existing_comment["user_email"] != user["sub"] and not user.get("admin"):
             raise HTTPException(
                 status_code=403, detail="본인 혹은 관리자만 댓글을 삭제할 수 있습니다."
             )
 
         # 댓글 삭제
         delete_query = "DELETE FROM comments WHERE comment_id = %s"
-        cursor.execute(delete_query, (comment_id,))
-        connection.commit()
+        await cursor.execute(delete_query, (comment_id,))
 
-        # WebSocket을 통해 삭제된 댓글 알림
-        await notify_deleted_comment({"post_id": post_id, "comment_id": comment_id})
+    # WebSocket을 통해 삭제된 댓글 알림
+    await notify_deleted_comment({"post_id": post_id, "comment_id": comment_id})
 
-        return {"message": "댓글이 삭제되었습니다."}
-    finally:
-        cursor.close()
-        connection.close()
+    return {"message": "댓글이 삭제되었습니다."}
 
 
 # ✅ 8. 관리자 답변 작성
@@ -645,31 +568,23 @@ async def add_answer(
     post_id: int, request: AnswerRequest, user: dict = Depends(get_authenticated_user)
 ):
     """관리자 답변"""
-    try:
-        connection = get_connection()
-        cursor = connection.cursor(dictionary=True)
-
+    async with async_cursor(commit=True) as cursor:
         # 답변 삽입
         query = "INSERT INTO answer (post_id, user_email, ans_text, ans_date) VALUES (%s, %s, %s, NOW())"
-        cursor.execute(query, (post_id, user["sub"], request.answer))
-        connection.commit()
+        await cursor.execute(query, (post_id, user["sub"], request.answer))
 
         # 생성된 답변 가져오기 -socket
-        cursor.execute(
-            "SELECT * FROM answer WHERE post_id = %s ORDER BY ans_date DESC LIMIT 1",
-            (post_id,),
+        await cursor.execute(
+            "SELECT * FROM answer WHERE ans_id = %s", (cursor.lastrowid,)
         )
-        new_answer = cursor.fetchone()
+        new_answer = await cursor.fetchone()
 
-        # datetime 변환 (ans_date)
-        if new_answer and "ans_date" in new_answer:
-            new_answer["ans_date"] = new_answer["ans_date"].isoformat()
-        await notify_new_answer(new_answer)
+    # datetime 변환 (ans_date)
+    if new_answer and "ans_date" in new_answer:
+        new_answer["ans_date"] = new_answer["ans_date"].isoformat()
+    await notify_new_answer(new_answer)
 
-        return {"message": "관리자 답변이 등록되었습니다.", "answer": new_answer}
-    finally:
-        cursor.close()
-        connection.close()
+    return {"message": "관리자 답변이 등록되었습니다.", "answer": new_answer}
 
 
 # ✅ 8-1. 관리자 답변 삭제
@@ -683,43 +598,33 @@ async def delete_answer(
             status_code=403, detail="관리자만 답변을 삭제할 수 있습니다."
         )
 
-    try:
-        connection = get_connection()
-        cursor = connection.cursor()
-
+    async with async_cursor(commit=True) as cursor:
         # 답변 존재 여부 확인
-        cursor.execute(
+        await cursor.execute(
             "SELECT * FROM answer WHERE post_id = %s AND ans_id = %s",
             (post_id, answer_id),
         )
-        existing_answer = cursor.fetchone()
+        existing_answer = await cursor.fetchone()
         if not existing_answer:
             raise HTTPException(status_code=404, detail="답변을 찾을 수 없습니다.")
 
         # 답변 삭제
         delete_query = "DELETE FROM answer WHERE ans_id = %s"
-        cursor.execute(delete_query, (answer_id,))
-        connection.commit()
+        await cursor.execute(delete_query, (answer_id,))
 
-        # WebSocket을 통해 삭제된 답변 알림
-        await notify_deleted_answer({"post_id": post_id, "answer_id": answer_id})
+    # WebSocket을 통해 삭제된 답변 알림
+    await notify_deleted_answer({"post_id": post_id, "answer_id": answer_id})
 
-        return {"message": "답변이 삭제되었습니다."}
-    finally:
-        cursor.close()
-        connection.close()
+    return {"message": "답변이 삭제되었습니다."}
 
 
 # ✅ 9. 댓글&답변 가져오기
 @router.get("/{post_id}/comments-answers")
 async def get_comments_and_answers(post_id: int):
     """게시글의 댓글 및 관리자 답변 조회"""
-    try:
-        connection = get_connection()
-        cursor = connection.cursor()
-
+    async with async_cursor() as cursor:
         # 해당 게시글의 댓글 가져오기
-        cursor.execute(
+        await cursor.execute(
             """
             SELECT c.comment_id, u.user_email, u.user_name, u.user_dept, u.jurisdiction, c.comment, c.comment_date
             FROM comments c
@@ -729,10 +634,10 @@ async def get_comments_and_answers(post_id: int):
         """,
             (post_id,),
         )
-        comments = cursor.fetchall()
+        comments = await cursor.fetchall()
 
         # 해당 게시글의 관리자 답변 가져오기
-        cursor.execute(
+        await cursor.execute(
             """
             SELECT ans_id, ans_text, ans_date
             FROM answer
@@ -741,34 +646,34 @@ async def get_comments_and_answers(post_id: int):
         """,
             (post_id,),
         )
-        answers = cursor.fetchall()
-
-        # JSON 형식으로 변환
-        comments_list = [
-            {
-                "comment_id": c[0],
-                "user_email": c[1],
-                "user_name": c[2],  # 사용자 이름
-                "user_dept": c[3],  # 부서 정보
-                "jurisdiction": c[4],  # 관할권 정보
-                "comment": c[5],
-                "comment_date": c[6].isoformat(),
-            }
-            for c in comments
-        ]
-        answers_list = [
-            {"answer_id": a[0], "answer_text": a[1], "answer_date": a[2].isoformat()}
-            for a in answers
-        ]
-        return {
-            "post_id": post_id,
-            "comments": comments_list,
-            "admin_answers": answers_list,
+        answers = await cursor.fetchall()
+
+    # JSON 형식으로 변환
+    comments_list = [
+        {
+            "comment_id": c["comment_id"],
+            "user_email": c["user_email"],
+            "user_name": c["user_name"],  # 사용자 이름
+            "user_dept": c["user_dept"],  # 부서 정보
+            "jurisdiction": c["jurisdiction"],  # 관할권 정보
+            "comment": c["comment"],
+            "comment_date": c["comment_date"].isoformat(),
         }
-
-    finally:
-        cursor.close()
-        connection.close()
+        for c in comments
+    ]
+    answers_list = [
+        {
+            "answer_id": a["ans_id"],
+            "answer_text": a["ans_text"],
+            "answer_date": a["ans_date"].isoformat(),
+        }
+        for a in answers
+    ]
+    return {
+        "post_id": post_id,
+        "comments": comments_list,
+        "admin_answers": answers_list,
+    }
 
 
 # ✅ 게시글의 파일 목록 가져오기
@@ -1,23 +1,38 @@
 # dev.py
-import redis
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, EmailStr
 from datetime import date
-from app.database.mysql_connect import get_connection
+from app.database.mysql_connect import get_connection, get_pool
+from app.core.email_utils import email_outbox
+from app.core.rate_limit import rate_limit_stats
+from app.core.security import password_pool
+from app.core.token_blacklist import blacklist_stats
+from app.core.token_cache import token_cache
+from app.services.log_writer import log_writer_stats
+from app.services.rollups import rollup_status, today_error_counts
+from app.services.road_export import export_cache_stats
+from app.services.road_features import feature_store
+from app.services.road_scores import road_scores, SCORE_CHECK_SAMPLE
+from app.services.recommendation_cache import recommend_cache_stats
+from app.services.inference_executor import inference_executor
+from app.services import presence
+from app.services.user_cache import invalidate_user, user_cache_stats
+from app.services.presence import PRESENCE_WINDOW_MINUTES
+from app.services.visitor_counter import (
+  count_day,
+  count_range,
+  monthly_series,
+  exact_count_range,
+  backfill_from_logs,
+  VISITOR_BACKFILL_DAYS,
+)
 from mysql.connector import Error
 from datetime import datetime, timedelta
 from collections import defaultdict
+from dateutil.relativedelta import relativedelta
 
 router = APIRouter()
 
-# Redis 연결
-try:
-  redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
-except Exception as e:
-  print(f"Redis connection failed: {e}")
-  redis_client = None
-
-
 class UserInfoResponse(BaseModel):
   Permission: str
   Department: str | None
@@ -58,22 +73,29 @@ def get_user_info_list():
   finally:
     if 'cursor' in locals() and cursor:
       cursor.close()
-    if 'connection' in locals() and connection.is_connected():
+    if 'connection' in locals():
       connection.close()
 
 
 @router.get("/status/real-time")
-def get_online_users():
-  count = redis_client.scard("online_users")
-  return {"count": count}
+def get_online_users(minutes: int = PRESENCE_WINDOW_MINUTES):
+  """최근 N분 안에 활동한 접속자 수"""
+  try:
+    count = presence.active_count(minutes)
+  except Exception as e:
+    print(f"Redis error: {e}")
+    raise HTTPException(status_code=500, detail="Redis 연결 오류")
+  return {"count": count, "minutes": minutes}
 
 
 @router.get("/status/real-time/users")
-def get_online_user_list():
-  if redis_client is None:
+def get_online_user_list(minutes: int = PRESENCE_WINDOW_MINUTES):
+  try:
+    emails = presence.active_users(minutes)
+  except Exception as e:
+    print(f"Redis error: {e}")
     raise HTTPException(status_code=500, detail="Redis 연결 오류")
 
-  emails = [e.decode() for e in redis_client.smembers("online_users")]
   if not emails:  # 접속 중인 유저가 없으면 빈 리스트
     return []
 
@@ -95,32 +117,172 @@ def get_online_user_list():
 
   finally:
     if 'cursor' in locals(): cursor.close()
-    if 'connection' in locals() and connection.is_connected(): connection.close()
+    if 'connection' in locals(): connection.close()
 
 
-@router.get("/status/today-visitors")
-def get_today_visitors():
+@router.get("/status/last-seen/{email}")
+def get_last_seen(email: EmailStr):
+  """유저의 마지막 활동 시각 (보관 기간이 지났거나 로그아웃했으면 null)"""
   try:
-    connection = get_connection()
-    cursor = connection.cursor(dictionary=True)
+    seen = presence.last_seen(email)
+  except Exception as e:
+    print(f"Redis error: {e}")
+    raise HTTPException(status_code=500, detail="Redis 연결 오류")
+  return {"email": email, "last_seen": seen.isoformat() if seen else None}
 
-    query = """
-            SELECT COUNT(DISTINCT ip_address) AS count
-            FROM visit_logs
-            WHERE DATE (visit_time) = CURDATE() \
-            """
 
-    cursor.execute(query)
-    result = cursor.fetchone()
-    return {"count": result["count"]}
+@router.get("/status/db-pool")
+def get_db_pool_stats():
+  """DB 커넥션 풀 상태 (사용 중 / 대기 / 체크아웃 지연)"""
+  return get_pool().stats()
+
+
+@router.get("/status/log-writer")
+def get_log_writer_stats():
+  """방문/에러 로그 일괄 기록 큐 상태 (적재 / 기록 / 유실)"""
+  return log_writer_stats()
+
+
+@router.get("/status/token-cache")
+def get_token_cache_stats():
+  """검증된 JWT 캐시 상태 (적중률 / 만료 / 제거)"""
+  return token_cache.stats()
+
 
+@router.get("/status/token-blacklist")
+def get_token_blacklist_stats():
+  """폐기 토큰 filter 상태 (로컬에서 끝난 확인 / Redis 확인 / 오탐)"""
+  return blacklist_stats()
+
+
+@router.get("/status/password-pool")
+def get_password_pool_stats():
+  """비밀번호 해싱 전용 풀 상태 (실행 / 대기 / 거절)"""
+  return password_pool.stats()
+
+
+@router.get("/status/user-cache")
+def get_user_cache_stats():
+  """사용자 프로필 캐시 상태 (로컬 / Redis 적중, DB 조회, 무효화)"""
+  return user_cache_stats()
+
+
+@router.get("/status/rate-limits")
+def get_rate_limit_stats():
+  """속도 제한 설정과 허용 / 거절 / 로컬 대체 횟수"""
+  return rate_limit_stats()
+
+
+@router.get("/status/email-outbox")
+def get_email_outbox_stats():
+  """이메일 발송 큐 상태 (대기 / 재시도 / 발송 / 실패)"""
+  return email_outbox.stats()
+
+
+@router.get("/status/email/{message_id}")
+def get_email_status(message_id: str):
+  """메시지별 발송 상태 (Redis, 어느 워커에서 보낸 메일이든 조회)"""
+  status = email_outbox.status(message_id)
+  if status is None:
+    raise HTTPException(status_code=404, detail="발송 기록이 없습니다.")
+  return status
+
+
+@router.get("/status/export-cache")
+def get_export_cache_stats():
+  """추천 결과 파일 캐시 상태 (적중 / 생성 / 메모리 사용량)"""
+  return export_cache_stats()
+
+
+@router.get("/status/feature-store")
+def get_feature_store_stats():
+  """도로 특성 저장소 상태 (버전 / 도로 수 / 메모리 사용량)"""
+  return feature_store.stats()
+
+
+@router.post("/feature-store/reload")
+def reload_feature_store():
+  """seoul_info 변경 후 수동 재적재"""
+  try:
+    feature_store.reload()
+  except Exception as e:
+    raise HTTPException(status_code=500, detail=f"도로 데이터 적재 실패: {e}")
+  return feature_store.stats()
+
+
+@router.get("/status/road-scores")
+def get_road_score_stats():
+  """미리 계산된 도로별 모델 점수 상태"""
+  return road_scores.stats()
+
+
+@router.post("/road-scores/check")
+def check_road_scores(sample: int = Query(SCORE_CHECK_SAMPLE, ge=1, le=10000)):
+  """저장된 모델 점수와 실시간 추론 결과 비교 (표본)"""
+  return road_scores.check_consistency(sample)
+
+
+@router.get("/status/recommend-cache")
+def get_recommend_cache_stats():
+  """도로 추천 결과 캐시 (hit / miss / eviction)"""
+  return recommend_cache_stats()
+
+
+@router.get("/status/inference")
+def get_inference_stats():
+  """추천 계산 풀 상태 + 단계별(fetch / infer / rank / persist) 소요 시간"""
+  return inference_executor.stats()
+
+
+@router.get("/status/rollups")
+def get_rollup_status():
+  """대시보드 집계 테이블 마지막 갱신 상태"""
+  return rollup_status()
+
+
+@router.get("/status/today-visitors")
+def get_today_visitors(exact: bool = False):
+  """오늘 순방문자 수 - 기본은 HyperLogLog 추정치, exact=true면 visit_logs 직접 집계 (감사용)"""
+  today = date.today()
+  if not exact:
+    try:
+      return {"count": count_day(today)}
+    except Exception as e:
+      print(f"[HyperLogLog 조회 실패] {e}")
+
+  try:
+    return {"count": exact_count_range(today, today)}
   except Exception as e:
     raise HTTPException(status_code=500, detail="오늘 방문자 수 조회 실패")
-  finally:
-    if 'cursor' in locals() and cursor:
-      cursor.close()
-    if 'connection' in locals() and connection.is_connected():
-      connection.close()
+
+
+@router.post("/visitors/backfill")
+def backfill_visitors(days: int = Query(VISITOR_BACKFILL_DAYS, ge=1, le=400)):
+  """visit_logs로 순방문자 HyperLogLog 키 채우기 (배포 직후 시작 시 자동 1회)"""
+  try:
+    return backfill_from_logs(days)
+  except Exception as e:
+    raise HTTPException(status_code=500, detail=f"방문자 백필 실패: {e}")
+
+
+@router.get("/status/visitors")
+def get_visitors_in_range(start: date, end: date, exact: bool = False):
+  """기간 순방문자 수 (start ~ end 포함) - exact=true면 visit_logs 직접 집계"""
+  if start > end:
+    raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다.")
+  if (end - start).days > 366:
+    raise HTTPException(status_code=400, detail="조회 기간은 1년 이내여야 합니다.")
+
+  if not exact:
+    try:
+      return {"start": start, "end": end, "count": count_range(start, end)}
+    except Exception as e:
+      print(f"[HyperLogLog 조회 실패] {e}")
+
+  try:
+    return {"start": start, "end": end, "count": exact_count_range(start, end)}
+  except Exception as e:
+    raise HTTPException(status_code=500, detail="기간 방문자 수 조회 실패")
 
 
 @router.get("/status/error-routes")
@@ -129,21 +291,14 @@ def get_error_routes():
     connection = get_connection()
     cursor = connection.cursor(dictionary=True)
 
-    query = """
-            SELECT route, COUNT(*) AS count
-            FROM error_logs
-            WHERE DATE (created_at) = CURDATE()
-            GROUP BY route
-            ORDER BY count DESC \
-            """
-    cursor.execute(query)
-    return cursor.fetchall()
+    # 집계 테이블 + 마지막 집계 이후 로그
+    return today_error_counts(cursor, "route")
   except Exception as e:
     raise HTTPException(status_code=500, detail="에러 경로 통계 실패")
   finally:
     if 'cursor' in locals() and cursor:
       cursor.close()
-    if 'connection' in locals() and connection.is_connected():
+    if 'connection' in locals():
       connection.close()
 
 
@@ -153,20 +308,14 @@ def get_error_types():
     connection = get_connection()
     cursor = connection.cursor(dictionary=True)
 
-    query = """
-            SELECT status_code, COUNT(*) AS count
-            FROM error_logs
-            WHERE DATE (created_at) = CURDATE()
-            GROUP BY status_code \
-            """
-    cursor.execute(query)
-    return cursor.fetchall()
+    # 집계 테이블 + 마지막 집계 이후 로그
+    return today_error_counts(cursor, "status_code")
   except Exception as e:
     raise HTTPException(status_code=500, detail="에러 유형 통계 실패")
   finally:
     if 'cursor' in locals() and cursor:
       cursor.close()
-    if 'connection' in locals() and connection.is_connected():
+    if 'connection' in locals():
       connection.close()
 
 
@@ -189,7 +338,7 @@ def get_today_event_count():
   finally:
     if 'cursor' in locals() and cursor:
       cursor.close()
-    if 'connection' in locals() and connection.is_connected():
+    if 'connection' in locals():
       connection.close()
 
 
@@ -215,7 +364,7 @@ def get_new_member_count():
   finally:
     if 'cursor' in locals() and cursor:
       cursor.close()
-    if 'connection' in locals() and connection.is_connected():
+    if 'connection' in locals():
       connection.close()
 
 
@@ -226,9 +375,9 @@ def new_members_monthly():
     cursor = connection.cursor(dictionary=True)
 
     query = """
-            SELECT DATE_FORMAT(CreatDt, '%Y-%m') AS month, COUNT(*) AS count
-            FROM user_data
-            WHERE CreatDt >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
+            SELECT DATE_FORMAT(day, '%Y-%m') AS month, CAST(SUM(count) AS UNSIGNED) AS count
+            FROM signup_daily_rollup
+            WHERE day >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
             GROUP BY month
             ORDER BY month \
             """
@@ -243,16 +392,23 @@ def new_members_monthly():
 
 
 @router.get("/charts/visitors-by-month")
-def visitors_by_month():
+def visitors_by_month(exact: bool = False):
+  """월별 순방문자 수 (이번 달 포함 최근 6개월) - exact=true면 집계 테이블(정확한 값) 사용"""
+  if not exact:
+    try:
+      today = date.today()
+      return monthly_series(today - relativedelta(months=5), today)
+    except Exception as e:
+      print(f"[HyperLogLog 조회 실패] {e}")
+
   try:
     connection = get_connection()
     cursor = connection.cursor(dictionary=True)
 
     query = """
-            SELECT DATE_FORMAT(visit_time, '%Y-%m') AS month, COUNT(DISTINCT ip_address) AS count
-            FROM visit_logs
-            WHERE visit_time >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
-            GROUP BY month
+            SELECT month, unique_visitors AS count
+            FROM visit_monthly_rollup
+            WHERE month >= DATE_FORMAT(DATE_SUB(CURDATE(), INTERVAL 5 MONTH), '%Y-%m')
             ORDER BY month \
             """
     cursor.execute(query)
@@ -271,9 +427,9 @@ def error_routes():
     cursor = connection.cursor(dictionary=True)
 
     query = """
-            SELECT route, COUNT(*) AS count
-            FROM error_logs
-            WHERE created_at >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
+            SELECT route, CAST(SUM(count) AS UNSIGNED) AS count
+            FROM error_daily_rollup
+            WHERE day >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
             GROUP BY route
             ORDER BY count DESC \
             """
@@ -293,9 +449,9 @@ def error_types():
     cursor = connection.cursor(dictionary=True)
 
     query = """
-            SELECT status_code, COUNT(*) AS count
-            FROM error_logs
-            WHERE created_at >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
+            SELECT status_code, CAST(SUM(count) AS UNSIGNED) AS count
+            FROM error_daily_rollup
+            WHERE day >= DATE_SUB(CURDATE(), INTERVAL 6 MONTH)
             GROUP BY status_code \
             """
     cursor.execute(query)
@@ -346,6 +502,7 @@ def change_user_permission(email: EmailStr, body: PermPatch):
     cur.execute("REPLACE INTO permissions (user_email,is_admin) VALUES (%s,%s)",
                 (email, perm_int))
     conn.commit()
+    invalidate_user(email)
     return {"ok": True}
 
   except Exception as e:
@@ -365,6 +522,7 @@ def delete_user(email: EmailStr):
     cur.execute("DELETE FROM permissions WHERE user_email=%s", (email,))
     cur.execute("DELETE FROM user_data WHERE user_email=%s", (email,))
     conn.commit()
+    invalidate_user(email)
     return {"ok": True}
   except:
     raise HTTPException(500, "회원 삭제 실패")
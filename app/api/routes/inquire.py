@@ -36,9 +36,8 @@ def get_user_inquiries(user_email: str):
         inquiries = cursor.fetchall()
         return inquiries
     finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+        cursor.close()
+        connection.close()
 
 
 @router.post("/inquires", response_model=dict)
@@ -55,9 +54,8 @@ def submit_inquiry(request: InquiryRequest, token: str = Depends(verify_token)):
         cursor.execute(query, (user_email, request.subject, request.content, datetime.now()))
         connection.commit()
     finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+        cursor.close()
+        connection.close()
 
     return {"message": "문의가 성공적으로 등록되었습니다."}
 
@@ -91,7 +89,6 @@ def get_inquiry(inquiry_id: int, token: str = Depends(verify_token)):
 
         return inquiry
     finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+        cursor.close()
+        connection.close()
 
@@ -5,24 +5,10 @@ import traceback
 import mysql
 from typing import Dict
 from app.core.security import verify_password, hash_password
-from app.core.jwt_utils import verify_token
-from app.core.token_blacklist import is_token_blacklisted, add_token_to_blacklist
+from app.core.jwt_utils import get_authenticated_user
+from app.core.token_blacklist import add_token_to_blacklist
 from app.database.mysql_connect import get_connection
-
-
-# 관리자 확인
-def is_admin(email: str):
-    try:
-        connection = get_connection()
-        cursor = connection.cursor(dictionary=True)
-        query = "SELECT is_admin FROM permissions WHERE user_email = %s"
-        cursor.execute(query, (email,))
-        result = cursor.fetchone()
-        return result and result["is_admin"]
-    finally:
-        if connection.is_connected():
-            cursor.close()
-            connection.close()
+from app.services.user_cache import get_admin_level, invalidate_user
 
 
 def execute_query(query: str, params: tuple = ()):
@@ -54,14 +40,10 @@ router = APIRouter()
 
 
 @router.get("/mypage_load")
-def mypage_load(token: str = Header(...)):
+def mypage_load(user: dict = Depends(get_authenticated_user)):
     """마이페이지 정보 노출"""
     try:
-        # Check if token is valid and extract email
-        if is_token_blacklisted(token):
-            raise HTTPException(status_code=401, detail="토큰이 만료되었습니다.")
-
-        user_email = verify_token(token).get("sub")
+        user_email = user.get("sub")
 
         # Fetch user details
         query = "SELECT user_email, user_name, user_dept, jurisdiction FROM user_data WHERE user_email = %s"
@@ -80,13 +62,10 @@ def mypage_load(token: str = Header(...)):
 
 
 @router.get("/check_password")
-def check_password(password: str, token: str = Header(...)):
+def check_password(password: str, user: dict = Depends(get_authenticated_user)):
     """비밀번호 확인"""
     try:
-        if is_token_blacklisted(token):
-            raise HTTPException(status_code=401, detail="토큰이 만료되었습니다.")
-
-        user_email = verify_token(token).get("sub")
+        user_email = user.get("sub")
 
         # Get the stored hashed password
         query_user = "SELECT user_ps FROM user_data WHERE user_email = %s"
@@ -97,7 +76,7 @@ def check_password(password: str, token: str = Header(...)):
 
         db_hashed_ps = user_record[0]["user_ps"]
 
-        admin_value = is_admin(user_email)
+        admin_value = get_admin_level(user_email)
 
         if admin_value == 2:
             # 개발자 계정은 평문 비교
@@ -109,6 +88,8 @@ def check_password(password: str, token: str = Header(...)):
                 raise HTTPException(status_code=400, detail="비밀번호가 다릅니다.")
 
         return {"message": "비밀번호가 확인되었습니다."}
+    except HTTPException:
+        raise
     except Exception:
         traceback.print_exc()
         raise HTTPException(
@@ -119,13 +100,12 @@ def check_password(password: str, token: str = Header(...)):
 
 # 사용자 정보 수정
 @router.put("/update_user")
-def update_user(update_data: Dict[str, str], token: str = Header(...)):
+def update_user(
+    update_data: Dict[str, str], user: dict = Depends(get_authenticated_user)
+):
     """user_ps, user_dept, jurisdiction만 가능"""
     try:
-        if is_token_blacklisted(token):
-            raise HTTPException(status_code=401, detail="토큰이 만료되었습니다.")
-
-        user_email = verify_token(token).get("sub")
+        user_email = user.get("sub")
 
         allowed_columns = {"user_ps", "user_dept", "jurisdiction"}
 
@@ -152,6 +132,7 @@ def update_user(update_data: Dict[str, str], token: str = Header(...)):
 
         # Execute update query
         execute_query(query, tuple(values))
+        invalidate_user(user_email)
 
         return {
             "message": "성공적으로 업데이트되었습니다.",
@@ -169,13 +150,11 @@ def update_user(update_data: Dict[str, str], token: str = Header(...)):
 
 # 회원탈퇴
 @router.delete("/delete_user")
-def delete_user(token: str = Header()):
+def delete_user(
+    token: str = Header(), payload: dict = Depends(get_authenticated_user)
+):
     """회원 탈퇴 (연관된 모든 데이터 삭제 후 user_data 삭제)"""
     try:
-        payload = verify_token(token)
-        if not payload:
-            raise HTTPException(status_code=401, detail="만료된 토큰입니다.")
-
         user_email = payload.get("sub")
         if not user_email:
             raise HTTPException(status_code=400, detail="Invalid token payload.")
@@ -198,6 +177,7 @@ def delete_user(token: str = Header()):
 
         # 4️. user_data 삭제
         execute_query("DELETE FROM user_data WHERE user_email = %s", (user_email,))
+        invalidate_user(user_email)
 
         # 5️. 토큰을 블랙리스트에 추가
         expiration_time = payload.get("exp")
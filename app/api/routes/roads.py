@@ -1,33 +1,39 @@
 # 열선 도로 추천
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Extra
-import redis
+from fastapi import APIRouter, HTTPException, Depends, Response
+from pydantic import BaseModel, Extra, Field
+from typing import List, Optional
+import os
 import json
-import pandas as pd
 from app.core.jwt_utils import get_authenticated_user
+from app.core.rate_limit import rate_limit
 from app.database.mysql_connect import get_connection
-from app.models.model import load_model, predict
-from app.api.socket import run_model_with_progress
+from app.database.async_mysql import async_cursor
+from app.services.road_features import feature_store
+from app.services.road_ranking import rank_region, rank_batch, rank_citywide
+from app.services.road_scores import road_scores
+from app.services.model_registry import model_registry
+from app.services.inference_executor import inference_executor, INFERENCE_RETRY_AFTER
+from app.services.recommendation_cache import (
+    quantize_weights,
+    cache_key as recommendation_cache_key,
+    get_cached_async,
+    set_cached_async,
+)
+from app.api.socket import ProgressReporter
 import asyncio
 import time  # ⬅ 추가
 from datetime import datetime
 
 router = APIRouter()
 
-try:
-  redis_client = redis.StrictRedis(
-      host="ongil_redis", port=6379, db=0, decode_responses=True
-  )
-except Exception as e:
-  print(f"Redis connection failed: {e}")
-  redis_client = None
 
-# 모델 & 스케일러 로드
-model, scaler = load_model()
+# 한 번의 batch 요청에서 허용하는 지역 / 가중치 프로필 수
+BATCH_MAX_REGIONS = int(os.getenv("RECOMMEND_BATCH_MAX_REGIONS", "20"))
+BATCH_MAX_PROFILES = int(os.getenv("RECOMMEND_BATCH_MAX_PROFILES", "5"))
+CITYWIDE_MAX_K = int(os.getenv("RECOMMEND_CITYWIDE_MAX_K", "500"))
 
 
-class UserWeight(BaseModel):
-  region: str
+class WeightProfile(BaseModel):
   rd_slope_weight: float = 2.5
   acc_occ_weight: float = 3.0
   acc_sc_weight: float = 1.5
@@ -37,6 +43,22 @@ class UserWeight(BaseModel):
   class Config:
     extra = Extra.ignore
 
+
+class UserWeight(WeightProfile):
+  region: str
+
+
+class BatchRecommendRequest(BaseModel):
+  regions: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_REGIONS)
+  profiles: List[WeightProfile] = Field(
+      ..., min_length=1, max_length=BATCH_MAX_PROFILES
+  )
+
+
+class CitywideRequest(WeightProfile):
+  top_k: int = Field(50, ge=1, le=CITYWIDE_MAX_K)
+  regions: Optional[List[str]] = None  # 없으면 서울 전체
+
   # ✅ 지역 지정 (sigungu 제거)
 
 
@@ -45,152 +67,310 @@ def get_district(
     district: str, user: dict = Depends(get_authenticated_user)
 ):
   """seoul_info에 해당 읍/면/동/가(rds_rg)가 있는지 확인"""
-  try:
-    connection = get_connection()
-    cursor = connection.cursor(dictionary=True)
+  if not feature_store.has_region(district):
+    raise HTTPException(
+        status_code=404, detail=f"'{district}' 지역의 도로 정보가 없습니다."
+    )
 
-    query = "SELECT 1 FROM seoul_info WHERE rds_rg = %s LIMIT 1"
-    cursor.execute(query, (district,))
-    result = cursor.fetchone()
+  return {"message": f"'{district}' 지역이 선택되었습니다."}
 
-    if not result:
-      raise HTTPException(
-          status_code=404, detail=f"'{district}' 지역의 도로 정보가 없습니다."
-      )
 
-    return {"message": f"'{district}' 지역이 선택되었습니다."}
-  finally:
-    cursor.close()
-    connection.close()
+async def _prepare():
+  """도로 데이터 / 모델이 아직 적재 전이면 (시작 직후) 스레드에서 적재 후 현재 모델 반환"""
+  if not feature_store.loaded:
+    await asyncio.to_thread(feature_store.ensure_loaded)
+  if not model_registry.loaded:
+    await asyncio.to_thread(model_registry.ensure_loaded)
+  return model_registry.active()
+
+
+async def _model_scores(region, active, timings: dict = None):
+  """
+  미리 계산된 지역 모델 점수
+  재계산 전이면 요청 시작 시점의 모델로 추론 (이벤트 루프 밖 추론 풀에서)
+  """
+  if road_scores.model_version == active.version:
+    scores = road_scores.region_scores(region)
+    if scores is not None:
+      return scores
+  return await inference_executor.predict(active, region.matrix, timings=timings)
 
 
 # ✅ 열선 도로 추천 (sigungu 제거, traff 추가)
-@router.post("/recommend")
+@router.post("/recommend", dependencies=[Depends(rate_limit("recommend"))])
 async def road_recommendations(
-    input_data: UserWeight, user: dict = Depends(get_authenticated_user)
+    input_data: UserWeight,
+    response: Response,
+    user: dict = Depends(get_authenticated_user),
 ):
   start_ts = time.perf_counter()  # ★ 예측 시작 시각(ms 측정용)
-  try:
-    connection = get_connection()
-    cursor = connection.cursor(dictionary=True)
-
-    asyncio.create_task(run_model_with_progress(user["sub"]))
-
-    # ✅ 1. 쿼리 수정 (sig_cd 제거, traff 추가가)
-    query = """
-            SELECT rds_id,
-                   road_name,
-                   rbp,
-                   rep,
-                   rd_slope,
-                   acc_occ,
-                   acc_sc,
-                   rd_fr,
-                   traff
-            FROM seoul_info
-            WHERE rds_rg = %s \
-            """
-    cursor.execute(query, (input_data.region,))
-    roads = cursor.fetchall()
-
-    if not roads:
-      raise HTTPException(
-          status_code=404,
-          detail=f"'{input_data.region}'에 해당하는 도로 데이터가 없습니다.",
-      )
-
-    # ✅ 2~8. 이하 동일
-    df = pd.DataFrame(roads)
-    feature_array = df[
-      ["rd_slope", "acc_occ", "acc_sc", "rd_fr", "traff"]].values
-    df["예측점수"] = predict(model, scaler, feature_array)
-
-    # 가중치 정규화 (추가)
-    w = {
-      "rd_slope": input_data.rd_slope_weight,
-      "acc_occ": input_data.acc_occ_weight,
-      "acc_sc": input_data.acc_sc_weight,
-      "rd_fr": input_data.rd_fr_weight,
-      "traff": input_data.traff_weight,
-    }
-    total = sum(w.values())
-    if total > 0:
-      w = {k: v / total for k, v in w.items()}
-    else:
-      w = {k: 1 / len(w) for k in w}
-
-    # pred_idx 계산 (수정)
-    df["pred_idx"] = (
-        df["예측점수"] * 0.3
-        + df["rd_slope"] * w["rd_slope"]
-        + df["acc_occ"] * w["acc_occ"]
-        + df["acc_sc"] * w["acc_sc"]
-        + df["rd_fr"] * w["rd_fr"]
-        + df["traff"] * w["traff"]
+  timings = {}  # 단계별 소요 시간(ms)
+  progress = ProgressReporter(user["sub"])
+
+  # ✅ 1. 지역 도로 데이터 (메모리 저장소의 slice - DB 조회 없음)
+  await progress.stage("fetch")
+  active = await _prepare()
+  region = feature_store.region(input_data.region)
+
+  if region is None:
+    raise HTTPException(
+        status_code=404,
+        detail=f"'{input_data.region}'에 해당하는 도로 데이터가 없습니다.",
     )
 
-    min_score, max_score = df["pred_idx"].min(), df["pred_idx"].max()
-    if max_score - min_score > 0:
-      df["pred_idx"] = (
-                           (df["pred_idx"] - min_score) / (
-                           max_score - min_score)
-                       ) * 100
-    else:
-      df["pred_idx"] = 50
-
-    recommended_roads = (
-      df.sort_values("pred_idx", ascending=False)
-      .head(10)
-      .to_dict(orient="records")
+  # ✅ 2. 같은 지역 + 비슷한 가중치(양자화) 결과가 캐시에 있으면 그대로 사용
+  weights = quantize_weights(input_data)
+  cache_key = recommendation_cache_key(
+      input_data.region, region.snapshot.version, active.version, weights
+  )
+  recommended_roads = await get_cached_async(cache_key)
+  timings["fetch"] = (time.perf_counter() - start_ts) * 1000
+  inference_executor.record("fetch", timings["fetch"])
+
+  if recommended_roads is None:
+    # ✅ 3. 모델 점수는 미리 계산된 값 사용 (재계산 전이면 직접 추론)
+    await progress.stage("infer")
+    scores = await _model_scores(region, active, timings)
+
+    # ✅ 4. 가중치 점수 계산 + 상위 10개 선택 (선택된 행만 dict로 변환)
+    await progress.stage("rank")
+    recommended_roads = await inference_executor.run(
+        "rank", rank_region, region, scores, weights, timings=timings
     )
-
-    response_data = {
-      "rds_rg": input_data.region,
-      "recommended_roads": recommended_roads,
-    }
-    recommended_roads_json = json.dumps(response_data, ensure_ascii=False)
-    redis_key = f"recommendations:{user['sub']}:{input_data.region}"
-    redis_client.setex(redis_key, 900, recommended_roads_json)
-    latency_ms = int((time.perf_counter() - start_ts) * 1000)
-
+    await set_cached_async(cache_key, recommended_roads)
+
+  response_data = {
+    "rds_rg": input_data.region,
+    "recommended_roads": recommended_roads,
+  }
+  recommended_roads_json = json.dumps(response_data, ensure_ascii=False)
+  latency_ms = int((time.perf_counter() - start_ts) * 1000)
+
+  await progress.stage("persist")
+  persist_ts = time.perf_counter()
+  async with async_cursor(commit=True) as cursor:
     log_query = (
       "INSERT INTO rec_road_log (user_email, recommended_roads) VALUES (%s, %s)"
     )
-    cursor.execute(log_query, (user["sub"], recommended_roads_json))
-    connection.commit()
+    await cursor.execute(log_query, (user["sub"], recommended_roads_json))
     pred_log = """
                INSERT INTO predicts_log
                (user_email, region,
                 rd_slope_weight, acc_occ_weight, acc_sc_weight, rd_fr_weight,
                 traff_weight,
-                predict_date, latency_ms)
-               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) \
+                predict_date, latency_ms, model_version)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s) \
                """
-    cursor.execute(
+    await cursor.execute(
         pred_log,
         (
           user["sub"], input_data.region,
           input_data.rd_slope_weight, input_data.acc_occ_weight,
           input_data.acc_sc_weight, input_data.rd_fr_weight,
           input_data.traff_weight,
-          datetime.now(), latency_ms,
+          datetime.now(), latency_ms, active.version,
         ),
     )
-    connection.commit()
+  timings["persist"] = (time.perf_counter() - persist_ts) * 1000
+  inference_executor.record("persist", timings["persist"])
+  # 단계별 소요 시간 (브라우저 개발자 도구 Timing 탭에서 확인)
+  response.headers["Server-Timing"] = ", ".join(
+      f"{stage};dur={ms:.1f}" for stage, ms in timings.items()
+  )
+  await progress.stage("done")
+
+  return {
+    "user_weights": {
+      "rd_slope_weight": input_data.rd_slope_weight,
+      "acc_occ_weight": input_data.acc_occ_weight,
+      "acc_sc_weight": input_data.acc_sc_weight,
+      "rd_fr_weight": input_data.rd_fr_weight,
+      "traff_weight": input_data.traff_weight,
+    },
+    "recommended_roads": recommended_roads,
+  }
+
+
+# ✅ 여러 지역 x 여러 가중치 프로필 한 번에 추천
+@router.post("/recommend/batch", dependencies=[Depends(rate_limit("recommend_batch"))])
+async def batch_road_recommendations(
+    input_data: BatchRecommendRequest, user: dict = Depends(get_authenticated_user)
+):
+  """
+  지역별 도로 정보는 한 번만, 순위는 프로필별 [rds_id, pred_idx] 목록으로 반환
+  (rankings[j]는 profiles[j]의 결과)
+  """
+  start_ts = time.perf_counter()
+
+  active = await _prepare()
+  region_names = list(dict.fromkeys(input_data.regions))  # 중복 제거, 순서 유지
+  regions, missing = [], []
+  for name in region_names:
+    region = feature_store.region(name)
+    if region is None:
+      missing.append(name)
+    else:
+      regions.append((name, region))
 
-    return {
-      "user_weights": {
-        "rd_slope_weight": input_data.rd_slope_weight,
-        "acc_occ_weight": input_data.acc_occ_weight,
-        "acc_sc_weight": input_data.acc_sc_weight,
-        "rd_fr_weight": input_data.rd_fr_weight,
-        "traff_weight": input_data.traff_weight,
-      },
-      "recommended_roads": recommended_roads,
-    }
-  finally:
-    cursor.close()
-    connection.close()
+  if not regions:
+    raise HTTPException(
+        status_code=404, detail="요청한 지역의 도로 데이터가 없습니다."
+    )
+
+  model_scores = [await _model_scores(region, active) for _, region in regions]
+  rankings = await inference_executor.run(
+      "rank",
+      rank_batch,
+      [region for _, region in regions],
+      model_scores,
+      input_data.profiles,
+  )
+  latency_ms = int((time.perf_counter() - start_ts) * 1000)
+
+  results, rec_logs, pred_logs = [], [], []
+  now = datetime.now()
+  for (name, _), ranked in zip(regions, rankings):
+    roads = {}
+    for profile, recommended_roads in zip(input_data.profiles, ranked):
+      for road in recommended_roads:
+        roads.setdefault(
+            road["rds_id"],
+            {k: v for k, v in road.items() if k not in ("rds_id", "pred_idx")},
+        )
+      rec_logs.append((
+        user["sub"],
+        json.dumps(
+            {"rds_rg": name, "recommended_roads": recommended_roads},
+            ensure_ascii=False,
+        ),
+      ))
+      pred_logs.append((
+        user["sub"], name,
+        profile.rd_slope_weight, profile.acc_occ_weight,
+        profile.acc_sc_weight, profile.rd_fr_weight, profile.traff_weight,
+        now, latency_ms, active.version,
+      ))
+    results.append({
+      "rds_rg": name,
+      "roads": roads,
+      "rankings": [
+        [[road["rds_id"], road["pred_idx"]] for road in recommended_roads]
+        for recommended_roads in ranked
+      ],
+    })
+
+  # 로그는 한 번에 기록
+  async with async_cursor(commit=True) as cursor:
+    await cursor.executemany(
+        "INSERT INTO rec_road_log (user_email, recommended_roads) VALUES (%s, %s)",
+        rec_logs,
+    )
+    await cursor.executemany(
+        """
+        INSERT INTO predicts_log
+        (user_email, region,
+         rd_slope_weight, acc_occ_weight, acc_sc_weight, rd_fr_weight,
+         traff_weight,
+         predict_date, latency_ms, model_version)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """,
+        pred_logs,
+    )
+
+  return {
+    "profiles": [profile.model_dump() for profile in input_data.profiles],
+    "results": results,
+    "missing_regions": missing,
+  }
+
+
+# ✅ 서울 전체 (또는 지정한 지역들) 도로 중 상위 k개
+@router.post(
+    "/recommend/citywide", dependencies=[Depends(rate_limit("recommend_citywide"))]
+)
+async def citywide_road_recommendations(
+    input_data: CitywideRequest, user: dict = Depends(get_authenticated_user)
+):
+  """지역 구분 없이 순위 계산 - pred_idx는 대상 도로 전체 기준으로 정규화"""
+  start_ts = time.perf_counter()
+
+  active = await _prepare()
+  snapshot = feature_store.snapshot
+  if input_data.regions is not None:
+    missing = [r for r in input_data.regions if r not in snapshot.regions]
+    if len(missing) == len(input_data.regions):
+      raise HTTPException(
+          status_code=404, detail="요청한 지역의 도로 데이터가 없습니다."
+      )
+  else:
+    missing = []
+
+  scores = road_scores.snapshot_scores(snapshot)
+  if scores is None:
+    # 모델 점수 재계산 전 - 요청에서 전체 도로를 추론하지 않고 백그라운드로 넘김
+    road_scores.rebuild_in_background()
+    raise HTTPException(
+        status_code=503,
+        detail="모델 점수를 준비 중입니다.",
+        headers={"Retry-After": str(INFERENCE_RETRY_AFTER)},
+    )
+
+  # snapshot 전체를 프로세스로 넘기지 않도록 순위 계산은 스레드에서
+  ranking = await inference_executor.run(
+      "rank",
+      rank_citywide,
+      snapshot,
+      scores,
+      input_data,
+      input_data.top_k,
+      input_data.regions,
+      in_thread=True,
+  )
+  recommended_roads = ranking["recommended_roads"]
+  latency_ms = int((time.perf_counter() - start_ts) * 1000)
+  if not input_data.regions:
+    region_label = "전체"
+  elif len(input_data.regions) == 1:
+    region_label = input_data.regions[0]
+  else:
+    region_label = f"{input_data.regions[0]} 외 {len(input_data.regions) - 1}곳"
+
+  async with async_cursor(commit=True) as cursor:
+    await cursor.execute(
+        "INSERT INTO rec_road_log (user_email, recommended_roads) VALUES (%s, %s)",
+        (
+          user["sub"],
+          json.dumps(
+              {"rds_rg": region_label, "recommended_roads": recommended_roads},
+              ensure_ascii=False,
+          ),
+        ),
+    )
+    await cursor.execute(
+        """
+        INSERT INTO predicts_log
+        (user_email, region,
+         rd_slope_weight, acc_occ_weight, acc_sc_weight, rd_fr_weight,
+         traff_weight,
+         predict_date, latency_ms, model_version)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """,
+        (
+          user["sub"], region_label,
+          input_data.rd_slope_weight, input_data.acc_occ_weight,
+          input_data.acc_sc_weight, input_data.rd_fr_weight,
+          input_data.traff_weight,
+          datetime.now(), latency_ms, active.version,
+        ),
+    )
+
+  return {
+    "user_weights": input_data.model_dump(include=set(WeightProfile.model_fields)),
+    "regions": input_data.regions,
+    "missing_regions": missing,
+    "scored_roads": ranking["scored_roads"],
+    "recommended_roads": recommended_roads,
+  }
 
 
 # ✅ 추천 로그 확인
@@ -1,5 +1,6 @@
 import socketio
-import asyncio
+import os
+import time
 from urllib.parse import parse_qs
 from app.core.jwt_utils import verify_token  # 웹소켓에서도 토큰 확인 
 
@@ -16,6 +17,14 @@ socket_app = socketio.ASGIApp(sio)
 # 실시간 게시판 데이터 저장 
 active_connections = []
 
+# 사용자별 연결 (진행률 등 개인 이벤트는 사용자 room으로만 전송)
+user_connections = {}  # user_id -> {sid}
+sid_users = {}  # sid -> user_id
+
+
+def user_room(user_id: str) -> str:
+    return f"user:{user_id}"
+
 # 1. WebSocket 연결 관리
 @sio.event
 async def connect(sid, environ):
@@ -47,6 +56,10 @@ async def connect(sid, environ):
 
     # ✅ 연결된 사용자 리스트에 추가
     active_connections.append(sid)
+    user_id = payload["sub"]
+    await sio.enter_room(sid, user_room(user_id))
+    user_connections.setdefault(user_id, set()).add(sid)
+    sid_users[sid] = user_id
     return True  # 연결 허용
 
 
@@ -58,6 +71,13 @@ async def disconnect(sid):
     # ✅ sid가 리스트에 존재하는 경우만 제거
     if sid in active_connections:
         active_connections.remove(sid)
+    user_id = sid_users.pop(sid, None)
+    if user_id is not None:
+        sids = user_connections.get(user_id, set())
+        sids.discard(sid)
+        if not sids:
+            user_connections.pop(user_id, None)
+            _last_progress.pop(user_id, None)
 
     print(f"📢 현재 활성 연결 수: {len(active_connections)}")
 
@@ -106,25 +126,47 @@ async def notify_deleted_answer(answer):
     
 # 모델 진행률 보내기
 
-# ✅ 모델 진행률을 웹소켓으로 보내는 함수 추가 - 진행률은 나중에 따로 (현재는 불가)
-async def send_progress(progress: int, user_id: str):
+# 추천 처리 단계별 진행률 (단계 시작 시 전송)
+PROGRESS_STAGES = {"fetch": 10, "infer": 30, "rank": 60, "persist": 85, "done": 100}
+# 사용자당 진행률 이벤트 최소 간격(초) - 완료 이벤트는 항상 전송
+PROGRESS_MIN_INTERVAL = float(os.getenv("PROGRESS_MIN_INTERVAL", "0.2"))
+
+_last_progress = {}  # user_id -> 마지막 전송 시각
+
+
+async def send_progress(progress: int, user_id: str, stage: str = None):
     """
-    모델 진행률을 특정 사용자에게 전송
+    모델 진행률을 해당 사용자의 연결(room)에만 전송
     :param progress: 진행률 (0~100)
     :param user_id: 사용자 ID (토큰에서 가져옴)
     """
-    print(f"📡 [Socket.IO] 모델 진행률 전송: {progress}% (User: {user_id})")
-    await sio.emit("progressUpdate", {"progress": progress, "user_id": user_id})
+    await sio.emit(
+        "progressUpdate",
+        {"progress": progress, "user_id": user_id, "stage": stage},
+        room=user_room(user_id),
+    )
 
 
-# ✅ 모델 실행 중 진행률을 전송하는 함수
-async def run_model_with_progress(user_id: str):
+class ProgressReporter:
     """
-    모델을 실행하면서 진행률을 실시간으로 업데이트
-    :param user_id: 진행률을 받을 사용자 ID
+    추천 처리 단계가 바뀔 때 진행률 전송
+    - 연결된 소켓이 없는 사용자면 아무것도 보내지 않음
+    - 사용자당 PROGRESS_MIN_INTERVAL보다 자주 보내지 않음 (빠르게 지나간 단계는 생략)
     """
-    for progress in range(0, 101, 10):  # 0% ~ 100% (10% 단위 증가)
-        await send_progress(progress, user_id)
-        await asyncio.sleep(1)  # 1초마다 업데이트 
 
-    print(f"[Socket.IO] 모델 실행 완료! (User: {user_id})")
+    def __init__(self, user_id: str, min_interval: float = PROGRESS_MIN_INTERVAL):
+        self.user_id = user_id
+        self.min_interval = min_interval
+        self.sent = 0
+
+    async def stage(self, name: str):
+        if self.user_id not in user_connections:
+            return
+        final = name == "done"
+        now = time.monotonic()
+        last = _last_progress.get(self.user_id)
+        if not final and last is not None and now - last < self.min_interval:
+            return
+        _last_progress[self.user_id] = now
+        self.sent += 1
+        await send_progress(PROGRESS_STAGES[name], self.user_id, name)
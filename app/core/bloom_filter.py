@@ -0,0 +1,45 @@
+# Bloom filter (메모리 내 집합 포함 여부 사전 확인용)
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    거짓 음성 없는 확률적 집합
+    - might_contain()이 False면 확실히 없음, True면 실제 확인 필요
+    - 삭제를 지원하지 않으므로 만료된 항목은 rebuild로 정리
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.num_bits = max(
+            int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)), 8
+        )
+        self.num_hashes = max(int(round(self.num_bits / self.capacity * math.log(2))), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # double hashing: h1 + i*h2
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain(item)
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
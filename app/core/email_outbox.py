@@ -0,0 +1,282 @@
+# 이메일 발송 큐 (요청 처리와 분리, SMTP 세션 재사용)
+import heapq
+import itertools
+import os
+import queue
+import smtplib
+import threading
+import time
+import uuid
+from datetime import datetime
+import redis
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 설정
+EMAIL_QUEUE_SIZE = int(os.getenv("EMAIL_QUEUE_SIZE", "1000"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BASE = float(os.getenv("EMAIL_RETRY_BASE", "2"))  # 초, 재시도마다 2배
+EMAIL_RETRY_MAX = float(os.getenv("EMAIL_RETRY_MAX", "300"))
+EMAIL_SESSION_IDLE = float(os.getenv("EMAIL_SESSION_IDLE", "60"))  # 유휴 세션 종료(초)
+EMAIL_STATUS_TTL = int(os.getenv("EMAIL_STATUS_TTL", "86400"))  # 상태 보관(초)
+STATUS_KEY = "email_status:{}"  # hash {status, to, attempts, error, updated_at}
+
+# 재시도해도 소용없는 오류 (수신자 거부 등)
+PERMANENT_ERRORS = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused)
+
+
+class SMTPSession:
+    """
+    로그인된 SMTP 연결 하나를 유지하며 재사용
+    - 서버가 연결을 끊었으면 한 번 다시 연결 후 재전송
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = None,
+        password: str = None,
+        use_tls: bool = True,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.connects = 0
+        self.last_used = 0.0
+        self._server = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._server is not None
+
+    def _connect(self):
+        server = smtplib.SMTP(self.host, self.port, timeout=30)
+        if self.use_tls:
+            server.starttls()
+        if self.username and self.password:
+            server.login(self.username, self.password)
+        self.connects += 1
+        return server
+
+    def send(self, msg):
+        for reconnect in (False, True):
+            if self._server is None or reconnect:
+                self.close()
+                self._server = self._connect()
+            try:
+                self._server.send_message(msg)
+                self.last_used = time.monotonic()
+                return
+            except smtplib.SMTPServerDisconnected:
+                if reconnect:
+                    raise
+
+    def close(self):
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+
+class EmailOutbox:
+    """
+    메시지를 큐에 넣고 바로 반환, 백그라운드 스레드가 발송
+    - 로그인된 SMTP 세션을 유지하며 재사용 (끊기면 다시 연결)
+    - 실패 시 지수 백오프로 max_attempts까지 재시도
+    - 메시지별 발송 상태는 Redis에 기록 (어느 워커에서든 조회, EMAIL_STATUS_TTL 동안 보관)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = None,
+        password: str = None,
+        use_tls: bool = True,
+        max_queue: int = EMAIL_QUEUE_SIZE,
+        max_attempts: int = EMAIL_MAX_ATTEMPTS,
+        retry_base: float = EMAIL_RETRY_BASE,
+        session_idle: float = EMAIL_SESSION_IDLE,
+    ):
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.session_idle = session_idle
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._delayed = []  # (재시도 시각, 순번, 항목)
+        self._seq = itertools.count()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._session = SMTPSession(host, port, username, password, use_tls)
+
+        # 통계
+        self._enqueued = 0
+        self._rejected = 0
+        self._sent = 0
+        self._failed = 0
+        self._retries = 0
+        self._last_send_ms = 0.0
+
+    # --- 큐 ---
+    def enqueue(self, msg) -> str:
+        """EmailMessage를 큐에 추가하고 메시지 ID 반환 (큐가 가득 차면 None)"""
+        message_id = uuid.uuid4().hex
+        item = {"id": message_id, "msg": msg, "attempts": 0}
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self._rejected += 1
+            print(f"❌ Email queue full, dropped mail to {msg['To']}")
+            return None
+        with self._lock:
+            self._enqueued += 1
+        self._set_status(message_id, "queued", to=msg["To"])
+        return message_id
+
+    def _set_status(self, message_id: str, status: str, **fields):
+        if not redis_client:
+            return
+        key = STATUS_KEY.format(message_id)
+        values = {"status": status, "updated_at": datetime.now().isoformat()}
+        cleared = []
+        for name, value in fields.items():
+            if value is None:
+                cleared.append(name)
+            else:
+                values[name] = value
+        try:
+            pipe = redis_client.pipeline()
+            pipe.hset(key, mapping=values)
+            if cleared:
+                pipe.hdel(key, *cleared)
+            pipe.expire(key, EMAIL_STATUS_TTL)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Email status write error ({message_id}): {e}")
+
+    def status(self, message_id: str):
+        if not redis_client:
+            return None
+        try:
+            raw = redis_client.hgetall(STATUS_KEY.format(message_id))
+        except Exception as e:
+            print(f"⚠️ Email status read error ({message_id}): {e}")
+            return None
+        if not raw:
+            return None
+        entry = {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in raw.items()
+        }
+        if "attempts" in entry:
+            entry["attempts"] = int(entry["attempts"])
+        entry.setdefault("error", None)
+        return entry
+
+    # --- 워커 ---
+    def _process(self, item):
+        msg = item["msg"]
+        item["attempts"] += 1
+        started = time.perf_counter()
+        try:
+            self._session.send(msg)
+        except Exception as e:
+            if isinstance(e, PERMANENT_ERRORS) or item["attempts"] >= self.max_attempts:
+                print(f"❌ Failed to send email to {msg['To']}: {e}")
+                with self._lock:
+                    self._failed += 1
+                self._set_status(
+                    item["id"], "failed", attempts=item["attempts"], error=str(e)
+                )
+                return
+            if not isinstance(e, smtplib.SMTPResponseException):
+                self._session.close()  # 연결 문제면 다음 시도에 새 세션
+            delay = min(self.retry_base * 2 ** (item["attempts"] - 1), EMAIL_RETRY_MAX)
+            print(f"⚠️ Email to {msg['To']} failed ({e}), retry in {delay}s")
+            with self._lock:
+                self._retries += 1
+            self._set_status(
+                item["id"], "retrying", attempts=item["attempts"], error=str(e)
+            )
+            heapq.heappush(
+                self._delayed, (time.monotonic() + delay, next(self._seq), item)
+            )
+            return
+
+        print(f"✅ Email sent to {msg['To']}")
+        with self._lock:
+            self._sent += 1
+            self._last_send_ms = round((time.perf_counter() - started) * 1000, 3)
+        self._set_status(item["id"], "sent", attempts=item["attempts"], error=None)
+
+    def _next_item(self, timeout: float):
+        now = time.monotonic()
+        if self._delayed and self._delayed[0][0] <= now:
+            return heapq.heappop(self._delayed)[2]
+        if self._delayed:
+            timeout = min(timeout, self._delayed[0][0] - now)
+        try:
+            return self._queue.get(timeout=max(timeout, 0.01))
+        except queue.Empty:
+            return None
+
+    def _run(self):
+        while not self._stop.is_set():
+            item = self._next_item(1.0)
+            if item is not None:
+                self._process(item)
+            elif (
+                self._session.is_open
+                and time.monotonic() - self._session.last_used > self.session_idle
+            ):
+                self._session.close()
+        self._session.close()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="email-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """큐에 남은 메일을 timeout 안에서 발송 후 종료 (재시도 대기 중인 메일은 버림)"""
+        deadline = time.monotonic() + timeout
+        while not self._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        self._stop.set()
+        try:
+            self._queue.put_nowait(None)  # 대기 중인 워커 깨우기
+        except queue.Full:
+            pass
+        if self._thread:
+            self._thread.join(max(deadline - time.monotonic(), 1.0))
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "waiting_retry": len(self._delayed),
+                "enqueued": self._enqueued,
+                "rejected": self._rejected,
+                "sent": self._sent,
+                "failed": self._failed,
+                "retries": self._retries,
+                "smtp_connects": self._session.connects,
+                "last_send_ms": self._last_send_ms,
+            }
@@ -1,7 +1,7 @@
 import random
-import smtplib
 from email.message import EmailMessage
 import os
+from app.core.email_outbox import EmailOutbox
 
 # SMTP 설정 (보내는 사람)
 SMTP_SERVER = "smtp.gmail.com"
@@ -10,6 +10,10 @@ SENDER_EMAIL = "ongil.aivle16@gmail.com"  # 보내는 이메일
 SENDER_PASSWORD = os.getenv("SENDER_PASSWORD")
 SENDER_NAME = "온길 - Ongil"  # 보내는 사람 이름
 
+email_outbox = EmailOutbox(
+    SMTP_SERVER, SMTP_PORT, username=SENDER_EMAIL, password=SENDER_PASSWORD
+)
+
 
 def send_email(
     to_email: str,
@@ -17,8 +21,12 @@ def send_email(
     body: str,
     is_html: bool = False,
     attachment_path: str = None,
+    attachments: list = None,
 ):
-    """이메일 전송 함수 (텍스트/HTML/파일 첨부 가능)"""
+    """
+    이메일 전송 함수 (텍스트/HTML/파일 첨부 가능) - 발송 큐에 넣고 바로 반환
+    - attachments: 메모리 첨부 [(파일명, bytes, "type/subtype"), ...]
+    """
     msg = EmailMessage()
     msg["From"] = f"{SENDER_NAME} <{SENDER_EMAIL}>"  # 보낸 사람 이메일 포함
     msg["To"] = to_email
@@ -38,19 +46,12 @@ def send_email(
         except FileNotFoundError:
             raise ValueError(f"❌ File not found: {attachment_path}")
 
-    # SMTP 서버에 연결하여 이메일 전송
-    try:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(SENDER_EMAIL, SENDER_PASSWORD)
-            server.send_message(msg)
-        print(f"✅ Email sent to {to_email}")
-        return True
-    except smtplib.SMTPAuthenticationError as auth_error:
-        print(f"❌ Authentication failed: {auth_error}")
-    except Exception as e:
-        print(f"❌ Failed to send email: {e}")
-    return False
+    for filename, data, mimetype in attachments or []:
+        maintype, subtype = mimetype.split("/", 1)
+        msg.add_attachment(data, maintype=maintype, subtype=subtype, filename=filename)
+
+    # 발송 큐에 추가 (실제 SMTP 전송은 백그라운드 워커에서)
+    return email_outbox.enqueue(msg) is not None
 
 
 def generate_verification_code():
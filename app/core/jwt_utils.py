@@ -2,9 +2,11 @@ import logging
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
 import os
+import uuid
 from dotenv import load_dotenv
-from fastapi import Header, HTTPException
+from fastapi import Header, HTTPException, Request
 from app.core.token_blacklist import is_token_blacklisted
+from app.core.token_cache import token_cache
 from typing import Optional
 
 # .env 파일 위치 명시
@@ -27,7 +29,7 @@ def create_access_token(data: dict, expires_delta: timedelta):
     """
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -37,7 +39,7 @@ def create_refresh_token(data: dict, expires_delta: timedelta):
     """
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + expires_delta
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
@@ -49,8 +51,11 @@ def verify_token(token: str, token_type: str = "access"):
         raise HTTPException(status_code=401, detail="인증 토큰이 없습니다.")
 
     try:
-        # ✅ JWT 토큰 디코딩
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        # ✅ 이미 검증한 토큰이면 캐시된 payload 사용, 아니면 JWT 디코딩 후 캐시
+        payload = token_cache.get(token)
+        if payload is None:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            token_cache.put(token, payload)
 
         # ✅ "sub" 필드는 일반 사용자 식별, "admin"은 관리자 식별
         if token_type == "access" and "sub" not in payload:
@@ -67,18 +72,38 @@ def verify_token(token: str, token_type: str = "access"):
         )
 
 
-def get_authenticated_user(token: Optional[str] = Header(None)):
-    """토큰을 검증하고 인증된 사용자 정보를 반환하는 함수"""
+def _reject_blacklisted(token: str):
     if is_token_blacklisted(token):  # 블랙리스트 체크
         logger.warning("[TokenBlacklist] 블랙리스트에 등록된 토큰 접근 시도.")
         raise HTTPException(
             status_code=401, detail="이 토큰은 블랙리스트에 등록되었습니다."
         )
 
+
+def authenticate(token: str):
+    """블랙리스트 확인 + 토큰 검증 (미들웨어에서 요청당 한 번)"""
+    _reject_blacklisted(token)
+    return verify_token(token)
+
+
+def get_authenticated_user(request: Request, token: Optional[str] = Header(None)):
+    """
+    토큰을 검증하고 인증된 사용자 정보를 반환하는 함수
+    - 미들웨어에서 이미 검증한 요청이면 request.state.user를 그대로 사용
+    """
+    user = getattr(request.state, "user", None)
+    if user is not None and getattr(request.state, "token", None) == token:
+        return user
+
+    _reject_blacklisted(token)
+
     try:
         payload = verify_token(token)
-        return payload  # 정상적인 경우 사용자 정보를 반환
     except Exception as e:
         # 인증 실패 시 로그
         logger.error(f"[AuthenticationFailed] {e}")
         raise HTTPException(status_code=401, detail=f"인증 실패: {str(e)}")
+
+    request.state.user = payload
+    request.state.token = token
+    return payload  # 정상적인 경우 사용자 정보를 반환
@@ -0,0 +1,157 @@
+# 요청 속도 제한 (Redis 토큰 버킷, Redis 장애 시 프로세스 내 버킷)
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+import redis
+from fastapi import HTTPException, Request, Response
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 기본 한도 "요청 수/초" - 환경변수 RATE_LIMIT_<NAME> (예: RATE_LIMIT_LOGIN=10/60)로 변경
+DEFAULT_RATE_LIMITS = {
+    "login": "10/60",
+    "findpwd": "5/300",
+    "signup_send_code": "5/300",
+    "recommend": "30/60",
+    "recommend_batch": "10/60",
+    "recommend_citywide": "10/60",
+}
+RATE_LIMIT_KEY = "ratelimit:{}:{}"
+RATE_LIMIT_REDIS_RETRY = float(os.getenv("RATE_LIMIT_REDIS_RETRY", "5"))  # 장애 후 재시도 간격(초)
+LOCAL_BUCKETS_MAX = 10000
+
+# 버킷 갱신 + 토큰 차감을 한 번에 (반환: {허용 여부, 남은 토큰})
+_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens)}
+"""
+_bucket_script = redis_client.register_script(_BUCKET_SCRIPT) if redis_client else None
+
+_local_buckets = OrderedDict()  # key -> (tokens, ts)
+_lock = threading.Lock()
+_redis_down_until = 0.0
+_stats = {}
+
+
+def parse_limit(value: str):
+    """'10/60' -> (capacity 10, 초당 10/60 토큰)"""
+    count, seconds = value.split("/")
+    capacity = int(count)
+    return capacity, capacity / float(seconds)
+
+
+def _limit_for(name: str):
+    return parse_limit(
+        os.getenv(f"RATE_LIMIT_{name.upper()}", DEFAULT_RATE_LIMITS.get(name, "60/60"))
+    )
+
+
+def _count(name: str, field: str):
+    with _lock:
+        counters = _stats.setdefault(
+            name, {"allowed": 0, "limited": 0, "local_fallback": 0}
+        )
+        counters[field] += 1
+
+
+def _take_local(key: str, capacity: int, rate: float, now: float):
+    with _lock:
+        tokens, ts = _local_buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        _local_buckets[key] = (tokens, now)
+        _local_buckets.move_to_end(key)
+        while len(_local_buckets) > LOCAL_BUCKETS_MAX:
+            _local_buckets.popitem(last=False)
+    return allowed, tokens
+
+
+def take(name: str, identity: str):
+    """
+    토큰 하나 사용 시도 - (허용 여부, 한도, 남은 토큰, 초당 충전량)
+    Redis 오류 시 RATE_LIMIT_REDIS_RETRY초 동안 프로세스 내 버킷 사용
+    """
+    global _redis_down_until
+    capacity, rate = _limit_for(name)
+    key = RATE_LIMIT_KEY.format(name, identity)
+    now = time.time()
+
+    if _bucket_script is not None and now >= _redis_down_until:
+        try:
+            allowed, tokens = _bucket_script(keys=[key], args=[capacity, rate, now])
+            return bool(allowed), capacity, float(tokens), rate
+        except Exception as e:
+            print(f"[속도 제한 Redis 오류] {e} - 프로세스 내 버킷 사용")
+            _redis_down_until = now + RATE_LIMIT_REDIS_RETRY
+
+    _count(name, "local_fallback")
+    allowed, tokens = _take_local(key, capacity, rate, now)
+    return allowed, capacity, tokens, rate
+
+
+def _identity(request: Request) -> str:
+    """로그인 사용자는 이메일, 아니면 클라이언트 IP 기준"""
+    user = getattr(request.state, "user", None)
+    if user and user.get("sub"):
+        return f"user:{user['sub']}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def rate_limit(name: str):
+    """
+    라우트 의존성 - @router.post(..., dependencies=[Depends(rate_limit("login"))])
+    한도 초과 시 429 + Retry-After, 통과 시 X-RateLimit-* 헤더 추가
+    """
+
+    def dependency(request: Request, response: Response):
+        allowed, capacity, tokens, rate = take(name, _identity(request))
+        headers = {
+            "X-RateLimit-Limit": str(capacity),
+            "X-RateLimit-Remaining": str(max(int(tokens), 0)),
+            "X-RateLimit-Reset": str(math.ceil((capacity - tokens) / rate)),
+        }
+        if not allowed:
+            _count(name, "limited")
+            headers["Retry-After"] = str(math.ceil((1 - tokens) / rate))
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers=headers,
+            )
+        _count(name, "allowed")
+        response.headers.update(headers)
+
+    return dependency
+
+
+def rate_limit_stats() -> dict:
+    with _lock:
+        return {
+            "limits": {
+                name: os.getenv(f"RATE_LIMIT_{name.upper()}", value)
+                for name, value in DEFAULT_RATE_LIMITS.items()
+            },
+            "counters": {name: dict(counters) for name, counters in _stats.items()},
+            "redis_available": time.time() >= _redis_down_until,
+        }
@@ -0,0 +1,112 @@
+# 워커 간 이벤트 전달 (Redis pub/sub 구독 스레드)
+import threading
+import redis
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+RECONNECT_DELAY = 1.0
+RECONNECT_DELAY_MAX = 30.0
+
+# channel -> (handler, on_connect, on_disconnect)
+_subscriptions = {}
+_stop = threading.Event()
+_thread = None
+
+
+def subscribe(channel: str, handler, on_connect=None, on_disconnect=None):
+    """
+    채널 구독 등록 (start_event_listener 전에 호출)
+    - handler(data: str): 메시지 수신 시 호출
+    - on_connect(): 구독이 (재)연결될 때마다 호출 - 끊긴 동안 놓친 이벤트 보정용
+    - on_disconnect(): 구독이 끊기면 바로 호출 - 재연결 전까지 이벤트를 받지 못하므로
+      로컬 상태를 믿지 않도록 정리
+    """
+    _subscriptions[channel] = (handler, on_connect, on_disconnect)
+
+
+def publish(channel: str, data: str) -> bool:
+    """이벤트 발행 (실패해도 예외를 올리지 않음)"""
+    if redis_client is None:
+        return False
+    try:
+        redis_client.publish(channel, data)
+        return True
+    except Exception as e:
+        print(f"[이벤트 발행 실패] {channel}: {e}")
+        return False
+
+
+def _dispatch(message: dict):
+    channel = message["channel"]
+    data = message["data"]
+    if isinstance(channel, bytes):
+        channel = channel.decode()
+    if isinstance(data, bytes):
+        data = data.decode()
+    subscription = _subscriptions.get(channel)
+    if subscription is None:
+        return
+    try:
+        subscription[0](data)
+    except Exception as e:
+        print(f"[이벤트 처리 실패] {channel}: {e}")
+
+
+def _disconnected():
+    for channel, (_, _, on_disconnect) in _subscriptions.items():
+        if on_disconnect:
+            try:
+                on_disconnect()
+            except Exception as e:
+                print(f"[구독 끊김 처리 실패] {channel}: {e}")
+
+
+def _run():
+    delay = RECONNECT_DELAY
+    while not _stop.is_set():
+        pubsub = None
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(*_subscriptions)
+            for _, on_connect, _ in _subscriptions.values():
+                if on_connect:
+                    on_connect()
+            delay = RECONNECT_DELAY
+            while not _stop.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if message:
+                    _dispatch(message)
+        except Exception as e:
+            print(f"[이벤트 구독 끊김] {e} - {delay}초 후 재연결")
+            _disconnected()
+            _stop.wait(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX)
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+
+
+def start_event_listener():
+    global _thread
+    if redis_client is None or not _subscriptions:
+        return
+    if _thread and _thread.is_alive():
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name="redis-events", daemon=True)
+    _thread.start()
+
+
+def stop_event_listener(timeout: float = 5.0):
+    global _thread
+    _stop.set()
+    if _thread:
+        _thread.join(timeout)
+        _thread = None
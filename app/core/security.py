@@ -1,5 +1,10 @@
 # 비밀번호 보안
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from fastapi import HTTPException
 from passlib.context import CryptContext
 
 # 환경변수에서 PEPPER 값을 가져옵니다.
@@ -7,9 +12,139 @@ pepper = os.getenv("PEPPER", "")
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# 비밀번호 해싱 전용 풀 설정 (라우트 공용 스레드풀을 bcrypt가 점유하지 않도록)
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_MAX_PENDING = int(os.getenv("PASSWORD_MAX_PENDING", "16"))  # 실행 중 + 대기
+PASSWORD_TIMEOUT = float(os.getenv("PASSWORD_TIMEOUT", "10"))
+PASSWORD_RETRY_AFTER = int(os.getenv("PASSWORD_RETRY_AFTER", "2"))
+
+
+class PasswordWorkerPool:
+    """
+    bcrypt 작업 전용 스레드 풀
+    - 동시에 workers개만 실행, 실행 중 + 대기는 max_pending개까지
+    - 가득 차면 기다리지 않고 503 (Retry-After) 반환
+    - async 라우트는 run_async로 await (기다리는 동안 라우트 스레드를 잡지 않음)
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_WORKERS,
+        max_pending: int = PASSWORD_MAX_PENDING,
+        timeout: float = PASSWORD_TIMEOUT,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+        # 통계
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+        self._total_run_ms = 0.0
+
+    def _busy(self):
+        return HTTPException(
+            status_code=503,
+            detail="요청이 많아 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(PASSWORD_RETRY_AFTER)},
+        )
+
+    def _task(self, fn, args, submitted: float):
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            wait_ms = (started - submitted) * 1000
+            self._total_wait_ms += wait_ms
+            self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._total_run_ms += (time.perf_counter() - started) * 1000
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def _submit(self, fn, args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise self._busy()
+
+        with self._lock:
+            self._pending += 1
+        future = self._executor.submit(self._task, fn, args, time.perf_counter())
+        # 슬롯은 작업이 실제로 끝날 때 반납 (타임아웃으로 먼저 돌아가도 한도 유지)
+        future.add_done_callback(self._release)
+        return future
+
+    def _timed_out(self):
+        with self._lock:
+            self._timeouts += 1
+        return self._busy()
+
+    def run(self, fn, *args):
+        """풀에서 fn(*args) 실행 후 결과 반환 (호출 스레드는 결과를 기다림)"""
+        future = self._submit(fn, args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise self._timed_out()
+
+    async def run_async(self, fn, *args):
+        """풀에서 fn(*args) 실행 결과를 await (이벤트 루프/라우트 스레드를 막지 않음)"""
+        future = self._submit(fn, args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise self._timed_out()
+
+    def stats(self) -> dict:
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait_ms / completed, 3) if completed else 0.0,
+                "max_wait_ms": round(self._max_wait_ms, 3),
+                "avg_run_ms": round(self._total_run_ms / completed, 3) if completed else 0.0,
+            }
+
+
+password_pool = PasswordWorkerPool()
+
+
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password + pepper)
+    return password_pool.run(pwd_context.hash, password + pepper)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password + pepper, hashed_password)
+    return password_pool.run(pwd_context.verify, plain_password + pepper, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run_async(pwd_context.hash, password + pepper)
+
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_pool.run_async(
+        pwd_context.verify, plain_password + pepper, hashed_password
+    )
@@ -1,4 +1,11 @@
+import hashlib
+import os
+import threading
 import redis
+from jose import jwt
+from app.core.bloom_filter import BloomFilter
+from app.core.redis_events import subscribe, publish
+from app.core.token_cache import token_cache
 
 # Connect to Redis
 try:
@@ -7,18 +14,148 @@ except Exception as e:
     print(f"Redis connection failed: {e}")
     redis_client = None
 
+# 설정
+REVOKED_KEY = "revoked:{}"  # 폐기된 토큰 ID (TTL = 토큰 남은 유효시간)
+REVOKED_CHANNEL = "token_revoked"
+BLACKLIST_FILTER_CAPACITY = int(os.getenv("BLACKLIST_FILTER_CAPACITY", "100000"))
+BLACKLIST_FILTER_ERROR_RATE = float(os.getenv("BLACKLIST_FILTER_ERROR_RATE", "0.001"))
+
+# 워커 로컬 Bloom filter - Redis와 동기화되기 전(None)에는 매번 Redis 확인
+# 폐기 이벤트 구독이 끊기면 다시 None (끊긴 동안 다른 워커의 폐기를 놓칠 수 있으므로)
+_filter = None
+_listening = False  # 폐기 이벤트 구독 중인지 (아닐 때 만든 filter는 쓰지 않음)
+_rebuild_adds = None  # 재생성 중 들어온 폐기 ID (새 filter에 반영)
+_lock = threading.Lock()
+_stats = {
+    "local_negatives": 0,
+    "redis_checks": 0,
+    "revoked_hits": 0,
+    "false_positives": 0,
+    "rebuilds": 0,
+    "last_rebuild_error": None,
+}
+
+
+def token_id(token: str) -> str:
+    """폐기 키로 쓸 토큰 ID - jti 클레임, 없으면(이전 발급 토큰) 토큰 digest"""
+    try:
+        jti = jwt.get_unverified_claims(token).get("jti")
+    except Exception:
+        jti = None
+    return jti or hashlib.sha256(token.encode()).hexdigest()
+
+
+def _count(name: str):
+    with _lock:
+        _stats[name] += 1
+
+
+def _on_revoked(revoked_id: str):
+    """폐기된 토큰 ID를 로컬 filter에 반영 (다른 워커에서 온 이벤트 포함)"""
+    with _lock:
+        if _rebuild_adds is not None:
+            _rebuild_adds.append(revoked_id)
+        current = _filter
+    if current is not None:
+        current.add(revoked_id)
+
+
+def rebuild_revocation_filter():
+    """
+    Redis에 남아 있는 폐기 ID로 filter 재생성
+    (시작/재연결 시 놓친 이벤트 보정 + 만료된 ID 정리)
+    """
+    global _filter, _rebuild_adds
+    with _lock:
+        _rebuild_adds = []
+    try:
+        revoked_ids = [
+            key.decode().split(":", 1)[1]
+            for key in redis_client.scan_iter(match=REVOKED_KEY.format("*"), count=1000)
+        ]
+        bloom = BloomFilter(
+            max(BLACKLIST_FILTER_CAPACITY, len(revoked_ids) * 2),
+            BLACKLIST_FILTER_ERROR_RATE,
+        )
+        for revoked_id in revoked_ids:
+            bloom.add(revoked_id)
+        with _lock:
+            for revoked_id in _rebuild_adds:
+                bloom.add(revoked_id)
+            if _listening:
+                _filter = bloom
+            _stats["rebuilds"] += 1
+            _stats["last_rebuild_error"] = None
+    except Exception as e:
+        print(f"🔴 블랙리스트 filter 재생성 실패: {e}")
+        with _lock:
+            _stats["last_rebuild_error"] = str(e)
+    finally:
+        with _lock:
+            _rebuild_adds = None
+
+
+def _on_connect():
+    global _listening
+    with _lock:
+        _listening = True
+    rebuild_revocation_filter()
+
+
+def _on_disconnect():
+    """구독이 끊기면 filter를 버려 재연결(재생성) 전까지 매번 Redis 확인"""
+    global _filter, _listening
+    with _lock:
+        _listening = False
+        _filter = None
+
 
 def add_token_to_blacklist(token: str, expiration_seconds: int):
-    """Redis blacklist에 토큰 추가."""
-    redis_client.setex(token, expiration_seconds, "blacklisted")
+    """Redis blacklist에 토큰 ID 추가 후 다른 워커에 전파."""
+    revoked_id = token_id(token)
+    redis_client.setex(REVOKED_KEY.format(revoked_id), max(expiration_seconds, 1), 1)
+    _on_revoked(revoked_id)
+    publish(REVOKED_CHANNEL, revoked_id)
+    token_cache.invalidate(token)
 
 
 def is_token_blacklisted(token):
     if not token:  # None 체크 추가
         return False
 
+    revoked_id = token_id(token)
+    current = _filter
+    if current is not None and not current.might_contain(revoked_id):
+        _count("local_negatives")
+        return False
+
     try:
-        return redis_client.get(token) == "blacklisted"
+        _count("redis_checks")
+        revoked = bool(redis_client.exists(REVOKED_KEY.format(revoked_id)))
     except Exception as e:
         print(f"🔴 Redis 오류 발생: {e}")
         return False  # Redis 오류 발생 시 블랙리스트 체크를 우회
+
+    if revoked:
+        _count("revoked_hits")
+    elif current is not None:
+        _count("false_positives")
+    return revoked
+
+
+def blacklist_stats() -> dict:
+    current = _filter
+    with _lock:
+        stats = dict(_stats)
+    stats["filter_ready"] = current is not None
+    stats["filter_items"] = current.count if current else 0
+    stats["filter_bytes"] = current.size_bytes if current else 0
+    return stats
+
+
+subscribe(
+    REVOKED_CHANNEL,
+    _on_revoked,
+    on_connect=_on_connect,
+    on_disconnect=_on_disconnect,
+)
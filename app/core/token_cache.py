@@ -0,0 +1,98 @@
+# 검증된 JWT payload 캐시 (같은 토큰의 반복 서명 검증 생략)
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# 설정
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", "300"))
+
+
+def token_digest(token: str) -> str:
+    """캐시 키 (원문 토큰 대신 sha256 digest 보관)"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenCache:
+    """
+    크기 제한 LRU + TTL 캐시
+    - 항목은 min(저장 시각 + ttl, 토큰 exp)에 만료
+    - 가득 차면 가장 오래 사용하지 않은 항목부터 제거
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_SIZE, ttl: float = TOKEN_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # digest -> (expires_at, payload)
+        self._lock = threading.Lock()
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evicted = 0
+        self._invalidated = 0
+
+    def get(self, token: str):
+        """캐시된 payload (없거나 만료됐으면 None)"""
+        key = token_digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, payload = entry
+            if now >= expires_at:
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(payload)
+
+    def put(self, token: str, payload: dict):
+        if self.max_size <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        key = token_digest(token)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(payload))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evicted += 1
+
+    def invalidate(self, token: str):
+        """블랙리스트 등록 등으로 즉시 제거"""
+        with self._lock:
+            if self._entries.pop(token_digest(token), None) is not None:
+                self._invalidated += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "expired": self._expired,
+                "evicted": self._evicted,
+                "invalidated": self._invalidated,
+            }
+
+
+token_cache = TokenCache()
@@ -0,0 +1,119 @@
+# asyncio 전용 MySQL 접근 (async 라우트용)
+import asyncio
+from contextlib import asynccontextmanager
+import aiomysql
+from pymysql import MySQLError
+from fastapi import HTTPException
+from app.database.mysql_connect import (
+    DB_HOST,
+    DB_USER,
+    DB_PASSWORD,
+    DB_NAME,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+)
+
+DB_PORT = 3306
+
+_pool = None
+_pool_loop = None
+_pool_lock = None
+
+
+async def get_async_pool():
+    """현재 이벤트 루프에 묶인 aiomysql 풀 (첫 사용 시 생성)"""
+    global _pool, _pool_loop, _pool_lock
+    loop = asyncio.get_running_loop()
+    if _pool is not None and _pool_loop is loop:
+        return _pool
+
+    if _pool_lock is None or _pool_loop is not loop:
+        _pool_lock = asyncio.Lock()
+        _pool_loop = loop
+        _pool = None
+
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await aiomysql.create_pool(
+                host=DB_HOST,
+                port=DB_PORT,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                db=DB_NAME,
+                charset="utf8mb4",
+                autocommit=False,
+                minsize=0,
+                maxsize=DB_POOL_SIZE,
+                pool_recycle=int(DB_POOL_RECYCLE),
+            )
+    return _pool
+
+
+@asynccontextmanager
+async def async_cursor(commit: bool = False):
+    """
+    커넥션을 빌려 dict 커서를 돌려주는 비동기 컨텍스트 매니저
+    - commit=True면 블록이 정상 종료될 때 커밋, 아니면 롤백 후 반납
+    - 예외 발생 시 롤백
+    """
+    try:
+        pool = await get_async_pool()
+        connection = await asyncio.wait_for(pool.acquire(), DB_POOL_TIMEOUT)
+    except asyncio.TimeoutError:
+        print("Async database pool exhausted")
+        raise HTTPException(
+            status_code=503, detail="Database is busy. Please try again."
+        )
+    except MySQLError as e:
+        print(f"Error connecting to the database: {e}")
+        raise HTTPException(
+            status_code=500, detail="Could not connect to the database."
+        )
+
+    try:
+        async with connection.cursor(aiomysql.DictCursor) as cursor:
+            yield cursor
+        if commit:
+            await connection.commit()
+        elif connection.get_transaction_status():
+            await connection.rollback()
+    except BaseException:
+        if not connection.closed:
+            try:
+                await connection.rollback()
+            except Exception:
+                connection.close()
+        raise
+    finally:
+        pool.release(connection)
+
+
+async def fetch_one(query: str, params: tuple = ()):
+    """한 행을 dict로 조회"""
+    async with async_cursor() as cursor:
+        await cursor.execute(query, params)
+        return await cursor.fetchone()
+
+
+async def fetch_all(query: str, params: tuple = ()):
+    """모든 행을 dict 리스트로 조회"""
+    async with async_cursor() as cursor:
+        await cursor.execute(query, params)
+        return await cursor.fetchall()
+
+
+async def execute(query: str, params: tuple = ()):
+    """INSERT/UPDATE/DELETE 실행 후 커밋, 마지막 insert id 반환"""
+    async with async_cursor(commit=True) as cursor:
+        await cursor.execute(query, params)
+        return cursor.lastrowid
+
+
+async def close_async_pool():
+    """풀 정리 (앱 종료 시)"""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        await _pool.wait_closed()
+        _pool = None
@@ -0,0 +1,3 @@
+-- predicts_log에 추천에 사용한 모델 버전 기록 (/roads/recommend, /roads/recommend/batch, /roads/recommend/citywide)
+-- 배포 전에 한 번 실행 (앱 시작 시에는 컬럼이 있는지 확인만 함)
+ALTER TABLE predicts_log ADD COLUMN model_version VARCHAR(64) NULL;
@@ -1,8 +1,11 @@
 import mysql.connector
 from mysql.connector import Error
 from fastapi import HTTPException
+from contextlib import contextmanager
 from dotenv import load_dotenv
+import threading
 import os
+from app.database.pool import ConnectionPool, PoolTimeout
 
 # .env 파일 로드
 env_path = os.path.join(os.path.dirname(__file__), "../../.env")
@@ -14,19 +17,81 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_RECYCLE = float(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _create_connection():
+    return mysql.connector.connect(
+        host=DB_HOST,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        database=DB_NAME,
+        charset="utf8mb4",
+    )
+
+
+def get_pool() -> ConnectionPool:
+    """커넥션 풀 (첫 사용 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    _create_connection,
+                    size=DB_POOL_SIZE,
+                    max_overflow=DB_POOL_MAX_OVERFLOW,
+                    timeout=DB_POOL_TIMEOUT,
+                    recycle=DB_POOL_RECYCLE,
+                    pre_ping=DB_POOL_PRE_PING,
+                )
+    return _pool
+
+
 def get_connection():
+    """풀에서 커넥션 빌리기 - close() 또는 with 블록 종료 시 풀에 반납"""
     try:
-        connection = mysql.connector.connect(
-            host=DB_HOST,
-            user=DB_USER,
-            password=DB_PASSWORD,
-            database=DB_NAME,
-            charset="utf8mb4",
+        return get_pool().connect()
+    except PoolTimeout as e:
+        print(f"Database pool exhausted: {e}")
+        raise HTTPException(
+            status_code=503, detail="Database is busy. Please try again."
         )
-        if connection.is_connected():
-            return connection
     except Error as e:
         print(f"Error connecting to the database: {e}")
         raise HTTPException(
             status_code=500, detail="Could not connect to the database."
-        )
\ No newline at end of file
+        )
+
+
+@contextmanager
+def db_cursor(dictionary: bool = False, commit: bool = False):
+    """
+    커넥션 + 커서를 한 번에 빌리는 컨텍스트 매니저
+    - commit=True면 블록이 정상 종료될 때 커밋
+    - 예외 발생 시 롤백 후 반납
+    """
+    with get_connection() as connection:
+        cursor = connection.cursor(dictionary=dictionary)
+        try:
+            yield cursor
+            if commit:
+                connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+
+def close_pool():
+    """유휴 커넥션 정리 (앱 종료 시)"""
+    if _pool is not None:
+        _pool.dispose()
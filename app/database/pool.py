@@ -0,0 +1,236 @@
+# MySQL 커넥션 풀
+import threading
+import time
+import weakref
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """풀에서 커넥션을 기다리다 시간이 초과된 경우"""
+
+
+class PooledConnection:
+    """
+    풀에서 빌려준 커넥션 래퍼
+    - close() 호출 시 실제로 끊지 않고 풀에 반납
+    - with 문으로 사용 가능 (블록 종료 시 반납)
+    - 그 외 속성/메서드는 원래 커넥션으로 위임
+    - 반납하지 않고 버려진 래퍼는 GC 시 커넥션을 닫고 풀 자리를 비움
+    """
+
+    def __init__(self, pool, raw, created_at):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        self._returned = False
+        self._finalizer = weakref.finalize(self, pool._release_lost, raw)
+        self._finalizer.atexit = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def is_connected(self):
+        if self._returned:
+            return False
+        return self._raw.is_connected()
+
+    def close(self):
+        if self._returned:
+            return
+        self._returned = True
+        self._finalizer.detach()
+        self._pool._checkin(self._raw, self._created_at)
+
+
+class ConnectionPool:
+    """
+    크기/오버플로/대기 시간/사전 ping/재생성 주기를 갖는 커넥션 풀
+    :param creator: 새 커넥션을 만드는 함수
+    :param size: 유휴 상태로 보관할 최대 커넥션 수
+    :param max_overflow: size를 넘어 임시로 열 수 있는 커넥션 수
+    :param timeout: 커넥션을 기다리는 최대 시간(초)
+    :param recycle: 이 시간(초)보다 오래된 커넥션은 새로 연결
+    :param pre_ping: 빌려주기 전에 ping으로 살아있는지 확인
+    :param ping_interval: 마지막 사용 후 이 시간(초)이 지난 커넥션만 ping
+    """
+
+    def __init__(
+        self,
+        creator,
+        size: int = 10,
+        max_overflow: int = 10,
+        timeout: float = 10.0,
+        recycle: float = 3600.0,
+        pre_ping: bool = True,
+        ping_interval: float = 10.0,
+    ):
+        self._creator = creator
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self.ping_interval = ping_interval
+
+        self._idle = deque()  # (raw, created_at, last_used)
+        self._open = 0
+        self._cond = threading.Condition()
+
+        # 통계
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._connects = 0
+        self._recycled = 0
+        self._ping_failures = 0
+        self._lost = 0
+        self._checkout_time_total = 0.0
+        self._checkout_time_max = 0.0
+
+    def connect(self):
+        """풀에서 커넥션 빌리기 (없으면 새로 연결하거나 반납될 때까지 대기)"""
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        waited = False
+        entry = None
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()  # 가장 최근에 쓴 커넥션부터
+                    break
+                if self._open < self.size + self.max_overflow:
+                    self._open += 1
+                    break
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"커넥션 대기 시간 초과 ({self.timeout}s, 사용 중 {self._open})"
+                    )
+                if not waited:
+                    waited = True
+                    self._waits += 1
+                self._cond.wait(remaining)
+
+        try:
+            if entry is None:
+                raw, created_at = self._create()
+            else:
+                raw, created_at = self._validate(*entry)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+        elapsed = time.perf_counter() - start
+        with self._cond:
+            self._checkouts += 1
+            self._checkout_time_total += elapsed
+            self._checkout_time_max = max(self._checkout_time_max, elapsed)
+
+        return PooledConnection(self, raw, created_at)
+
+    def _create(self):
+        raw = self._creator()
+        with self._cond:
+            self._connects += 1
+        return raw, time.monotonic()
+
+    def _validate(self, raw, created_at, last_used):
+        now = time.monotonic()
+
+        if self.recycle and now - created_at > self.recycle:
+            self._discard(raw)
+            with self._cond:
+                self._recycled += 1
+            return self._create()
+
+        if self.pre_ping and now - last_used > self.ping_interval:
+            try:
+                raw.ping(reconnect=False)
+            except Exception:
+                self._discard(raw)
+                with self._cond:
+                    self._ping_failures += 1
+                return self._create()
+
+        return raw, created_at
+
+    def _checkin(self, raw, created_at):
+        """커넥션 반납 - 열린 트랜잭션은 롤백, 초과분은 닫기"""
+        reusable = True
+        try:
+            if raw.unread_result:
+                raw.consume_results()
+            if raw.in_transaction:
+                raw.rollback()
+        except Exception:
+            reusable = False
+
+        keep = False
+        with self._cond:
+            if reusable and len(self._idle) < self.size:
+                self._idle.append((raw, created_at, time.monotonic()))
+                keep = True
+            else:
+                self._open -= 1
+            self._cond.notify()
+
+        if not keep:
+            self._discard(raw)
+
+    def _release_lost(self, raw):
+        """반납되지 않은 채 버려진 커넥션 - 닫고 열린 수에서 제외"""
+        with self._cond:
+            self._open -= 1
+            self._lost += 1
+            self._cond.notify()
+        self._discard(raw)
+
+    @staticmethod
+    def _discard(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def dispose(self):
+        """유휴 커넥션 모두 닫기 (앱 종료 시)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open -= len(idle)
+        for raw, _, _ in idle:
+            self._discard(raw)
+
+    def stats(self) -> dict:
+        with self._cond:
+            idle = len(self._idle)
+            return {
+                "size": self.size,
+                "max_overflow": self.max_overflow,
+                "open": self._open,
+                "idle": idle,
+                "in_use": self._open - idle,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "connects": self._connects,
+                "recycled": self._recycled,
+                "ping_failures": self._ping_failures,
+                "lost": self._lost,
+                "avg_checkout_ms": round(
+                    self._checkout_time_total / self._checkouts * 1000, 3
+                )
+                if self._checkouts
+                else 0.0,
+                "max_checkout_ms": round(self._checkout_time_max * 1000, 3),
+            }
@@ -0,0 +1,243 @@
+# 관리자 공지 일괄 메일 발송
+import copy
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime
+from email.message import EmailMessage
+import redis
+from app.core.email_outbox import SMTPSession
+from app.core.email_utils import (
+    SMTP_SERVER,
+    SMTP_PORT,
+    SENDER_EMAIL,
+    SENDER_PASSWORD,
+    SENDER_NAME,
+)
+from app.database.mysql_connect import db_cursor
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 설정
+BROADCAST_CONNECTIONS = int(os.getenv("BROADCAST_CONNECTIONS", "4"))  # 동시 SMTP 연결 수
+BROADCAST_MAX_ATTEMPTS = int(os.getenv("BROADCAST_MAX_ATTEMPTS", "2"))
+BROADCAST_TTL = int(os.getenv("BROADCAST_TTL", str(7 * 24 * 3600)))  # 진행 상황 보관(초)
+
+# 진행 상황은 Redis에 (어느 워커에서든 조회)
+PROGRESS_KEY = "broadcast:{}"  # hash {status, total, sent, failed, ...}
+RESULTS_KEY = "broadcast:{}:results"  # hash {email: "sent" / 실패 사유}
+COUNT_FIELDS = ("total", "sent", "failed")
+
+
+def _make_session():
+    return SMTPSession(
+        SMTP_SERVER, SMTP_PORT, username=SENDER_EMAIL, password=SENDER_PASSWORD
+    )
+
+
+class Broadcast:
+    """
+    수신자 조회(한 번에, DB 연결 반납) → 큐 → SMTP 연결별 워커 스레드로 발송
+    - 메시지는 한 번만 만들고 워커마다 복사해 To만 바꿔서 발송
+    - 진행 상황 / 수신자별 결과는 Redis에 기록
+    """
+
+    def __init__(
+        self,
+        subject: str,
+        body: str,
+        is_html: bool = False,
+        jurisdiction: str = None,
+        user_dept: str = None,
+        connections: int = BROADCAST_CONNECTIONS,
+    ):
+        self.id = uuid.uuid4().hex
+        self.jurisdiction = jurisdiction
+        self.user_dept = user_dept
+        self.connections = max(connections, 1)
+        self.total = 0
+        self.sent = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=self.connections * 50)
+
+        self._template = EmailMessage()
+        self._template["From"] = f"{SENDER_NAME} <{SENDER_EMAIL}>"
+        self._template["To"] = SENDER_EMAIL
+        self._template["Subject"] = subject
+        self._template.set_content(body, subtype="html" if is_html else "plain")
+
+        self._update(
+            status="queued",
+            jurisdiction=jurisdiction,
+            user_dept=user_dept,
+            total=0,
+            sent=0,
+            failed=0,
+            created_at=datetime.now().isoformat(),
+        )
+
+    def _update(self, **fields):
+        """진행 상황 필드 기록 (None이면 필드 삭제)"""
+        if not redis_client:
+            return
+        key = PROGRESS_KEY.format(self.id)
+        values = {k: v for k, v in fields.items() if v is not None}
+        cleared = [k for k, v in fields.items() if v is None]
+        try:
+            pipe = redis_client.pipeline()
+            if values:
+                pipe.hset(key, mapping=values)
+            if cleared:
+                pipe.hdel(key, *cleared)
+            pipe.expire(key, BROADCAST_TTL)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Broadcast {self.id} progress write error: {e}")
+
+    def _recipients(self) -> list:
+        """
+        조건에 맞는 수신자 이메일을 한 번의 쿼리로 모두 읽고 DB 연결 반납
+        (발송 내내 풀 연결을 붙잡지 않도록)
+        """
+        query = "SELECT user_email FROM user_data WHERE 1 = 1"
+        params = []
+        if self.jurisdiction:
+            query += " AND jurisdiction = %s"
+            params.append(self.jurisdiction)
+        if self.user_dept:
+            query += " AND user_dept = %s"
+            params.append(self.user_dept)
+
+        with db_cursor() as cursor:
+            cursor.execute(query, tuple(params))
+            return [email for (email,) in cursor]
+
+    def _record(self, email: str, result: str):
+        field = "sent" if result == "sent" else "failed"
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+        if not redis_client:
+            return
+        try:
+            pipe = redis_client.pipeline()
+            pipe.hset(RESULTS_KEY.format(self.id), email, result)
+            pipe.expire(RESULTS_KEY.format(self.id), BROADCAST_TTL)
+            pipe.hincrby(PROGRESS_KEY.format(self.id), field, 1)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Broadcast {self.id} result write error ({email}): {e}")
+
+    def _worker(self):
+        session = _make_session()
+        msg = copy.deepcopy(self._template)
+        try:
+            while True:
+                email = self._queue.get()
+                if email is None:
+                    return
+                msg.replace_header("To", email)
+                error = None
+                for _ in range(BROADCAST_MAX_ATTEMPTS):
+                    try:
+                        session.send(msg)
+                        error = None
+                        break
+                    except Exception as e:
+                        error = str(e)
+                        session.close()
+                self._record(email, "sent" if error is None else error)
+        finally:
+            session.close()
+
+    def run(self):
+        self._update(status="running")
+        try:
+            recipients = self._recipients()
+        except Exception as e:
+            print(f"❌ Broadcast {self.id} recipient query failed: {e}")
+            self._update(
+                status="failed", error=str(e), finished_at=datetime.now().isoformat()
+            )
+            return
+
+        self.total = len(recipients)
+        self._update(total=self.total)
+        workers = [
+            threading.Thread(
+                target=self._worker, name=f"broadcast-{self.id[:8]}-{i}", daemon=True
+            )
+            for i in range(self.connections)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for email in recipients:
+                self._queue.put(email)
+        finally:
+            for _ in workers:
+                self._queue.put(None)
+            for worker in workers:
+                worker.join()
+        self._update(status="done", finished_at=datetime.now().isoformat())
+        print(f"✅ Broadcast {self.id} finished: {self.sent} sent, {self.failed} failed")
+
+
+def start_broadcast(subject: str, body: str, **kwargs) -> Broadcast:
+    """백그라운드 스레드에서 발송 시작 후 바로 반환"""
+    broadcast = Broadcast(subject, body, **kwargs)
+    threading.Thread(
+        target=broadcast.run, name=f"broadcast-{broadcast.id[:8]}", daemon=True
+    ).start()
+    return broadcast
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def get_broadcast(broadcast_id: str, include_results: bool = False):
+    """
+    발송 진행 상황 (Redis, 어느 워커에서 시작한 발송이든 조회)
+    - include_results=True면 수신자별 결과, 아니면 실패한 수신자만
+    """
+    if not redis_client:
+        return None
+    try:
+        raw = redis_client.hgetall(PROGRESS_KEY.format(broadcast_id))
+        results = redis_client.hgetall(RESULTS_KEY.format(broadcast_id)) if raw else {}
+    except Exception as e:
+        print(f"⚠️ Broadcast {broadcast_id} progress read error: {e}")
+        return None
+    if not raw:
+        return None
+
+    stored = {_decode(k): _decode(v) for k, v in raw.items()}
+    progress = {"broadcast_id": broadcast_id}
+    for field in (
+        "status",
+        "jurisdiction",
+        "user_dept",
+        "total",
+        "sent",
+        "failed",
+        "created_at",
+        "finished_at",
+        "error",
+    ):
+        value = stored.get(field)
+        progress[field] = int(value) if field in COUNT_FIELDS and value else value
+
+    results = {_decode(k): _decode(v) for k, v in results.items()}
+    if include_results:
+        progress["results"] = results
+    else:
+        progress["failures"] = {
+            email: result for email, result in results.items() if result != "sent"
+        }
+    return progress
@@ -0,0 +1,203 @@
+# 도로 추천 계산 전용 실행기 (이벤트 루프 밖에서 추론 / 순위 계산, 동시 실행 수 제한)
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from fastapi import HTTPException
+from app.services.model_registry import load_active_model
+
+# 설정
+INFERENCE_EXECUTOR = os.getenv("INFERENCE_EXECUTOR", "thread")  # thread / process
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "2"))
+INFERENCE_MAX_PENDING = int(os.getenv("INFERENCE_MAX_PENDING", "32"))  # 실행 중 + 대기
+INFERENCE_QUEUE_TIMEOUT = float(os.getenv("INFERENCE_QUEUE_TIMEOUT", "5"))  # 대기 한도(초)
+INFERENCE_TIMEOUT = float(os.getenv("INFERENCE_TIMEOUT", "30"))
+INFERENCE_RETRY_AFTER = int(os.getenv("INFERENCE_RETRY_AFTER", "2"))
+
+class QueueTimeout(Exception):
+    """작업이 시작되기 전에 대기 한도를 넘김"""
+
+
+def _task(fn, args, submitted: float, queue_timeout: float):
+    """워커(스레드 또는 프로세스)에서 실행 - (결과, 대기 ms, 실행 ms)"""
+    started = time.time()
+    wait_ms = (started - submitted) * 1000
+    if wait_ms > queue_timeout * 1000:
+        raise QueueTimeout(f"waited {wait_ms:.0f}ms")
+    result = fn(*args)
+    return result, wait_ms, (time.time() - started) * 1000
+
+
+class WorkerModelMismatch(Exception):
+    """프로세스 워커가 읽은 모델 파일의 버전이 요청한 버전과 다름"""
+
+
+# --- 프로세스 워커의 모델 (프로세스마다 한 번 적재, 요청 버전이 바뀌면 다시 적재) ---
+_worker_model = None  # 이 프로세스가 적재한 ActiveModel (버전은 실제로 읽은 파일 기준)
+
+
+def _worker_predict(version: str, features):
+    global _worker_model
+    if _worker_model is None or _worker_model.version != version:
+        _worker_model = load_active_model()
+    if _worker_model.version != version:
+        # 요청 버전 이름으로 다른 모델을 쓰지 않도록 (파일이 그새 바뀌었거나 아직 안 바뀜)
+        raise WorkerModelMismatch(
+            f"worker loaded model {_worker_model.version}, requested {version}"
+        )
+    return _worker_model.predict(features)
+
+
+class InferenceExecutor:
+    """
+    추천 계산 작업을 별도 풀에서 실행하고 async 핸들러는 결과만 await
+    - 동시에 workers개만 실행, 실행 중 + 대기는 max_pending개까지 (넘으면 바로 503)
+    - queue_timeout 넘게 기다린 작업은 실행하지 않고 503
+    - 단계(fetch / infer / rank / persist)별 소요 시간 집계
+    - in_thread=True 작업은 프로세스 풀이어도 스레드에서 실행 (큰 인자를 피클링하지 않도록)
+    """
+
+    def __init__(
+        self,
+        kind: str = INFERENCE_EXECUTOR,
+        workers: int = INFERENCE_WORKERS,
+        max_pending: int = INFERENCE_MAX_PENDING,
+        queue_timeout: float = INFERENCE_QUEUE_TIMEOUT,
+        timeout: float = INFERENCE_TIMEOUT,
+    ):
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.timeout = timeout
+        self._executor = None
+        self._thread_executor = None  # 프로세스 풀일 때 in_thread 작업용
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+        # 통계
+        self._pending = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._stages = {}  # 단계 -> {count, total_ms, max_ms, total_wait_ms}
+
+    def _get_executor(self, in_thread: bool = False):
+        if in_thread and self.kind == "process":
+            if self._thread_executor is None:
+                with self._lock:
+                    if self._thread_executor is None:
+                        self._thread_executor = ThreadPoolExecutor(
+                            max_workers=self.workers, thread_name_prefix="inference"
+                        )
+            return self._thread_executor
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.workers, thread_name_prefix="inference"
+                        )
+        return self._executor
+
+    def _busy(self):
+        return HTTPException(
+            status_code=503,
+            detail="추천 요청이 많아 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(INFERENCE_RETRY_AFTER)},
+        )
+
+    def record(self, stage: str, run_ms: float, wait_ms: float = 0.0):
+        with self._lock:
+            entry = self._stages.setdefault(
+                stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "total_wait_ms": 0.0}
+            )
+            entry["count"] += 1
+            entry["total_ms"] += run_ms
+            entry["max_ms"] = max(entry["max_ms"], run_ms)
+            entry["total_wait_ms"] += wait_ms
+
+    def _release(self, _future):
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    async def run(
+        self, stage: str, fn, *args, timings: dict = None, in_thread: bool = False
+    ):
+        """풀에서 fn(*args) 실행 결과를 await (timings에 단계별 ms 기록)"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise self._busy()
+
+        with self._lock:
+            self._pending += 1
+        future = self._get_executor(in_thread).submit(
+            _task, fn, args, time.time(), self.queue_timeout
+        )
+        # 슬롯은 작업이 실제로 끝날 때 반납 (타임아웃으로 먼저 돌아가도 한도 유지)
+        future.add_done_callback(self._release)
+        try:
+            result, wait_ms, run_ms = await asyncio.wait_for(
+                asyncio.wrap_future(future), self.timeout
+            )
+        except (QueueTimeout, asyncio.TimeoutError):
+            with self._lock:
+                self._timeouts += 1
+            raise self._busy()
+
+        self.record(stage, run_ms, wait_ms)
+        if timings is not None:
+            timings[stage] = round(run_ms, 3)
+            timings[f"{stage}_wait"] = round(wait_ms, 3)
+        return result
+
+    async def predict(self, active, features, timings: dict = None):
+        """
+        모델 추론 (프로세스 풀이면 워커에 적재된 같은 버전 모델 사용)
+        워커가 읽은 파일이 다른 버전이면 이 요청은 요청 시점 모델로 스레드에서 추론
+        """
+        if self.kind == "process":
+            try:
+                return await self.run(
+                    "infer", _worker_predict, active.version, features, timings=timings
+                )
+            except WorkerModelMismatch as e:
+                print(f"⚠️ {e} - inferring in thread")
+        return await self.run(
+            "infer", active.predict, features, timings=timings, in_thread=True
+        )
+
+    def shutdown(self):
+        for executor in (self._executor, self._thread_executor):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self._thread_executor = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            stages = {
+                name: {
+                    "count": entry["count"],
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                    "avg_wait_ms": round(entry["total_wait_ms"] / entry["count"], 3),
+                }
+                for name, entry in self._stages.items()
+            }
+            return {
+                "kind": self.kind,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "stages": stages,
+            }
+
+
+inference_executor = InferenceExecutor()
@@ -0,0 +1,174 @@
+# 방문/에러 로그 일괄 기록 (응답 경로에서 DB 작업 제거)
+import os
+import queue
+import threading
+import time
+from app.database.mysql_connect import db_cursor
+
+# 설정
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "200"))
+LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "2"))
+
+
+class BufferedLogWriter:
+    """
+    크기 제한 큐에 로그 행을 쌓아두고 백그라운드 스레드에서 executemany로 일괄 INSERT
+    - batch_size만큼 모이거나 flush_interval(초)이 지나면 기록
+    - 큐가 가득 차면 요청을 막지 않고 행을 버림 (dropped 카운트)
+    - stop() 시 남은 행을 모두 기록
+    """
+
+    def __init__(
+        self,
+        name: str,
+        query: str,
+        max_queue: int = LOG_QUEUE_SIZE,
+        batch_size: int = LOG_BATCH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ):
+        self.name = name
+        self.query = query
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._flush_hooks = []
+
+        # 통계
+        self._enqueued = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_flush_ms = 0.0
+
+    def add_flush_hook(self, hook):
+        """꺼낸 배치(행 리스트)를 받아 추가 처리할 함수 등록 (DB 기록 성공 여부와 무관)"""
+        self._flush_hooks.append(hook)
+
+    def put(self, row: tuple) -> bool:
+        """행 추가 (블로킹 없음) - 큐가 가득 차면 False"""
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+        with self._lock:
+            self._enqueued += 1
+        return True
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"log-writer-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """스레드 종료 후 큐에 남은 행 모두 기록"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush_pending()
+
+    def flush_pending(self):
+        """큐에 남은 행을 batch_size 단위로 즉시 기록"""
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return
+            self._write(batch)
+
+    def _drain(self, limit: int) -> list:
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and not self._stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=min(remaining, 0.5)))
+                except queue.Empty:
+                    continue
+                batch.extend(self._drain(self.batch_size - len(batch)))
+            if batch:
+                self._write(batch)
+
+    def _write(self, rows: list):
+        start = time.perf_counter()
+        try:
+            with db_cursor(commit=True) as cursor:
+                cursor.executemany(self.query, rows)
+        except Exception as e:
+            print(f"[{self.name} 로그 일괄 기록 실패] {len(rows)}건: {e}")
+            with self._lock:
+                self._failed += len(rows)
+        else:
+            with self._lock:
+                self._flushed += len(rows)
+                self._batches += 1
+                self._last_flush_ms = round(
+                    (time.perf_counter() - start) * 1000, 3
+                )
+
+        for hook in self._flush_hooks:
+            try:
+                hook(rows)
+            except Exception as e:
+                print(f"[{self.name} 로그 후처리 실패] {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "enqueued": self._enqueued,
+                "dropped": self._dropped,
+                "flushed": self._flushed,
+                "failed": self._failed,
+                "batches": self._batches,
+                "last_flush_ms": self._last_flush_ms,
+            }
+
+
+visit_log_writer = BufferedLogWriter(
+    "visit",
+    "INSERT INTO visit_logs (user_email, route, ip_address, visit_time) VALUES (%s, %s, %s, %s)",
+)
+error_log_writer = BufferedLogWriter(
+    "error",
+    "INSERT INTO error_logs (user_email, route, status_code, created_at) VALUES (%s, %s, %s, %s)",
+)
+
+
+def start_log_writers():
+    visit_log_writer.start()
+    error_log_writer.start()
+
+
+def stop_log_writers():
+    visit_log_writer.stop()
+    error_log_writer.stop()
+
+
+def log_writer_stats() -> dict:
+    return {
+        "visit_logs": visit_log_writer.stats(),
+        "error_logs": error_log_writer.stats(),
+    }
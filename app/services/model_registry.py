@@ -0,0 +1,233 @@
+# 도로 추천 모델 관리 (지연 적재 / 시작 시 백그라운드 적재 / 무중단 교체)
+import threading
+import time
+from datetime import datetime
+import numpy as np
+import redis
+from app.core.redis_events import subscribe, publish
+from app.database.mysql_connect import db_cursor
+from app.models.model import load_model, predict
+from app.services.road_features import feature_store, FEATURE_COLUMNS
+from app.services.road_scores import road_scores, model_fingerprint
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+WARMUP_ROWS = 32  # 적재 직후 시험 추론할 도로 수
+
+# 한 워커에서 교체하면 모든 워커가 같은 모델 파일을 다시 읽도록
+# (버전이 다르면 road_model_scores 저장 시 서로의 점수를 지움)
+RELOAD_CHANNEL = "model_reloaded"  # data: 교체된 모델 버전
+ACTIVE_VERSION_KEY = "model:active_version"  # 구독이 끊긴 동안 놓친 교체 확인용
+
+# predicts_log.model_version (추천에 사용한 모델 버전) - 컬럼 추가는
+# app/database/migrations/001_predicts_log_model_version.sql, 시작 시에는 확인만
+LOG_COLUMN_CHECK = """
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE()
+      AND TABLE_NAME = 'predicts_log' AND COLUMN_NAME = 'model_version'
+"""
+
+
+class ActiveModel:
+    """한 번 적재한 모델 (교체만 하고 수정하지 않음)"""
+
+    def __init__(self, model, scaler, version: str):
+        self.model = model
+        self.scaler = scaler
+        self.version = version
+        self.loaded_at = datetime.now().isoformat()
+        self.load_ms = None
+        self.warmup_ms = None
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return predict(self.model, self.scaler, features)
+
+
+def _warm_up(candidate: ActiveModel):
+    if feature_store.loaded:
+        sample = feature_store.snapshot.matrix[:WARMUP_ROWS]
+    else:
+        sample = np.zeros((1, len(FEATURE_COLUMNS)))
+    started = time.perf_counter()
+    result = np.asarray(candidate.predict(sample))
+    if len(result) != len(sample):
+        raise ValueError(
+            f"warm-up returned {len(result)} scores for {len(sample)} rows"
+        )
+    candidate.warmup_ms = round((time.perf_counter() - started) * 1000, 3)
+
+
+def load_active_model(loader=load_model) -> ActiveModel:
+    """모델 + 스케일러 적재 후 시험 추론까지 마친 ActiveModel"""
+    started = time.perf_counter()
+    model, scaler = loader()
+    candidate = ActiveModel(model, scaler, model_fingerprint(model, scaler))
+    candidate.load_ms = round((time.perf_counter() - started) * 1000, 3)
+    _warm_up(candidate)
+    return candidate
+
+
+class ModelRegistry:
+    """
+    - 처음 필요할 때(또는 시작 시 백그라운드로) 적재, 적재 직후 시험 추론
+    - reload(): 새 모델을 옆에서 적재/시험 추론한 뒤 참조만 교체
+      (진행 중인 요청은 시작할 때 가져간 모델로 끝까지 처리)
+      교체 후 다른 워커에도 알려 같은 파일을 다시 읽게 함
+    """
+
+    def __init__(self, loader=load_model, scores=road_scores):
+        self._loader = loader
+        self._scores = scores
+        self._active = None
+        self._lock = threading.Lock()  # 적재는 한 번에 하나만
+        self.reloads = 0
+        self.last_error = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._active is not None
+
+    @property
+    def version(self):
+        active = self._active
+        return active.version if active else None
+
+    def active(self) -> ActiveModel:
+        """현재 모델 (없으면 적재)"""
+        self.ensure_loaded()
+        return self._active
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        return self.active().predict(features)
+
+    def _activate(self, candidate: ActiveModel):
+        self._active = candidate
+        self.last_error = None
+        print(
+            f"Model {candidate.version} active "
+            f"(load {candidate.load_ms}ms, warm-up {candidate.warmup_ms}ms)"
+        )
+        # 도로별 점수 재계산 (끝나기 전까지는 요청에서 새 모델로 직접 추론)
+        self._scores.set_model(
+            candidate.model, candidate.scaler, predict, version=candidate.version
+        )
+
+    def ensure_loaded(self):
+        if self._active is not None:
+            return
+        with self._lock:
+            if self._active is None:
+                try:
+                    self._activate(load_active_model(self._loader))
+                except Exception as e:
+                    self.last_error = str(e)
+                    raise
+
+    def reload(self, announce: bool = True) -> dict:
+        """
+        모델 파일을 다시 읽어 교체 - 적재/시험 추론이 실패하면 기존 모델 유지
+        announce=True면 성공 후 다른 워커에도 교체를 알림
+        """
+        with self._lock:
+            previous = self.version
+            try:
+                candidate = load_active_model(self._loader)
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"⚠️ Model reload failed, keeping {previous}: {e}")
+                raise
+            self._activate(candidate)
+            self.reloads += 1
+        if announce:
+            self._announce(candidate.version)
+        return {"previous_version": previous, **self.stats()}
+
+    def _announce(self, version: str):
+        if redis_client is not None:
+            try:
+                redis_client.set(ACTIVE_VERSION_KEY, version)
+            except Exception as e:
+                print(f"Redis error: {e}")
+        publish(RELOAD_CHANNEL, version)
+
+    def sync_version(self, version: str):
+        """
+        다른 워커가 교체한 버전에 맞춤 (아직 적재 전이면 첫 적재 때 최신 파일을 읽으므로 생략)
+        다시 읽은 파일의 버전이 다르면 (파일 배포 지연 등) 경고만 남김
+        """
+        if not version or not self.loaded or version == self.version:
+            return
+        try:
+            self.reload(announce=False)
+        except Exception:
+            return
+        if self.version != version:
+            print(f"⚠️ Model reloaded as {self.version}, but {version} was announced")
+
+    def _on_reloaded(self, version: str):
+        # 적재 + 시험 추론은 오래 걸릴 수 있어 이벤트 구독 스레드를 막지 않도록 별도 스레드에서
+        threading.Thread(
+            target=self.sync_version, args=(version,), name="model-sync", daemon=True
+        ).start()
+
+    def _on_connect(self):
+        if redis_client is None:
+            return
+        try:
+            version = redis_client.get(ACTIVE_VERSION_KEY)
+        except Exception as e:
+            print(f"Redis error: {e}")
+            return
+        if version:
+            self._on_reloaded(version.decode() if isinstance(version, bytes) else version)
+
+    def check_log_column(self):
+        """predicts_log.model_version 컬럼 확인 (없으면 마이그레이션 안내만, DDL은 실행하지 않음)"""
+        with db_cursor() as cursor:
+            cursor.execute(LOG_COLUMN_CHECK)
+            if not cursor.fetchone()[0]:
+                print(
+                    "⚠️ predicts_log.model_version is missing - apply "
+                    "app/database/migrations/001_predicts_log_model_version.sql"
+                )
+
+    def _startup(self):
+        try:
+            self.check_log_column()
+        except Exception as e:
+            print(f"⚠️ predicts_log.model_version check failed: {e}")
+        try:
+            self.ensure_loaded()
+        except Exception as e:
+            print(f"⚠️ Model load failed: {e}")
+
+    def start_background_load(self):
+        """앱 시작 시 호출 - 요청 처리를 막지 않고 백그라운드에서 적재"""
+        threading.Thread(target=self._startup, name="model-load", daemon=True).start()
+
+    def stats(self) -> dict:
+        active = self._active
+        stats = {
+            "loaded": active is not None,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+        }
+        if active is not None:
+            stats.update(
+                version=active.version,
+                loaded_at=active.loaded_at,
+                load_ms=active.load_ms,
+                warmup_ms=active.warmup_ms,
+            )
+        return stats
+
+
+model_registry = ModelRegistry()
+
+subscribe(
+    RELOAD_CHANNEL, model_registry._on_reloaded, on_connect=model_registry._on_connect
+)
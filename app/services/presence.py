@@ -0,0 +1,98 @@
+# 실시간 접속자 (마지막 활동 시각 기반 sliding window)
+import os
+import threading
+import time
+from datetime import datetime
+import redis
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 설정
+PRESENCE_KEY = "presence:last_seen"  # sorted set (member: 이메일, score: 마지막 활동 unix time)
+PRESENCE_WINDOW_MINUTES = int(os.getenv("PRESENCE_WINDOW_MINUTES", "5"))
+PRESENCE_TOUCH_INTERVAL = float(os.getenv("PRESENCE_TOUCH_INTERVAL", "30"))
+PRESENCE_RETENTION_HOURS = int(os.getenv("PRESENCE_RETENTION_HOURS", "24"))
+
+# 유저별 마지막 Redis 기록 시각 (프로세스 내 쓰기 제한용)
+_last_touch = {}
+_lock = threading.Lock()
+
+
+def _prune_local(now: float):
+    """쓰기 제한 간격이 지난 항목 정리 (로컬 dict 무한 증가 방지)"""
+    expired = [
+        email
+        for email, touched in _last_touch.items()
+        if now - touched >= PRESENCE_TOUCH_INTERVAL
+    ]
+    for email in expired:
+        del _last_touch[email]
+
+
+def touch(email: str, force: bool = False) -> bool:
+    """
+    유저 활동 기록 - PRESENCE_TOUCH_INTERVAL 안에 이미 기록했으면 건너뜀
+    기록할 때 보관 기간(PRESENCE_RETENTION_HOURS)이 지난 항목도 함께 정리
+    """
+    if not email or redis_client is None:
+        return False
+
+    now = time.time()
+    with _lock:
+        last = _last_touch.get(email)
+        if not force and last is not None and now - last < PRESENCE_TOUCH_INTERVAL:
+            return False
+        _last_touch[email] = now
+        if len(_last_touch) > 10000:
+            _prune_local(now)
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zadd(PRESENCE_KEY, {email: now})
+        pipe.zremrangebyscore(
+            PRESENCE_KEY, "-inf", now - PRESENCE_RETENTION_HOURS * 3600
+        )
+        pipe.execute()
+    except Exception as e:
+        print(f"[접속자 기록 실패] {e}")
+        with _lock:
+            _last_touch.pop(email, None)
+        return False
+    return True
+
+
+def remove(email: str):
+    """로그아웃 시 접속자에서 제거"""
+    with _lock:
+        _last_touch.pop(email, None)
+    if not email or redis_client is None:
+        return
+    try:
+        redis_client.zrem(PRESENCE_KEY, email)
+    except Exception as e:
+        print(f"[접속자 제거 실패] {e}")
+
+
+def active_count(minutes: int = PRESENCE_WINDOW_MINUTES) -> int:
+    """최근 N분 안에 활동한 유저 수"""
+    return redis_client.zcount(PRESENCE_KEY, time.time() - minutes * 60, "+inf")
+
+
+def active_users(minutes: int = PRESENCE_WINDOW_MINUTES) -> list:
+    """최근 N분 안에 활동한 유저 이메일 (최근 활동 순)"""
+    emails = redis_client.zrevrangebyscore(
+        PRESENCE_KEY, "+inf", time.time() - minutes * 60
+    )
+    return [e.decode() if isinstance(e, bytes) else e for e in emails]
+
+
+def last_seen(email: str):
+    """유저의 마지막 활동 시각 (기록이 없으면 None)"""
+    score = redis_client.zscore(PRESENCE_KEY, email)
+    if score is None:
+        return None
+    return datetime.fromtimestamp(score)
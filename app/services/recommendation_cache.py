@@ -0,0 +1,162 @@
+# 도로 추천 결과 캐시 (사용자 공통 - 지역 + 양자화된 가중치 + 모델/데이터 버전 기준)
+import asyncio
+import json
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+import redis
+from app.services.road_features import feature_store
+from app.services.road_ranking import weight_vector
+from app.services.road_scores import road_scores
+
+# 캐시는 없어도 되는 경로라 Redis가 느리면 짧게 끊고 미스로 처리
+RECOMMEND_CACHE_REDIS_TIMEOUT = float(os.getenv("RECOMMEND_CACHE_REDIS_TIMEOUT", "0.2"))
+
+try:
+    redis_client = redis.StrictRedis(
+        host="ongil_redis",
+        port=6379,
+        db=0,
+        socket_timeout=RECOMMEND_CACHE_REDIS_TIMEOUT,
+        socket_connect_timeout=RECOMMEND_CACHE_REDIS_TIMEOUT,
+    )
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 설정
+RECOMMEND_CACHE_SIZE = int(os.getenv("RECOMMEND_CACHE_SIZE", "2000"))
+RECOMMEND_CACHE_TTL = int(os.getenv("RECOMMEND_CACHE_TTL", "900"))
+# 정규화된 가중치를 이 단위로 반올림 (0.01이면 가중치 비율이 1%p 이내로 같으면 같은 결과)
+RECOMMEND_CACHE_PRECISION = float(os.getenv("RECOMMEND_CACHE_PRECISION", "0.01"))
+CACHE_KEY = "rec_cache:{}:{}:{}:{}"  # 데이터 버전, 모델 버전, 지역, 가중치
+
+_local = OrderedDict()  # key -> 추천 결과
+_lock = threading.Lock()
+_stats = {
+    "local_hits": 0,
+    "redis_hits": 0,
+    "misses": 0,
+    "evictions": 0,
+    "invalidations": 0,
+}
+
+
+def _count(name: str):
+    with _lock:
+        _stats[name] += 1
+
+
+def quantize_weights(weights) -> np.ndarray:
+    """정규화된 가중치 벡터를 RECOMMEND_CACHE_PRECISION 단위로 반올림"""
+    steps = np.round(weight_vector(weights) / RECOMMEND_CACHE_PRECISION)
+    return steps * RECOMMEND_CACHE_PRECISION
+
+
+def cache_key(region_name: str, data_version, model_version, weights: np.ndarray) -> str:
+    steps = np.round(weights / RECOMMEND_CACHE_PRECISION).astype(int)
+    return CACHE_KEY.format(
+        data_version, model_version, region_name, ",".join(map(str, steps))
+    )
+
+
+def _get_local(key: str):
+    with _lock:
+        roads = _local.get(key)
+        if roads is not None:
+            _local.move_to_end(key)
+            _stats["local_hits"] += 1
+        return roads
+
+
+def _get_redis(key: str):
+    if redis_client is not None:
+        try:
+            cached = redis_client.get(key)
+        except Exception as e:
+            print(f"Redis error: {e}")
+            cached = None
+        if cached:
+            roads = json.loads(cached)
+            _put_local(key, roads)
+            _count("redis_hits")
+            return roads
+
+    _count("misses")
+    return None
+
+
+def get_cached(key: str):
+    """프로세스 내 캐시 → Redis 순서로 조회, 없으면 None"""
+    roads = _get_local(key)
+    if roads is not None:
+        return roads
+    return _get_redis(key)
+
+
+async def get_cached_async(key: str):
+    """get_cached의 async 버전 - Redis 조회만 스레드에서 (이벤트 루프를 막지 않음)"""
+    roads = _get_local(key)
+    if roads is not None:
+        return roads
+    if redis_client is None:
+        _count("misses")
+        return None
+    return await asyncio.to_thread(_get_redis, key)
+
+
+def _put_local(key: str, roads: list):
+    with _lock:
+        _local[key] = roads
+        _local.move_to_end(key)
+        while len(_local) > RECOMMEND_CACHE_SIZE:
+            _local.popitem(last=False)
+            _stats["evictions"] += 1
+
+
+def _set_redis(key: str, roads: list):
+    try:
+        redis_client.setex(
+            key, RECOMMEND_CACHE_TTL, json.dumps(roads, ensure_ascii=False)
+        )
+    except Exception as e:
+        print(f"Redis error: {e}")
+
+
+def set_cached(key: str, roads: list):
+    _put_local(key, roads)
+    if redis_client is not None:
+        _set_redis(key, roads)
+
+
+async def set_cached_async(key: str, roads: list):
+    """set_cached의 async 버전 - Redis 저장만 스레드에서"""
+    _put_local(key, roads)
+    if redis_client is not None:
+        await asyncio.to_thread(_set_redis, key, roads)
+
+
+def invalidate_all(*_):
+    """
+    도로 데이터 / 모델이 바뀌면 호출 - 이 워커의 캐시를 비움
+    (Redis 키에는 버전이 들어 있어 이전 결과는 조회되지 않고 TTL로 만료)
+    """
+    with _lock:
+        _local.clear()
+        _stats["invalidations"] += 1
+
+
+def recommend_cache_stats() -> dict:
+    with _lock:
+        stats = dict(_stats)
+        stats["local_size"] = len(_local)
+    lookups = stats["local_hits"] + stats["redis_hits"] + stats["misses"]
+    stats["hit_rate"] = (
+        round((stats["local_hits"] + stats["redis_hits"]) / lookups, 4) if lookups else None
+    )
+    return stats
+
+
+feature_store.add_listener(invalidate_all)
+road_scores.add_listener(invalidate_all)
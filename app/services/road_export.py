@@ -0,0 +1,158 @@
+# 도로 추천 결과 파일 생성 (메모리에서 CSV / CSV.gz / XLSX)
+import csv
+import gzip
+import io
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from xml.sax.saxutils import escape
+
+EXPORT_CACHE_SIZE = int(os.getenv("EXPORT_CACHE_SIZE", "64"))
+
+EXPORT_COLUMNS = [
+    "rds_id",
+    "road_name",
+    "rbp",
+    "rep",
+    "rd_slope",
+    "acc_occ",
+    "acc_sc",
+    "rd_fr",
+    "pred_idx",
+]
+
+# 형식 -> (확장자, MIME 타입)
+EXPORT_FORMATS = {
+    "csv": ("csv", "text/csv"),
+    "csv.gz": ("csv.gz", "application/gzip"),
+    "xlsx": (
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+}
+
+_cache = OrderedDict()  # (log_id, fmt) -> (파일명, bytes, MIME)
+_lock = threading.Lock()
+_stats = {"hits": 0, "builds": 0}
+
+
+def _rows(roads: list):
+    yield EXPORT_COLUMNS
+    for road in roads:
+        yield [road[column] for column in EXPORT_COLUMNS]
+
+
+def to_csv(roads: list) -> bytes:
+    buffer = io.StringIO(newline="")
+    csv.writer(buffer).writerows(_rows(roads))
+    return buffer.getvalue().encode("utf-8")
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _cell(ref: str, value) -> str:
+    if isinstance(value, bool) or value is None:
+        value = "" if value is None else str(value)
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    return f'<c r="{ref}" t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+
+def to_xlsx(roads: list, sheet_name: str = "도로추천") -> bytes:
+    """시트 하나짜리 최소 XLSX (inline string 사용, 외부 라이브러리 없이)"""
+    rows_xml = []
+    for r, row in enumerate(_rows(roads), start=1):
+        cells = "".join(
+            _cell(f"{_column_letter(c)}{r}", value) for c, value in enumerate(row)
+        )
+        rows_xml.append(f'<row r="{r}">{cells}</row>')
+
+    files = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            "</Types>"
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/workbook.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{escape(sheet_name)}" sheetId="1" r:id="rId1"/></sheets>'
+            "</workbook>"
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/worksheets/sheet1.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f"<sheetData>{''.join(rows_xml)}</sheetData>"
+            "</worksheet>"
+        ),
+    }
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def build_export(log_id: int, rds_rg: str, roads: list, fmt: str = "csv"):
+    """
+    추천 결과 파일 (파일명, bytes, MIME) - log_id + 형식별로 캐시
+    디스크에 쓰지 않으므로 같은 지역을 동시에 승인해도 서로 덮어쓰지 않음
+    """
+    key = (log_id, fmt)
+    with _lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return cached
+
+    extension, mimetype = EXPORT_FORMATS[fmt]
+    if fmt == "xlsx":
+        data = to_xlsx(roads)
+    else:
+        data = to_csv(roads)
+        if fmt == "csv.gz":
+            data = gzip.compress(data)
+    export = (f"{rds_rg}_도로추천.{extension}", data, mimetype)
+
+    with _lock:
+        _stats["builds"] += 1
+        _cache[key] = export
+        while len(_cache) > EXPORT_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return export
+
+
+def export_cache_stats() -> dict:
+    with _lock:
+        return {
+            **_stats,
+            "entries": len(_cache),
+            "bytes": sum(len(data) for _, data, _ in _cache.values()),
+        }
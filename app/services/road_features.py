@@ -0,0 +1,224 @@
+# 도로 특성 저장소 (seoul_info를 메모리에 NumPy 컬럼 배열로 적재, rds_rg별 구간 조회)
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+import numpy as np
+from app.database.mysql_connect import db_cursor
+
+FEATURE_STORE_CHECK_MINUTES = int(os.getenv("FEATURE_STORE_CHECK_MINUTES", "10"))
+
+# 모델 입력 순서
+FEATURE_COLUMNS = ["rd_slope", "acc_occ", "acc_sc", "rd_fr", "traff"]
+TEXT_COLUMNS = ["rds_id", "road_name", "rbp", "rep"]
+# 추천 결과 컬럼 순서 (기존 쿼리 순서와 동일)
+ROAD_COLUMNS = TEXT_COLUMNS + FEATURE_COLUMNS
+
+LOAD_QUERY = f"""
+    SELECT rds_rg, {", ".join(ROAD_COLUMNS)}
+    FROM seoul_info
+    WHERE rds_rg IS NOT NULL
+"""
+VERSION_QUERY = "CHECKSUM TABLE seoul_info"
+
+
+def _numeric_array(values: list) -> np.ndarray:
+    """정수 컬럼은 정수 그대로, NULL이 섞이면 float(NaN)로"""
+    array = np.asarray(values)
+    if array.dtype == object:
+        array = np.asarray(
+            [np.nan if v is None else v for v in values], dtype=np.float64
+        )
+    return array
+
+
+class RegionFeatures:
+    """한 지역(rds_rg)의 도로 데이터 - 전체 배열의 slice (복사 없음)"""
+
+    def __init__(self, snapshot, start: int, stop: int):
+        self.snapshot = snapshot
+        self.start = start
+        self.stop = stop
+        self.columns = {
+            name: array[start:stop] for name, array in snapshot.columns.items()
+        }
+        self.matrix = snapshot.matrix[start:stop]  # (도로 수, len(FEATURE_COLUMNS))
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def __getstate__(self):
+        # 프로세스 풀로 보낼 때 전체 snapshot은 빼고 이 지역 구간만
+        return {**self.__dict__, "snapshot": None}
+
+
+class FeatureSnapshot:
+    """한 번 적재한 seoul_info (교체만 하고 수정하지 않음)"""
+
+    def __init__(self, rows: list, version):
+        rows.sort(key=lambda row: row[0])
+        self.version = version
+        self.loaded_at = datetime.now().isoformat()
+        self.regions = {}  # rds_rg -> (start, stop)
+        for i, row in enumerate(rows):
+            start, _ = self.regions.get(row[0], (i, i))
+            self.regions[row[0]] = (start, i + 1)
+        self._region_names = list(self.regions)  # 시작 위치 순
+        self._region_starts = np.array(
+            [start for start, _ in self.regions.values()], dtype=np.intp
+        )
+
+        by_column = list(zip(*rows)) if rows else [()] * (len(ROAD_COLUMNS) + 1)
+        self.columns = {}
+        for name, values in zip(ROAD_COLUMNS, by_column[1:]):
+            if name in FEATURE_COLUMNS:
+                self.columns[name] = _numeric_array(list(values))
+            else:
+                self.columns[name] = np.asarray(values, dtype=object)
+        self.matrix = np.ascontiguousarray(
+            np.column_stack(
+                [self.columns[name].astype(np.float64) for name in FEATURE_COLUMNS]
+            )
+        )
+
+    def region(self, rds_rg: str):
+        bounds = self.regions.get(rds_rg)
+        if bounds is None:
+            return None
+        return RegionFeatures(self, *bounds)
+
+    def region_names(self, rows: np.ndarray) -> list:
+        """행 번호 → rds_rg (행이 rds_rg 순으로 정렬되어 있으므로 이진 탐색)"""
+        positions = np.searchsorted(self._region_starts, rows, side="right") - 1
+        return [self._region_names[p] for p in positions]
+
+    def memory_bytes(self) -> dict:
+        numeric = sum(
+            self.columns[name].nbytes for name in FEATURE_COLUMNS
+        ) + self.matrix.nbytes
+        text = sum(
+            self.columns[name].nbytes
+            + sum(sys.getsizeof(v) for v in self.columns[name])
+            for name in TEXT_COLUMNS
+        )
+        index = (
+            sys.getsizeof(self.regions)
+            + sum(sys.getsizeof(k) for k in self.regions)
+            + sys.getsizeof(self._region_names)
+            + self._region_starts.nbytes
+        )
+        return {
+            "numeric": numeric,
+            "text": text,
+            "index": index,
+            "total": numeric + text + index,
+        }
+
+
+class RoadFeatureStore:
+    """
+    seoul_info 메모리 저장소
+    - 첫 사용 시 또는 스케줄러에서 적재, CHECKSUM이 바뀌었을 때만 다시 적재
+    - 수동 재적재: reload()
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._listeners = []
+        self.last_check = None
+        self.last_error = None
+        self.last_load_ms = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    @property
+    def snapshot(self):
+        """현재 snapshot (없으면 적재)"""
+        self.ensure_loaded()
+        return self._snapshot
+
+    def add_listener(self, callback):
+        """새 snapshot을 적재할 때마다 callback(snapshot) 호출"""
+        self._listeners.append(callback)
+
+    def _version(self, cursor):
+        cursor.execute(VERSION_QUERY)
+        row = cursor.fetchone()
+        return row[1] if row else None
+
+    def reload(self, force: bool = True) -> bool:
+        """다시 적재 (force=False면 버전이 바뀐 경우만) - 적재했으면 True"""
+        with self._lock:
+            started = time.perf_counter()
+            try:
+                with db_cursor() as cursor:
+                    version = self._version(cursor)
+                    self.last_check = datetime.now().isoformat()
+                    current = self._snapshot
+                    if not force and current is not None and current.version == version:
+                        return False
+                    cursor.execute(LOAD_QUERY)
+                    rows = cursor.fetchall()
+                self._snapshot = FeatureSnapshot(rows, version)
+                self.last_error = None
+                self.last_load_ms = round((time.perf_counter() - started) * 1000, 3)
+                print(f"Road feature store loaded ({len(rows)} roads, version {version})")
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"⚠️ Road feature store load failed: {e}")
+                if self._snapshot is None:
+                    raise
+                return False
+
+        snapshot = self._snapshot
+        for callback in self._listeners:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"⚠️ Road feature store listener failed: {e}")
+        return True
+
+    def refresh(self):
+        """스케줄러용 - 버전이 바뀌었을 때만 재적재, 오류는 기록만"""
+        try:
+            self.reload(force=False)
+        except Exception:
+            pass
+
+    def ensure_loaded(self):
+        if self._snapshot is None:
+            self.reload(force=False)
+
+    def region(self, rds_rg: str):
+        """지역 도로 데이터 (없는 지역이면 None)"""
+        self.ensure_loaded()
+        return self._snapshot.region(rds_rg)
+
+    def has_region(self, rds_rg: str) -> bool:
+        self.ensure_loaded()
+        return rds_rg in self._snapshot.regions
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        stats = {
+            "loaded": snapshot is not None,
+            "last_check": self.last_check,
+            "last_error": self.last_error,
+            "last_load_ms": self.last_load_ms,
+        }
+        if snapshot is not None:
+            stats.update(
+                version=snapshot.version,
+                loaded_at=snapshot.loaded_at,
+                roads=len(snapshot.matrix),
+                regions=len(snapshot.regions),
+                memory_bytes=snapshot.memory_bytes(),
+            )
+        return stats
+
+
+feature_store = RoadFeatureStore()
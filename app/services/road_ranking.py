@@ -0,0 +1,188 @@
+# 도로 추천 점수 계산 / 상위 k개 선택 (NumPy, 선택된 k개만 dict로 변환)
+import heapq
+import os
+import numpy as np
+from app.services.road_features import FEATURE_COLUMNS, ROAD_COLUMNS
+
+MODEL_SCORE_WEIGHT = 0.3  # pred_idx에서 모델 점수 비중
+DEFAULT_TOP_K = 10
+CITYWIDE_CHUNK_SIZE = int(os.getenv("CITYWIDE_CHUNK_SIZE", "20000"))  # 한 번에 점수 계산할 도로 수
+
+# UserWeight 필드 (FEATURE_COLUMNS 순서)
+WEIGHT_FIELDS = [f"{name}_weight" for name in FEATURE_COLUMNS]
+
+
+def weight_vector(weights) -> np.ndarray:
+    """UserWeight(또는 같은 필드를 가진 객체) → 합이 1인 가중치 벡터"""
+    vector = np.array(
+        [getattr(weights, field) for field in WEIGHT_FIELDS], dtype=np.float64
+    )
+    total = vector.sum()
+    if total > 0:
+        return vector / total
+    return np.full(len(vector), 1 / len(vector))
+
+
+def raw_scores(
+    matrix: np.ndarray, model_scores: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """정규화 전 pred_idx = 모델 점수 * 0.3 + 특성 · 가중치"""
+    scores = matrix @ weights
+    scores += MODEL_SCORE_WEIGHT * model_scores
+    return scores
+
+
+def normalize(scores: np.ndarray, low: float = None, high: float = None) -> np.ndarray:
+    """min-max 정규화 (0~100), 범위가 0이면 모두 50"""
+    if low is None:
+        low, high = _bounds(scores)
+    if high - low > 0:
+        return (scores - low) / (high - low) * 100
+    return np.full(len(scores), 50.0)
+
+
+def _bounds(scores: np.ndarray):
+    valid = scores[~np.isnan(scores)]
+    if not len(valid):
+        return 0.0, 0.0
+    return valid.min(), valid.max()
+
+
+def top_k(scores: np.ndarray, k: int = DEFAULT_TOP_K) -> np.ndarray:
+    """점수 내림차순 상위 k개 행 번호 (NaN은 맨 뒤)"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    keys = np.where(np.isnan(scores), np.inf, -scores)
+    if k < len(keys):
+        picked = np.argpartition(keys, k - 1)[:k]
+    else:
+        picked = np.arange(len(keys))
+    return picked[np.argsort(keys[picked], kind="stable")]
+
+
+def materialize(columns: dict, rows: np.ndarray, extra: dict) -> list:
+    """
+    선택된 행만 응답용 dict로 (기존 응답과 같은 키 순서)
+    extra: 추가 컬럼 이름 -> rows 순서에 맞춘 값 배열
+    """
+    keys = ROAD_COLUMNS + list(extra)
+    values = [columns[name][rows].tolist() for name in ROAD_COLUMNS]
+    values += [np.asarray(array).tolist() for array in extra.values()]
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def rank_region(region, model_scores: np.ndarray, weights, k: int = DEFAULT_TOP_K) -> list:
+    """
+    지역 도로 추천 상위 k개 (정규화는 지역 안에서)
+    weights: UserWeight 등 가중치 객체 또는 이미 정규화된 가중치 벡터
+    """
+    if not isinstance(weights, np.ndarray):
+        weights = weight_vector(weights)
+    model_scores = np.asarray(model_scores, dtype=np.float64)
+    scores = raw_scores(region.matrix, model_scores, weights)
+    rows = top_k(scores, k)
+    return materialize(
+        region.columns,
+        rows,
+        {
+            "예측점수": model_scores[rows],
+            "pred_idx": normalize(scores[rows], *_bounds(scores)),
+        },
+    )
+
+
+def rank_batch(regions: list, model_scores: list, profiles: list, k: int = DEFAULT_TOP_K) -> list:
+    """
+    여러 지역 x 여러 가중치 프로필을 한 번의 행렬 곱으로 계산
+    결과[i][j] = regions[i]를 profiles[j]로 계산한 상위 k개 (정규화는 지역/프로필별)
+    """
+    weights = np.stack([weight_vector(profile) for profile in profiles], axis=1)
+    model_scores = [np.asarray(s, dtype=np.float64) for s in model_scores]
+    scores = np.concatenate([region.matrix for region in regions]) @ weights
+    scores += MODEL_SCORE_WEIGHT * np.concatenate(model_scores)[:, None]
+
+    results = []
+    offset = 0
+    for region, region_model in zip(regions, model_scores):
+        block = scores[offset:offset + len(region)]
+        offset += len(region)
+        ranked = []
+        for j in range(block.shape[1]):
+            column = block[:, j]
+            rows = top_k(column, k)
+            ranked.append(
+                materialize(
+                    region.columns,
+                    rows,
+                    {
+                        "예측점수": region_model[rows],
+                        "pred_idx": normalize(column[rows], *_bounds(column)),
+                    },
+                )
+            )
+        results.append(ranked)
+    return results
+
+
+def rank_citywide(
+    snapshot,
+    model_scores: np.ndarray,
+    weights,
+    k: int,
+    regions: list = None,
+    chunk_size: int = CITYWIDE_CHUNK_SIZE,
+) -> dict:
+    """
+    서울 전체(또는 regions로 지정한 지역들) 도로 중 상위 k개
+    - chunk 단위로 점수 계산, chunk별 상위 k개만 heap에 병합 (메모리는 k + chunk 크기)
+    - 정규화는 대상 전체의 min/max 기준 (NaN 점수는 제외)
+    """
+    w = weight_vector(weights)
+    if regions is None:
+        ranges = [(0, len(snapshot.matrix))]
+    else:
+        ranges = sorted({snapshot.regions[r] for r in regions if r in snapshot.regions})
+
+    heap = []  # (점수, -행 번호) 최소 heap - 점수가 같으면 앞 행 우선
+    low, high = np.inf, -np.inf
+    scored = 0
+    for start, stop in ranges:
+        for chunk_start in range(start, stop, chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, stop)
+            scores = raw_scores(
+                snapshot.matrix[chunk_start:chunk_stop],
+                model_scores[chunk_start:chunk_stop],
+                w,
+            )
+            valid = scores[~np.isnan(scores)]
+            if not len(valid):
+                continue
+            scored += len(valid)
+            low, high = min(low, valid.min()), max(high, valid.max())
+            for row in top_k(scores, k):
+                score = scores[row]
+                if np.isnan(score):
+                    break
+                item = (float(score), -(chunk_start + int(row)))
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+                else:
+                    break  # 이후 행은 점수가 더 낮음
+
+    best = sorted(heap, reverse=True)
+    rows = np.array([-row for _, row in best], dtype=np.intp)
+    top_scores = np.array([score for score, _ in best], dtype=np.float64)
+    roads = materialize(
+        snapshot.columns,
+        rows,
+        {
+            "예측점수": model_scores[rows],
+            "pred_idx": normalize(top_scores, low, high) if scored else top_scores,
+        },
+    )
+    for road, name in zip(roads, snapshot.region_names(rows)):
+        road["rds_rg"] = name
+    return {"scored_roads": scored, "recommended_roads": roads}
@@ -0,0 +1,283 @@
+# 도로별 모델 점수 (사용자 가중치와 무관하므로 미리 계산해 두고 요청마다 재사용)
+import os
+import threading
+import time
+from datetime import datetime
+import joblib
+import numpy as np
+from app.database.mysql_connect import db_cursor
+from app.services.road_features import feature_store
+
+# 설정
+SCORE_BATCH_SIZE = int(os.getenv("SCORE_BATCH_SIZE", "5000"))  # 한 번에 추론할 도로 수
+SCORE_WRITE_BATCH = 1000
+SCORE_CHECK_SAMPLE = int(os.getenv("SCORE_CHECK_SAMPLE", "200"))
+SCORE_CHECK_TOLERANCE = 1e-6
+
+SCORE_TABLE = """
+    CREATE TABLE IF NOT EXISTS road_model_scores (
+        rds_id VARCHAR(64) NOT NULL PRIMARY KEY,
+        model_score DOUBLE NULL,
+        model_version VARCHAR(64) NOT NULL,
+        data_version VARCHAR(64) NOT NULL,
+        scored_at DATETIME NOT NULL
+    )
+"""
+
+
+def model_fingerprint(model, scaler) -> str:
+    """모델 + 스케일러 내용으로 만든 버전 문자열"""
+    return joblib.hash((model, scaler))[:16]
+
+
+class RoadScoreStore:
+    """
+    seoul_info snapshot의 행 순서에 맞춘 모델 점수 배열
+    - 모델이 바뀌거나(set_model) 도로 데이터가 다시 적재되면 재계산
+    - 같은 모델/데이터 버전으로 저장된 점수가 있으면 추론 없이 DB에서 읽음
+    """
+
+    def __init__(self, features=feature_store):
+        self._features = features
+        self._model = None
+        self._scaler = None
+        self._predict = None
+        self.model_version = None
+        self._scores = None  # (snapshot, model_version, 점수 배열)
+        self._lock = threading.Lock()
+        self._tables_ready = False
+        self._background = threading.Lock()  # 백그라운드 재계산은 하나만
+        self.last_build = None
+        self.last_build_ms = None
+        self.last_source = None  # "stored" / "computed"
+        self.last_error = None
+        self.last_check = None
+        self._listeners = []
+        features.add_listener(self._on_snapshot)
+
+    def add_listener(self, callback):
+        """모델 버전이 바뀔 때마다 callback(model_version) 호출"""
+        self._listeners.append(callback)
+
+    def set_model(self, model, scaler, predict, version: str = None):
+        """
+        사용할 모델 지정 - 도로 데이터가 이미 적재되어 있으면 바로 재계산
+        진행 중인 재계산이 끝난 뒤에 교체 (한 번의 재계산은 한 모델로만)
+        """
+        version = version or model_fingerprint(model, scaler)
+        with self._lock:
+            previous = self.model_version
+            self._model, self._scaler, self._predict = model, scaler, predict
+            self.model_version = version
+        if self._features.loaded:
+            self.rebuild()
+        if previous is not None and previous != version:
+            for callback in self._listeners:
+                try:
+                    callback(version)
+                except Exception as e:
+                    print(f"⚠️ Road score listener failed: {e}")
+
+    def _on_snapshot(self, snapshot):
+        if self._model is not None:
+            self.rebuild(snapshot)
+
+    def _ensure_tables(self, cursor):
+        if self._tables_ready:
+            return
+        cursor.execute(SCORE_TABLE)
+        self._tables_ready = True
+
+    def _compute(self, snapshot, model, scaler, predict) -> np.ndarray:
+        scores = np.empty(len(snapshot.matrix), dtype=np.float64)
+        for start in range(0, len(scores), SCORE_BATCH_SIZE):
+            batch = snapshot.matrix[start:start + SCORE_BATCH_SIZE]
+            scores[start:start + len(batch)] = np.asarray(
+                predict(model, scaler, batch), dtype=np.float64
+            ).ravel()
+        return scores
+
+    def _load_stored(self, cursor, snapshot, model_version: str, data_version: str):
+        """같은 버전으로 저장된 점수가 모든 도로에 있으면 배열로, 아니면 None"""
+        cursor.execute(
+            """
+            SELECT rds_id, model_score FROM road_model_scores
+            WHERE model_version = %s AND data_version = %s
+            """,
+            (model_version, data_version),
+        )
+        stored = dict(cursor.fetchall())
+        rds_ids = snapshot.columns["rds_id"]
+        if len(stored) != len(rds_ids):
+            return None
+        try:
+            return np.array(
+                [np.nan if stored[r] is None else stored[r] for r in rds_ids],
+                dtype=np.float64,
+            )
+        except KeyError:
+            return None
+
+    def _save(
+        self, cursor, snapshot, scores: np.ndarray, model_version: str, data_version: str
+    ):
+        now = datetime.now()
+        rows = [
+            (rds_id, None if np.isnan(score) else float(score),
+             model_version, data_version, now)
+            for rds_id, score in zip(snapshot.columns["rds_id"], scores)
+        ]
+        query = """
+            REPLACE INTO road_model_scores
+            (rds_id, model_score, model_version, data_version, scored_at)
+            VALUES (%s, %s, %s, %s, %s)
+        """
+        for i in range(0, len(rows), SCORE_WRITE_BATCH):
+            cursor.executemany(query, rows[i:i + SCORE_WRITE_BATCH])
+        cursor.execute(
+            "DELETE FROM road_model_scores WHERE model_version <> %s OR data_version <> %s",
+            (model_version, data_version),
+        )
+
+    def rebuild(self, snapshot=None) -> bool:
+        """현재 모델/도로 데이터 기준으로 점수 배열 준비 - 새로 만들었으면 True"""
+        if self._model is None:
+            return False
+        snapshot = snapshot or self._features.snapshot
+        with self._lock:
+            # 이 재계산에 쓸 모델 (set_model도 같은 lock에서 교체)
+            model, scaler, predict = self._model, self._scaler, self._predict
+            model_version = self.model_version
+            current = self._scores
+            if (
+                current is not None
+                and current[0] is snapshot
+                and current[1] == model_version
+            ):
+                return False
+
+            started = time.perf_counter()
+            data_version = str(snapshot.version)
+            scores, source = None, "computed"
+            try:
+                with db_cursor() as cursor:
+                    self._ensure_tables(cursor)
+                    scores = self._load_stored(
+                        cursor, snapshot, model_version, data_version
+                    )
+                if scores is not None:
+                    source = "stored"
+            except Exception as e:
+                print(f"⚠️ Stored road scores unavailable: {e}")
+
+            if scores is None:
+                scores = self._compute(snapshot, model, scaler, predict)
+                try:
+                    with db_cursor(commit=True) as cursor:
+                        self._ensure_tables(cursor)
+                        self._save(cursor, snapshot, scores, model_version, data_version)
+                    self.last_error = None
+                except Exception as e:
+                    # 메모리 점수는 그대로 사용, 다음 재계산 때 다시 저장
+                    self.last_error = str(e)
+                    print(f"⚠️ Failed to save road scores: {e}")
+
+            self._scores = (snapshot, model_version, scores)
+            self.last_build = datetime.now().isoformat()
+            self.last_build_ms = round((time.perf_counter() - started) * 1000, 3)
+            self.last_source = source
+            print(
+                f"Road scores ready ({len(scores)} roads, model {model_version}, {source})"
+            )
+            return True
+
+    def rebuild_in_background(self) -> bool:
+        """
+        요청 처리 중 점수가 없을 때 호출 - 요청을 기다리게 하지 않고 별도 스레드에서 재계산
+        이미 진행 중이면 False
+        """
+        if self._model is None or not self._background.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                self.rebuild()
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"⚠️ Road score rebuild failed: {e}")
+            finally:
+                self._background.release()
+
+        threading.Thread(target=run, name="road-score-rebuild", daemon=True).start()
+        return True
+
+    def region_scores(self, region):
+        """
+        지역 도로들의 모델 점수 (region과 같은 snapshot / 현재 모델 기준)
+        아직 재계산 전이면 None - 호출 측에서 직접 추론
+        """
+        scores = self.snapshot_scores(region.snapshot)
+        if scores is None:
+            return None
+        return scores[region.start:region.stop]
+
+    def snapshot_scores(self, snapshot):
+        """snapshot 전체 도로의 모델 점수 (재계산 전이면 None)"""
+        current = self._scores
+        if (
+            current is None
+            or current[0] is not snapshot
+            or current[1] != self.model_version
+        ):
+            return None
+        return current[2]
+
+    def check_consistency(self, sample: int = SCORE_CHECK_SAMPLE) -> dict:
+        """저장된 점수와 실시간 추론 결과를 표본으로 비교"""
+        current = self._scores
+        if current is None or self._model is None:
+            return {"ok": False, "detail": "점수가 아직 계산되지 않았습니다."}
+        snapshot, version, scores = current
+        size = len(scores)
+        rows = np.random.default_rng().choice(size, min(sample, size), replace=False)
+        live = np.asarray(
+            self._predict(self._model, self._scaler, snapshot.matrix[rows]),
+            dtype=np.float64,
+        ).ravel()
+        diff = np.abs(live - scores[rows])
+        both_nan = np.isnan(live) & np.isnan(scores[rows])
+        diff[both_nan] = 0.0
+        mismatches = int(np.count_nonzero(~(diff <= SCORE_CHECK_TOLERANCE)))
+        result = {
+            "ok": mismatches == 0 and version == self.model_version,
+            "model_version": version,
+            "current_model_version": self.model_version,
+            "sampled": len(rows),
+            "mismatches": mismatches,
+            "max_abs_diff": float(np.nanmax(diff)) if len(rows) else 0.0,
+            "checked_at": datetime.now().isoformat(),
+        }
+        self.last_check = result
+        return result
+
+    def stats(self) -> dict:
+        current = self._scores
+        return {
+            "model_version": self.model_version,
+            "scored_roads": len(current[2]) if current else 0,
+            "data_version": current[0].version if current else None,
+            "up_to_date": bool(
+                current
+                and current[1] == self.model_version
+                and self._features.loaded
+                and current[0] is self._features.snapshot
+            ),
+            "last_build": self.last_build,
+            "last_build_ms": self.last_build_ms,
+            "last_source": self.last_source,
+            "last_error": self.last_error,
+            "last_check": self.last_check,
+        }
+
+
+road_scores = RoadScoreStore()
@@ -0,0 +1,269 @@
+# 대시보드 집계 테이블 (일별/월별 롤업) 증분 갱신
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from app.database.mysql_connect import get_connection
+
+# 설정
+ROLLUP_INTERVAL_MINUTES = int(os.getenv("ROLLUP_INTERVAL_MINUTES", "5"))
+ROLLUP_BACKFILL_DAYS = int(os.getenv("ROLLUP_BACKFILL_DAYS", "200"))
+
+# 집계 방식이 바뀌면 이름을 바꿔 처음부터 한 번 다시 백필
+ROLLUP_STATE_NAME = "dashboard:2"
+# 여러 워커 중 한 곳에서만 갱신 (MySQL named lock)
+ROLLUP_LOCK_NAME = "ongil_rollup_refresh"
+
+ROLLUP_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS visit_daily_rollup (
+        day DATE NOT NULL PRIMARY KEY,
+        visits INT NOT NULL,
+        unique_visitors INT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS visit_daily_ips (
+        day DATE NOT NULL,
+        ip_address VARCHAR(45) NOT NULL,
+        visits INT NOT NULL,
+        PRIMARY KEY (day, ip_address)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS visit_monthly_rollup (
+        month CHAR(7) NOT NULL PRIMARY KEY,
+        visits INT NOT NULL,
+        unique_visitors INT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS error_daily_rollup (
+        day DATE NOT NULL,
+        route VARCHAR(255) NOT NULL,
+        status_code INT NOT NULL,
+        count INT NOT NULL,
+        PRIMARY KEY (day, route, status_code)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS signup_daily_rollup (
+        day DATE NOT NULL PRIMARY KEY,
+        count INT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rollup_runs (
+        name VARCHAR(64) NOT NULL PRIMARY KEY,
+        as_of DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rollup_state (
+        name VARCHAR(64) NOT NULL PRIMARY KEY,
+        last_day DATE NOT NULL
+    )
+    """,
+]
+
+_tables_ready = False
+_lock = threading.Lock()
+_status = {
+    "last_run": None,
+    "last_duration_ms": None,
+    "last_error": None,
+    "skipped": 0,  # 다른 워커가 갱신 중이라 건너뜀
+}
+
+
+def _ensure_tables(cursor):
+    global _tables_ready
+    if _tables_ready:
+        return
+    for ddl in ROLLUP_TABLES:
+        cursor.execute(ddl)
+    _tables_ready = True
+
+
+def _start_day(cursor) -> date:
+    """
+    다시 집계할 시작일 - 마지막 집계일 전날부터 (집계 당시 진행 중이던 날 + 늦게 기록된 로그)
+    한 번도 집계하지 않았으면 ROLLUP_BACKFILL_DAYS 전이 속한 달의 1일부터
+    """
+    backfill_start = (date.today() - timedelta(days=ROLLUP_BACKFILL_DAYS)).replace(day=1)
+    cursor.execute(
+        "SELECT last_day FROM rollup_state WHERE name = %s", (ROLLUP_STATE_NAME,)
+    )
+    row = cursor.fetchone()
+    if not row:
+        return backfill_start
+    return max(backfill_start, row[0] - timedelta(days=1))
+
+
+def _month_starts(start: date, end: date):
+    month = start.replace(day=1)
+    while month <= end:
+        yield month
+        month = (month + timedelta(days=32)).replace(day=1)
+
+
+def _refresh(cursor, start: date, end: date):
+    start_dt = datetime.combine(start, datetime.min.time())
+    end_dt = datetime.combine(end + timedelta(days=1), datetime.min.time())
+    # 에러 집계는 이 시각까지 - 이후 로그는 조회 시 error_logs에서 직접 더함
+    as_of = datetime.now().replace(microsecond=0)
+
+    # 1. 방문 (일별, IP별) - 로그 원본은 이 구간만 읽음
+    cursor.execute("DELETE FROM visit_daily_ips WHERE day >= %s", (start,))
+    cursor.execute(
+        """
+        INSERT INTO visit_daily_ips (day, ip_address, visits)
+        SELECT DATE(visit_time), ip_address, COUNT(*)
+        FROM visit_logs
+        WHERE visit_time >= %s AND visit_time < %s AND ip_address IS NOT NULL
+        GROUP BY DATE(visit_time), ip_address
+        """,
+        (start_dt, end_dt),
+    )
+
+    # 방문 (일별)
+    cursor.execute("DELETE FROM visit_daily_rollup WHERE day >= %s", (start,))
+    cursor.execute(
+        """
+        INSERT INTO visit_daily_rollup (day, visits, unique_visitors)
+        SELECT day, SUM(visits), COUNT(*)
+        FROM visit_daily_ips
+        WHERE day >= %s
+        GROUP BY day
+        """,
+        (start,),
+    )
+
+    # 2. 에러 (일별, 경로 + 상태코드)
+    cursor.execute("DELETE FROM error_daily_rollup WHERE day >= %s", (start,))
+    cursor.execute(
+        """
+        INSERT INTO error_daily_rollup (day, route, status_code, count)
+        SELECT DATE(created_at), route, status_code, COUNT(*)
+        FROM error_logs
+        WHERE created_at >= %s AND created_at < %s
+        GROUP BY DATE(created_at), route, status_code
+        """,
+        (start_dt, min(end_dt, as_of)),
+    )
+
+    # 3. 신규 가입 (일별)
+    cursor.execute("DELETE FROM signup_daily_rollup WHERE day >= %s", (start,))
+    cursor.execute(
+        """
+        INSERT INTO signup_daily_rollup (day, count)
+        SELECT DATE(CreatDt), COUNT(*)
+        FROM user_data
+        WHERE CreatDt >= %s AND CreatDt < %s
+        GROUP BY DATE(CreatDt)
+        """,
+        (start_dt, end_dt),
+    )
+
+    # 4. 방문 (월별) - 순방문자는 일별 합으로 구할 수 없어 해당 월의 일별 IP 표에서 계산
+    for month_start in _month_starts(start, end):
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        cursor.execute(
+            """
+            REPLACE INTO visit_monthly_rollup (month, visits, unique_visitors)
+            SELECT %s, COALESCE(SUM(visits), 0), COUNT(DISTINCT ip_address)
+            FROM visit_daily_ips
+            WHERE day >= %s AND day < %s
+            """,
+            (month_start.strftime("%Y-%m"), month_start, next_month),
+        )
+
+    cursor.execute(
+        "REPLACE INTO rollup_state (name, last_day) VALUES (%s, %s)",
+        (ROLLUP_STATE_NAME, end),
+    )
+    cursor.execute(
+        "REPLACE INTO rollup_runs (name, as_of) VALUES (%s, %s)",
+        (ROLLUP_STATE_NAME, as_of),
+    )
+
+
+def _run(connection) -> bool:
+    """다른 워커가 갱신 중이면 False"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (ROLLUP_LOCK_NAME,))
+        if not cursor.fetchone()[0]:
+            return False
+        try:
+            _ensure_tables(cursor)
+            start = _start_day(cursor)
+            end = date.today()
+            _refresh(cursor, start, end)
+            connection.commit()
+            print(f"Rollup refreshed ({start} ~ {end})")
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            # 커밋 후에 풀어야 다음 워커가 갱신된 rollup_state를 봄
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (ROLLUP_LOCK_NAME,))
+            cursor.fetchone()
+        return True
+    finally:
+        cursor.close()
+
+
+def refresh_rollups():
+    """마지막 집계일 이후 구간만 다시 집계 (스케줄러에서 주기 실행)"""
+    if not _lock.acquire(blocking=False):
+        return  # 이전 실행이 아직 진행 중
+    started = time.perf_counter()
+    try:
+        with get_connection() as connection:
+            if not _run(connection):
+                _status["skipped"] += 1
+                return
+        _status["last_error"] = None
+    except Exception as e:
+        _status["last_error"] = str(e)
+        print(f"⚠️ Rollup failed: {e}")
+    finally:
+        _status["last_run"] = datetime.now().isoformat()
+        _status["last_duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        _lock.release()
+
+
+def today_error_counts(cursor, column: str) -> list:
+    """
+    오늘 에러 수 (column: route / status_code별)
+    집계 테이블 값 + 마지막 집계 시각(as_of) 이후 error_logs 행 - 집계 주기만큼 늦지 않음
+    """
+    if column not in ("route", "status_code"):
+        raise ValueError(f"unsupported column: {column}")
+    cursor.execute(
+        f"""
+        SELECT {column}, CAST(SUM(count) AS UNSIGNED) AS count
+        FROM (
+            SELECT {column}, count
+            FROM error_daily_rollup
+            WHERE day = CURDATE()
+            UNION ALL
+            SELECT {column}, COUNT(*)
+            FROM error_logs
+            WHERE created_at >= GREATEST(
+                CURDATE(),
+                COALESCE((SELECT as_of FROM rollup_runs WHERE name = %s), CURDATE())
+            )
+            GROUP BY {column}
+        ) today
+        GROUP BY {column}
+        ORDER BY count DESC
+        """,
+        (ROLLUP_STATE_NAME,),
+    )
+    return cursor.fetchall()
+
+
+def rollup_status() -> dict:
+    return dict(_status)
@@ -0,0 +1,194 @@
+# 사용자 프로필 캐시 (user_data + permissions, 프로세스 내 + Redis)
+# 비밀번호(user_ps)는 캐시하지 않음 - 로그인 확인 시에만 DB에서 직접 조회
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+import redis
+from app.core.redis_events import subscribe, publish
+from app.database.mysql_connect import db_cursor
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 설정
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "5000"))
+USER_CACHE_LOCAL_TTL = float(os.getenv("USER_CACHE_LOCAL_TTL", "60"))
+USER_CACHE_REDIS_TTL = int(os.getenv("USER_CACHE_REDIS_TTL", "600"))
+PROFILE_KEY = "user_profile:v2:{}"
+GENERATION_KEY = "user_profile_gen:{}"  # 무효화마다 증가 (늦게 끝난 조회가 옛 값을 넣지 않도록)
+INVALIDATE_CHANNEL = "user_profile_invalidated"
+
+PROFILE_QUERY = """
+    SELECT u.user_email, u.user_name, u.jurisdiction, u.user_dept, u.CreatDt,
+           p.is_admin
+    FROM user_data u
+    LEFT JOIN permissions p ON p.user_email = u.user_email
+    WHERE u.user_email = %s
+"""
+
+_local = OrderedDict()  # email -> (expires_at, profile)
+_epoch = 0  # 로컬 무효화마다 증가
+_lock = threading.Lock()
+_stats = {
+    "local_hits": 0,
+    "redis_hits": 0,
+    "db_loads": 0,
+    "invalidations": 0,
+    "stale_skips": 0,  # 조회 중 무효화되어 캐시에 넣지 않음
+}
+
+
+def _count(name: str):
+    with _lock:
+        _stats[name] += 1
+
+
+def _get_local(email: str):
+    with _lock:
+        entry = _local.get(email)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del _local[email]
+            return None
+        _local.move_to_end(email)
+        return entry[1]
+
+
+def _put_local(email: str, profile: dict, epoch: int = None):
+    """epoch: 조회 시작 시점 값 - 그 사이 무효화가 있었으면 넣지 않음"""
+    with _lock:
+        if epoch is not None and epoch != _epoch:
+            _stats["stale_skips"] += 1
+            return
+        _local[email] = (time.monotonic() + USER_CACHE_LOCAL_TTL, profile)
+        _local.move_to_end(email)
+        while len(_local) > USER_CACHE_SIZE:
+            _local.popitem(last=False)
+
+
+def _drop_local(email: str):
+    global _epoch
+    with _lock:
+        _epoch += 1
+        _local.pop(email, None)
+
+
+def _clear_local():
+    """pub/sub 재연결 시 - 끊긴 동안 놓친 무효화가 있을 수 있으므로 전부 비움"""
+    global _epoch
+    with _lock:
+        _epoch += 1
+        _local.clear()
+
+
+def get_user_profile(email: str):
+    """
+    사용자 정보 + 권한(is_admin) 조회 - 없는 사용자면 None (캐시하지 않음)
+    프로세스 내 캐시 → Redis → DB(조인 쿼리 한 번) 순서
+    """
+    profile = _get_local(email)
+    if profile is not None:
+        _count("local_hits")
+        return dict(profile)
+
+    epoch = _epoch
+    if redis_client is not None:
+        try:
+            cached = redis_client.get(PROFILE_KEY.format(email))
+        except Exception as e:
+            print(f"Redis error: {e}")
+            cached = None
+        if cached:
+            profile = json.loads(cached)
+            _put_local(email, profile, epoch)
+            _count("redis_hits")
+            return dict(profile)
+
+    watch = _watch_generation(email)
+    try:
+        with db_cursor(dictionary=True) as cursor:
+            cursor.execute(PROFILE_QUERY, (email,))
+            profile = cursor.fetchone()
+        _count("db_loads")
+        if profile is None:
+            return None
+
+        # datetime 등은 문자열로 (Redis에서 읽은 값과 형태를 맞춤)
+        profile = json.loads(json.dumps(profile, default=str))
+        _put_local(email, profile, epoch)
+        if watch is not None:
+            _store_redis(watch, email, profile)
+        return dict(profile)
+    finally:
+        if watch is not None:
+            watch.reset()
+
+
+def _watch_generation(email: str):
+    """DB 조회 전에 세대 키 WATCH - 조회 중 invalidate_user가 불리면 저장이 취소됨"""
+    if redis_client is None:
+        return None
+    try:
+        pipe = redis_client.pipeline()
+        pipe.watch(GENERATION_KEY.format(email))
+        return pipe
+    except Exception as e:
+        print(f"Redis error: {e}")
+        return None
+
+
+def _store_redis(pipe, email: str, profile: dict):
+    try:
+        pipe.multi()
+        pipe.setex(PROFILE_KEY.format(email), USER_CACHE_REDIS_TTL, json.dumps(profile))
+        pipe.execute()
+    except redis.WatchError:
+        _count("stale_skips")
+    except Exception as e:
+        print(f"Redis error: {e}")
+
+
+def get_admin_level(email: str):
+    """permissions.is_admin 값 (권한 행이 없거나 사용자가 없으면 None)"""
+    profile = get_user_profile(email)
+    return profile.get("is_admin") if profile else None
+
+
+def invalidate_user(email: str):
+    """
+    사용자/권한 변경 (커밋 후) 시 호출 - 이 워커, Redis, 다른 워커 캐시 모두 제거
+    세대 키를 올려 이미 DB를 읽고 있던 조회가 옛 값을 다시 넣지 못하게 함
+    """
+    _drop_local(email)
+    _count("invalidations")
+    if redis_client is not None:
+        try:
+            pipe = redis_client.pipeline()
+            pipe.incr(GENERATION_KEY.format(email))
+            pipe.expire(GENERATION_KEY.format(email), USER_CACHE_REDIS_TTL)
+            pipe.delete(PROFILE_KEY.format(email))
+            pipe.execute()
+        except Exception as e:
+            print(f"Redis error: {e}")
+    publish(INVALIDATE_CHANNEL, email)
+
+
+def user_cache_stats() -> dict:
+    with _lock:
+        stats = dict(_stats)
+        stats["local_size"] = len(_local)
+    return stats
+
+
+subscribe(
+    INVALIDATE_CHANNEL,
+    _drop_local,
+    on_connect=_clear_local,
+    on_disconnect=_clear_local,
+)
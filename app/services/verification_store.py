@@ -0,0 +1,58 @@
+# 비밀번호 재설정 인증번호 저장소 (Redis - 워커/노드 간 공유)
+import os
+import redis
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+# 설정
+VERIFICATION_CODE_TTL = int(os.getenv("VERIFICATION_CODE_TTL", "600"))  # 10분
+VERIFICATION_MAX_ATTEMPTS = int(os.getenv("VERIFICATION_MAX_ATTEMPTS", "5"))
+CODE_KEY = "pwd_reset_code:{}"  # hash {code, attempts}
+
+# 확인 결과
+CODE_OK = "ok"
+CODE_INVALID = "invalid"
+CODE_MISSING = "missing"
+CODE_LOCKED = "locked"
+
+# 코드 비교 + 시도 횟수 증가를 한 번에 (동시 요청으로 횟수 제한을 넘지 못하도록)
+# 일치하면 키 삭제 (1회용), 틀린 횟수가 한도에 닿으면 키 삭제 후 locked
+_CHECK_SCRIPT = """
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return 'missing'
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return 'ok'
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+if attempts >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1])
+    return 'locked'
+end
+return 'invalid'
+"""
+_check_script = redis_client.register_script(_CHECK_SCRIPT) if redis_client else None
+
+
+def save_verification_code(email: str, code: str):
+    """새 인증번호 저장 (이전 코드와 시도 횟수는 초기화)"""
+    key = CODE_KEY.format(email)
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.delete(key)
+    pipe.hset(key, mapping={"code": code, "attempts": 0})
+    pipe.expire(key, VERIFICATION_CODE_TTL)
+    pipe.execute()
+
+
+def check_verification_code(email: str, code: str) -> str:
+    """인증번호 확인 - CODE_OK / CODE_INVALID / CODE_MISSING / CODE_LOCKED"""
+    result = _check_script(
+        keys=[CODE_KEY.format(email)], args=[code, VERIFICATION_MAX_ATTEMPTS]
+    )
+    return result.decode() if isinstance(result, bytes) else result
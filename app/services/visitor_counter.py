@@ -0,0 +1,191 @@
+# 순방문자 수 집계 (Redis HyperLogLog)
+import os
+import redis
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from app.database.mysql_connect import db_cursor
+
+try:
+    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
+except Exception as e:
+    print(f"Redis connection failed: {e}")
+    redis_client = None
+
+DAY_KEY = "visitors:day:{}"  # YYYY-MM-DD
+MONTH_KEY = "visitors:month:{}"  # YYYY-MM
+DAY_KEY_TTL = 60 * 60 * 24 * 400  # 400일
+MONTH_KEY_TTL = 60 * 60 * 24 * 365 * 3  # 3년
+
+# HLL 키가 채워진 시작일 (이전 기간은 visit_logs로 정확히 집계)
+COVERAGE_KEY = "visitors:since"
+BACKFILL_LOCK_KEY = "visitors:backfill:lock"
+VISITOR_BACKFILL_DAYS = int(os.getenv("VISITOR_BACKFILL_DAYS", "400"))
+VISITOR_BACKFILL_BATCH = int(os.getenv("VISITOR_BACKFILL_BATCH", "5000"))
+
+
+def _day_key(day: date) -> str:
+    return DAY_KEY.format(day.strftime("%Y-%m-%d"))
+
+
+def _month_key(day: date) -> str:
+    return MONTH_KEY.format(day.strftime("%Y-%m"))
+
+
+def record_visits(rows: list):
+    """
+    방문 로그 행 (user_email, route, ip_address, visit_time) 묶음을
+    일별/월별 HyperLogLog에 PFADD (파이프라인 한 번)
+    """
+    keys = defaultdict(set)
+    for _, _, ip_address, visit_time in rows:
+        if not ip_address:
+            continue
+        keys[(_day_key(visit_time), DAY_KEY_TTL)].add(ip_address)
+        keys[(_month_key(visit_time), MONTH_KEY_TTL)].add(ip_address)
+    if not keys:
+        return
+
+    pipe = redis_client.pipeline(transaction=False)
+    for (key, ttl), ips in keys.items():
+        pipe.pfadd(key, *ips)
+        pipe.expire(key, ttl)
+    pipe.execute()
+
+
+def covered_since():
+    """HLL 키로 셀 수 있는 첫 날 (백필 전이면 None)"""
+    value = redis_client.get(COVERAGE_KEY)
+    if not value:
+        return None
+    since = date.fromisoformat(value.decode() if isinstance(value, bytes) else value)
+    # 일 키는 TTL이 지나면 사라지므로 그 이전은 다시 DB로
+    return max(since, date.today() - timedelta(seconds=DAY_KEY_TTL) + timedelta(days=1))
+
+
+def backfill_from_logs(days: int = VISITOR_BACKFILL_DAYS) -> dict:
+    """
+    visit_logs로 HLL 일/월 키 채우기 (배포 직후 1회, 이미 채워졌으면 건너뜀)
+    - 시작일은 days일 전이 속한 달의 1일 (월 키가 한 달 전체를 포함하도록)
+    - PFADD는 중복에 영향이 없어 실시간 기록과 겹쳐도 됨
+    """
+    start = (date.today() - timedelta(days=days)).replace(day=1)
+    since = covered_since()
+    if since is not None and since <= start:
+        return {"skipped": True, "since": since}
+    if not redis_client.set(BACKFILL_LOCK_KEY, "1", nx=True, ex=60 * 60):
+        return {"skipped": True, "since": since}  # 다른 워커가 진행 중
+
+    try:
+        rows = 0
+        with db_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT NULL, NULL, ip_address, visit_time
+                FROM visit_logs
+                WHERE visit_time >= %s AND visit_time < %s
+                """,
+                (start, since or datetime.now()),
+            )
+            while True:
+                batch = cursor.fetchmany(VISITOR_BACKFILL_BATCH)
+                if not batch:
+                    break
+                record_visits(batch)
+                rows += len(batch)
+        redis_client.set(COVERAGE_KEY, start.isoformat())
+        print(f"Visitor HLL backfilled from {start} ({rows} rows)")
+        return {"skipped": False, "since": start, "rows": rows}
+    finally:
+        redis_client.delete(BACKFILL_LOCK_KEY)
+
+
+def count_day(day: date) -> int:
+    """하루 순방문자 수 (추정치)"""
+    return redis_client.pfcount(_day_key(day))
+
+
+def count_range(start: date, end: date) -> int:
+    """
+    기간 순방문자 수 (추정치, start ~ end 포함)
+    - 통째로 포함되는 달은 월 키, 나머지는 일 키로 PFCOUNT (여러 키 병합 카운트)
+    - HLL 키가 없는 기간이 섞이면 visit_logs로 정확히 집계
+    """
+    since = covered_since()
+    if since is None or start < since:
+        return exact_count_range(start, end)
+
+    keys = []
+    day = start
+    while day <= end:
+        next_month = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+        if day.day == 1 and next_month - timedelta(days=1) <= end:
+            keys.append(_month_key(day))
+            day = next_month
+        else:
+            keys.append(_day_key(day))
+            day += timedelta(days=1)
+    if not keys:
+        return 0
+    return redis_client.pfcount(*keys)
+
+
+def monthly_series(start: date, end: date) -> list:
+    """
+    월별 순방문자 수 (추정치) - [{"month": "YYYY-MM", "count": n}, ...]
+    HLL 키가 없는 달은 visit_logs로 정확히 집계
+    """
+    months = []
+    month = start.replace(day=1)
+    while month <= end:
+        months.append(month)
+        month = (month + timedelta(days=32)).replace(day=1)
+
+    since = covered_since()
+    covered = [m for m in months if since is not None and m >= since]
+    missing = [m for m in months if m not in covered]
+
+    counts = {}
+    if covered:
+        pipe = redis_client.pipeline(transaction=False)
+        for month in covered:
+            pipe.pfcount(_month_key(month))
+        counts.update(zip(covered, pipe.execute()))
+    if missing:
+        counts.update(exact_monthly_counts(missing[0], missing[-1]))
+    return [
+        {"month": month.strftime("%Y-%m"), "count": counts.get(month, 0)}
+        for month in months
+    ]
+
+
+def exact_count_range(start: date, end: date) -> int:
+    """기간 순방문자 수 (정확한 값, visit_logs 직접 집계 - 감사용)"""
+    with db_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT COUNT(DISTINCT ip_address)
+            FROM visit_logs
+            WHERE visit_time >= %s AND visit_time < %s
+            """,
+            (start, end + timedelta(days=1)),
+        )
+        return cursor.fetchone()[0]
+
+
+def exact_monthly_counts(first_month: date, last_month: date) -> dict:
+    """월별 순방문자 수 (정확한 값) - {월 1일: n}"""
+    end = (last_month + timedelta(days=32)).replace(day=1)
+    with db_cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT DATE_FORMAT(visit_time, '%Y-%m'), COUNT(DISTINCT ip_address)
+            FROM visit_logs
+            WHERE visit_time >= %s AND visit_time < %s
+            GROUP BY DATE_FORMAT(visit_time, '%Y-%m')
+            """,
+            (first_month, end),
+        )
+        return {
+            datetime.strptime(month, "%Y-%m").date(): count
+            for month, count in cursor.fetchall()
+        }
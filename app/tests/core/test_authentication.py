@@ -0,0 +1,57 @@
+# tests/core/test_authentication.py
+
+from datetime import timedelta
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+import app.core.jwt_utils as jwt_module
+import app.api.routes.mypage as mypage_module
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def real_authentication(monkeypatch):
+    """다른 테스트 모듈의 get_authenticated_user override 해제"""
+    monkeypatch.delitem(
+        app.dependency_overrides, jwt_module.get_authenticated_user, raising=False
+    )
+
+
+def test_protected_request_authenticates_once(monkeypatch):
+    """미들웨어에서 한 번 검증한 결과를 라우트 의존성이 재사용"""
+    blacklist_checks = []
+    verify_calls = []
+    original_verify = jwt_module.verify_token
+
+    def counting_blacklisted(token):
+        blacklist_checks.append(token)
+        return False
+
+    def counting_verify(token, **kwargs):
+        verify_calls.append(token)
+        return original_verify(token, **kwargs)
+
+    monkeypatch.setattr(jwt_module, "is_token_blacklisted", counting_blacklisted)
+    monkeypatch.setattr(jwt_module, "verify_token", counting_verify)
+    monkeypatch.setattr(
+        mypage_module,
+        "execute_query",
+        lambda query, params=(): [{"user_email": params[0]}],
+    )
+
+    token = jwt_module.create_access_token(
+        data={"sub": "user@test.com"}, expires_delta=timedelta(hours=1)
+    )
+    response = client.get("/mypage/mypage_load", headers={"token": token})
+
+    assert response.status_code == 200
+    assert response.json()["user_info"][0]["user_email"] == "user@test.com"
+    assert len(blacklist_checks) == 1
+    assert len(verify_calls) == 1
+
+
+def test_missing_token_is_rejected_by_dependency():
+    """토큰 없이 보호된 라우트 호출 시 401"""
+    response = client.get("/mypage/mypage_load")
+    assert response.status_code == 401
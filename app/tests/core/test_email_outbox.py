@@ -0,0 +1,213 @@
+# tests/core/test_email_outbox.py
+
+import socketserver
+import threading
+import time
+from email.message import EmailMessage
+import pytest
+import app.core.email_outbox as outbox_module
+from app.core.email_outbox import EmailOutbox
+
+
+# --- 로컬 SMTP 서버 (테스트용 최소 구현) ---
+class SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode().strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250 localhost")
+            elif command.startswith(("MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    data.append(chunk)
+                if server.fail_next > 0:
+                    server.fail_next -= 1
+                    self.reply("451 Temporary failure")
+                else:
+                    server.messages.append(b"".join(data).decode())
+                    self.reply("250 Queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.fail_next = 0
+
+
+# --- Redis 대용 (hash만) ---
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def hset(self, key, mapping):
+        self._calls.append(lambda: self._redis.hset(key, mapping=mapping))
+
+    def hdel(self, key, *names):
+        self._calls.append(lambda: self._redis.hdel(key, *names))
+
+    def expire(self, key, ttl):
+        self._calls.append(lambda: self._redis.ttls.__setitem__(key, ttl))
+
+    def execute(self):
+        for call in self._calls:
+            call()
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self._lock = threading.Lock()
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def hset(self, key, mapping):
+        with self._lock:
+            entry = self.hashes.setdefault(key, {})
+            entry.update({k.encode(): str(v).encode() for k, v in mapping.items()})
+
+    def hdel(self, key, *names):
+        with self._lock:
+            for name in names:
+                self.hashes.get(key, {}).pop(name.encode(), None)
+
+    def hgetall(self, key):
+        with self._lock:
+            return dict(self.hashes.get(key, {}))
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(outbox_module, "redis_client", fake)
+    return fake
+
+
+@pytest.fixture
+def smtp_server():
+    server = LocalSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def outbox(smtp_server):
+    outbox = EmailOutbox(
+        "127.0.0.1", smtp_server.server_address[1], use_tls=False, retry_base=0.05
+    )
+    outbox.start()
+    yield outbox
+    outbox.stop(timeout=2)
+
+
+def make_message(to_email: str):
+    msg = EmailMessage()
+    msg["From"] = "sender@test.com"
+    msg["To"] = to_email
+    msg["Subject"] = "테스트"
+    msg.set_content("본문")
+    return msg
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_messages_share_one_smtp_session(smtp_server, outbox):
+    """여러 메일을 하나의 SMTP 연결로 발송"""
+    ids = [outbox.enqueue(make_message(f"user{i}@test.com")) for i in range(3)]
+
+    assert wait_for(lambda: outbox.stats()["sent"] == 3)
+    assert len(smtp_server.messages) == 3
+    assert smtp_server.connections == 1
+    assert all(outbox.status(message_id)["status"] == "sent" for message_id in ids)
+
+
+def test_temporary_failure_is_retried(smtp_server, outbox):
+    """일시 오류는 백오프 후 재시도해서 발송"""
+    smtp_server.fail_next = 2
+    message_id = outbox.enqueue(make_message("retry@test.com"))
+
+    assert wait_for(lambda: outbox.status(message_id)["status"] == "sent")
+    status = outbox.status(message_id)
+    assert status["attempts"] == 3
+    assert outbox.stats()["retries"] == 2
+    assert len(smtp_server.messages) == 1
+
+
+def test_gives_up_after_max_attempts(smtp_server):
+    outbox = EmailOutbox(
+        "127.0.0.1",
+        smtp_server.server_address[1],
+        use_tls=False,
+        max_attempts=2,
+        retry_base=0.05,
+    )
+    outbox.start()
+    try:
+        smtp_server.fail_next = 5
+        message_id = outbox.enqueue(make_message("fail@test.com"))
+
+        assert wait_for(lambda: outbox.status(message_id)["status"] == "failed")
+        assert outbox.status(message_id)["attempts"] == 2
+        assert outbox.stats()["failed"] == 1
+    finally:
+        outbox.stop(timeout=2)
+
+
+def test_enqueue_returns_immediately_when_full():
+    """워커가 없어도 enqueue는 막히지 않고, 가득 차면 None"""
+    outbox = EmailOutbox("127.0.0.1", 1, use_tls=False, max_queue=1)
+    assert outbox.enqueue(make_message("a@test.com")) is not None
+    assert outbox.enqueue(make_message("b@test.com")) is None
+    assert outbox.stats()["rejected"] == 1
+
+
+def test_status_is_visible_from_another_worker(smtp_server, outbox, fake_redis):
+    """발송 상태는 Redis에 있으므로 메일을 보내지 않은 워커에서도 조회"""
+    message_id = outbox.enqueue(make_message("shared@test.com"))
+    assert wait_for(lambda: outbox.status(message_id)["status"] == "sent")
+
+    other_worker = EmailOutbox("127.0.0.1", 1, use_tls=False)
+    status = other_worker.status(message_id)
+    assert status["status"] == "sent"
+    assert status["to"] == "shared@test.com"
+    assert status["attempts"] == 1
+    assert status["error"] is None
+    assert fake_redis.ttls[f"email_status:{message_id}"] == outbox_module.EMAIL_STATUS_TTL
+    assert other_worker.status("unknown") is None
@@ -0,0 +1,64 @@
+# tests/core/test_rate_limit.py
+
+from collections import OrderedDict
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+import app.core.rate_limit as rate_limit_module
+
+app = FastAPI()
+
+
+@app.get("/limited", dependencies=[Depends(rate_limit_module.rate_limit("test"))])
+def limited():
+    return {"ok": True}
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def local_buckets(monkeypatch):
+    """Redis 없이 프로세스 내 버킷으로 동작"""
+    monkeypatch.setattr(rate_limit_module, "_bucket_script", None)
+    monkeypatch.setattr(rate_limit_module, "_local_buckets", OrderedDict())
+    monkeypatch.setattr(rate_limit_module, "_stats", {})
+    monkeypatch.setenv("RATE_LIMIT_TEST", "3/60")
+
+
+def test_parse_limit():
+    capacity, rate = rate_limit_module.parse_limit("10/60")
+    assert capacity == 10
+    assert rate == pytest.approx(10 / 60)
+
+
+def test_bucket_limits_and_sets_headers():
+    """한도까지 통과 (남은 횟수 헤더), 초과 시 429 + Retry-After"""
+    remaining = []
+    for _ in range(3):
+        response = client.get("/limited")
+        assert response.status_code == 200
+        assert response.headers["X-RateLimit-Limit"] == "3"
+        remaining.append(response.headers["X-RateLimit-Remaining"])
+    assert remaining == ["2", "1", "0"]
+
+    response = client.get("/limited")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+
+    counters = rate_limit_module.rate_limit_stats()["counters"]["test"]
+    assert counters["allowed"] == 3 and counters["limited"] == 1
+    assert counters["local_fallback"] == 4
+
+
+def test_bucket_refills_over_time(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(rate_limit_module.time, "time", lambda: clock["now"])
+    for _ in range(3):
+        assert rate_limit_module.take("test", "ip:1")[0]
+    assert not rate_limit_module.take("test", "ip:1")[0]
+    assert rate_limit_module.take("test", "ip:2")[0]  # 다른 클라이언트는 별도 버킷
+
+    clock["now"] += 20  # 3/60 → 20초에 토큰 1개
+    assert rate_limit_module.take("test", "ip:1")[0]
+    assert not rate_limit_module.take("test", "ip:1")[0]
@@ -0,0 +1,78 @@
+# tests/core/test_security.py
+
+import asyncio
+import threading
+import pytest
+from fastapi import HTTPException
+from app.core.security import PasswordWorkerPool, hash_password, verify_password
+
+
+def test_hash_and_verify_run_in_password_pool():
+    hashed = hash_password("secret")
+    assert verify_password("secret", hashed)
+    assert not verify_password("wrong", hashed)
+
+
+def test_saturated_pool_rejects_with_retry_after():
+    """실행 중 + 대기가 한도에 차면 기다리지 않고 503"""
+    pool = PasswordWorkerPool(workers=1, max_pending=1, timeout=5)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(value=pool.run(slow)))
+    worker.start()
+    started.wait(5)
+
+    with pytest.raises(HTTPException) as exc:
+        pool.run(lambda: "never")
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"]
+
+    release.set()
+    worker.join(5)
+    assert result["value"] == "done"
+    stats = pool.stats()
+    assert stats["rejected"] == 1 and stats["completed"] == 1
+
+
+def test_run_async_waits_without_holding_a_thread():
+    """await 중에는 호출 측 스레드를 쓰지 않음 - 이벤트 루프는 계속 돌아감"""
+    pool = PasswordWorkerPool(workers=1, max_pending=4, timeout=5)
+    release = threading.Event()
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+                ticks += 1
+            return ticks
+
+        job = asyncio.create_task(pool.run_async(lambda: release.wait(5) and "done"))
+        ticked = asyncio.create_task(ticker())
+        await asyncio.sleep(0.1)
+        release.set()
+        return await job, await ticked
+
+    result, ticks = asyncio.run(scenario())
+    assert result == "done"
+    assert ticks >= 5
+
+
+def test_run_async_timeout_returns_503():
+    pool = PasswordWorkerPool(workers=1, max_pending=2, timeout=0.05)
+    release = threading.Event()
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(pool.run_async(release.wait, 5))
+    release.set()
+    assert exc.value.status_code == 503
+    assert pool.stats()["timeouts"] == 1
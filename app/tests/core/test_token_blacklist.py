@@ -0,0 +1,133 @@
+# tests/core/test_token_blacklist.py
+
+import threading
+import time
+from datetime import timedelta
+import pytest
+import app.core.redis_events as events_module
+import app.core.token_blacklist as blacklist_module
+from app.core.bloom_filter import BloomFilter
+from app.core.jwt_utils import create_access_token
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.exists_calls = 0
+
+    def setex(self, key, time_delta, value):
+        self.store[key] = value
+
+    def exists(self, key):
+        self.exists_calls += 1
+        return int(key in self.store)
+
+    def scan_iter(self, match=None, count=None):
+        prefix = match.rstrip("*")
+        return [k.encode() for k in self.store if k.startswith(prefix)]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(blacklist_module, "redis_client", fake)
+    monkeypatch.setattr(blacklist_module, "publish", lambda channel, data: True)
+    monkeypatch.setattr(blacklist_module, "_filter", None)
+    monkeypatch.setattr(blacklist_module, "_listening", True)  # 구독 중인 워커
+    return fake
+
+
+def make_token():
+    return create_access_token(data={"sub": "user@test.com"}, expires_delta=timedelta(hours=1))
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    items = [f"id-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_unrevoked_tokens_skip_redis(fake_redis):
+    """filter 동기화 후에는 폐기되지 않은 토큰을 Redis 없이 통과"""
+    blacklist_module.rebuild_revocation_filter()
+    for _ in range(5):
+        assert blacklist_module.is_token_blacklisted(make_token()) is False
+
+    assert fake_redis.exists_calls == 0
+
+
+def test_revoked_token_is_confirmed_with_redis(fake_redis):
+    """폐기 키는 jti 기준, filter 양성이면 Redis로 확인"""
+    blacklist_module.rebuild_revocation_filter()
+    token = make_token()
+    blacklist_module.add_token_to_blacklist(token, 60)
+
+    revoked_id = blacklist_module.token_id(token)
+    assert f"revoked:{revoked_id}" in fake_redis.store
+    assert len(revoked_id) == 32  # jti (uuid4 hex)
+    assert blacklist_module.is_token_blacklisted(token) is True
+    assert fake_redis.exists_calls == 1
+
+
+def test_rebuild_and_remote_events_update_filter(fake_redis):
+    """다른 워커가 폐기한 ID - 재생성(scan)과 pub/sub 이벤트 모두 반영"""
+    before, after = make_token(), make_token()
+    fake_redis.store[f"revoked:{blacklist_module.token_id(before)}"] = 1
+    blacklist_module.rebuild_revocation_filter()
+    assert blacklist_module.is_token_blacklisted(before) is True
+
+    fake_redis.store[f"revoked:{blacklist_module.token_id(after)}"] = 1
+    blacklist_module._on_revoked(blacklist_module.token_id(after))
+    assert blacklist_module.is_token_blacklisted(after) is True
+
+
+class DroppingPubSub:
+    """구독 직후 연결이 끊기는 pub/sub"""
+
+    def __init__(self, dropped: threading.Event):
+        self._dropped = dropped
+
+    def subscribe(self, *channels):
+        pass
+
+    def get_message(self, timeout=None):
+        self._dropped.set()
+        raise ConnectionError("Connection reset by peer")
+
+    def close(self):
+        pass
+
+
+def test_dropped_subscription_falls_back_to_redis(fake_redis, monkeypatch):
+    """구독이 끊긴 동안 다른 워커가 폐기한 토큰은 filter가 아니라 Redis로 확인"""
+    dropped = threading.Event()
+    fake_redis.pubsub = lambda ignore_subscribe_messages=True: DroppingPubSub(dropped)
+    monkeypatch.setattr(events_module, "redis_client", fake_redis)
+    monkeypatch.setattr(events_module, "RECONNECT_DELAY", 30.0)
+    monkeypatch.setattr(
+        events_module,
+        "_subscriptions",
+        {blacklist_module.REVOKED_CHANNEL: events_module._subscriptions[blacklist_module.REVOKED_CHANNEL]},
+    )
+    monkeypatch.setattr(blacklist_module, "_listening", False)
+
+    events_module.start_event_listener()
+    try:
+        assert dropped.wait(2)
+        for _ in range(200):
+            if not blacklist_module.blacklist_stats()["filter_ready"]:
+                break
+            time.sleep(0.01)
+        # 끊긴 동안 다른 워커가 폐기 (이 워커에는 이벤트가 오지 않음)
+        token = make_token()
+        fake_redis.store[f"revoked:{blacklist_module.token_id(token)}"] = 1
+
+        assert blacklist_module.blacklist_stats()["filter_ready"] is False
+        assert blacklist_module.is_token_blacklisted(token) is True
+    finally:
+        events_module.stop_event_listener()
@@ -0,0 +1,86 @@
+# tests/core/test_token_cache.py
+
+from datetime import datetime, timedelta, timezone
+import pytest
+import app.core.jwt_utils as jwt_module
+import app.core.token_blacklist as blacklist_module
+from app.core.token_cache import TokenCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def setex(self, key, time_delta, value):
+        self.store[key] = value
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = TokenCache(max_size=2, ttl=300)
+    monkeypatch.setattr(jwt_module, "token_cache", cache)
+    monkeypatch.setattr(blacklist_module, "token_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls = []
+    original = jwt_module.jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return original(token, *args, **kwargs)
+
+    monkeypatch.setattr(jwt_module.jwt, "decode", counting_decode)
+    return calls
+
+
+def make_token(email="user@test.com", hours=1):
+    return jwt_module.create_access_token(
+        data={"sub": email}, expires_delta=timedelta(hours=hours)
+    )
+
+
+def test_repeated_verify_skips_decode(cache, decode_calls):
+    """같은 토큰은 한 번만 디코딩"""
+    token = make_token()
+    for _ in range(3):
+        assert jwt_module.verify_token(token)["sub"] == "user@test.com"
+
+    assert len(decode_calls) == 1
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+def test_entry_expires_at_token_exp(cache):
+    """토큰 exp가 지나면 캐시에서도 만료"""
+    exp = (datetime.now(timezone.utc) - timedelta(seconds=1)).timestamp()
+    cache.put("expired", {"sub": "user@test.com", "exp": exp})
+
+    assert cache.get("expired") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_lru_eviction(cache):
+    """가득 차면 가장 오래 사용하지 않은 항목 제거"""
+    cache.put("a", {"sub": "a"})
+    cache.put("b", {"sub": "b"})
+    cache.get("a")
+    cache.put("c", {"sub": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"sub": "a"}
+    assert cache.stats()["evicted"] == 1
+
+
+def test_blacklist_purges_cached_token(cache, decode_calls, monkeypatch):
+    """블랙리스트 등록 시 캐시에서 즉시 제거"""
+    monkeypatch.setattr(blacklist_module, "redis_client", FakeRedis())
+    token = make_token()
+    jwt_module.verify_token(token)
+
+    blacklist_module.add_token_to_blacklist(token, 60)
+
+    assert cache.get(token) is None
+    assert cache.stats()["invalidated"] == 1
@@ -0,0 +1,190 @@
+# tests/database/test_pool.py
+
+import gc
+import threading
+import time
+import pytest
+from app.database.pool import ConnectionPool, PoolTimeout
+
+
+# --- Fake MySQL Connection ---
+class FakeRawConnection:
+    def __init__(self):
+        self.closed = False
+        self.pings = 0
+        self.rollbacks = 0
+        self.in_transaction = False
+        self.unread_result = False
+        self.fail_ping = False
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if self.fail_ping:
+            raise Exception("server has gone away")
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+    def consume_results(self):
+        self.unread_result = False
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def creator():
+        conn = FakeRawConnection()
+        created.append(conn)
+        return conn
+
+    return ConnectionPool(creator, **kwargs), created
+
+
+def test_connection_is_reused():
+    pool, created = make_pool(size=2, max_overflow=0)
+
+    conn = pool.connect()
+    conn.close()
+    conn = pool.connect()
+    conn.close()
+
+    assert len(created) == 1
+    stats = pool.stats()
+    assert stats["checkouts"] == 2
+    assert stats["connects"] == 1
+    assert stats["idle"] == 1
+    assert stats["in_use"] == 0
+
+
+def test_context_manager_returns_connection():
+    pool, created = make_pool(size=1, max_overflow=0)
+
+    with pool.connect() as conn:
+        assert conn.is_connected()
+        assert pool.stats()["in_use"] == 1
+
+    # 반납 후 래퍼는 끊긴 것으로 보이고, 다시 close 해도 중복 반납되지 않음
+    assert not conn.is_connected()
+    conn.close()
+    assert pool.stats()["idle"] == 1
+    assert not created[0].closed
+
+
+def test_open_transaction_is_rolled_back_on_checkin():
+    pool, created = make_pool(size=1, max_overflow=0)
+
+    conn = pool.connect()
+    created[0].in_transaction = True
+    conn.close()
+
+    assert created[0].rollbacks == 1
+
+
+def test_overflow_connections_are_closed_on_checkin():
+    pool, created = make_pool(size=1, max_overflow=1)
+
+    first = pool.connect()
+    second = pool.connect()
+    first.close()
+    second.close()
+
+    assert len(created) == 2
+    assert pool.stats()["open"] == 1
+    assert sum(c.closed for c in created) == 1
+
+
+def test_checkout_timeout_when_exhausted():
+    pool, _ = make_pool(size=1, max_overflow=0, timeout=0.05)
+
+    conn = pool.connect()
+    with pytest.raises(PoolTimeout):
+        pool.connect()
+    conn.close()
+
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["waits"] == 1
+
+
+def test_waiter_gets_returned_connection():
+    pool, created = make_pool(size=1, max_overflow=0, timeout=2)
+    conn = pool.connect()
+
+    def release():
+        time.sleep(0.05)
+        conn.close()
+
+    threading.Thread(target=release).start()
+    with pool.connect():
+        pass
+
+    assert len(created) == 1
+    assert pool.stats()["waits"] == 1
+
+
+def test_pre_ping_replaces_dead_connection():
+    pool, created = make_pool(size=1, max_overflow=0, ping_interval=0)
+
+    pool.connect().close()
+    created[0].fail_ping = True
+    pool.connect().close()
+
+    assert len(created) == 2
+    assert created[0].closed
+    assert pool.stats()["ping_failures"] == 1
+
+
+def test_old_connection_is_recycled():
+    pool, created = make_pool(size=1, max_overflow=0, recycle=0.01)
+
+    pool.connect().close()
+    time.sleep(0.02)
+    pool.connect().close()
+
+    assert len(created) == 2
+    assert pool.stats()["recycled"] == 1
+
+
+def test_failed_connect_frees_slot():
+    def creator():
+        raise Exception("connection refused")
+
+    pool = ConnectionPool(creator, size=1, max_overflow=0, timeout=0.05)
+    for _ in range(2):
+        with pytest.raises(Exception, match="connection refused"):
+            pool.connect()
+
+    assert pool.stats()["open"] == 0
+
+
+def test_close_returns_dropped_connection():
+    pool, created = make_pool(size=1, max_overflow=0, timeout=0.05)
+
+    conn = pool.connect()
+    created[0].closed = True  # 서버 쪽에서 끊김
+    assert not conn.is_connected()
+    conn.close()
+
+    assert pool.stats()["in_use"] == 0
+    pool.connect().close()
+
+
+def test_abandoned_connection_frees_slot():
+    pool, created = make_pool(size=1, max_overflow=0, timeout=0.05)
+
+    conn = pool.connect()
+    del conn
+    gc.collect()
+
+    stats = pool.stats()
+    assert stats["open"] == 0
+    assert stats["lost"] == 1
+    assert created[0].closed
+    pool.connect().close()
@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+from contextlib import contextmanager
 import pytest
 from fastapi.testclient import TestClient
 from main import app  # main.py에서 FastAPI 인스턴스(app)를 import
@@ -60,8 +61,12 @@ app.dependency_overrides[
 
 
 # (2) 이메일 전송: 실제 이메일 전송 기능을 사용하지 않고 Dummy 함수 사용
-def fake_send_email(to_email, subject, body, attachment_path=None):
+sent_emails = []
+
+
+def fake_send_email(to_email, subject, body, attachment_path=None, attachments=None):
     # 필요 시 로그에 기록하거나 단순히 True를 반환합니다.
+    sent_emails.append({"to": to_email, "attachments": attachments})
     return True
 
 
@@ -153,6 +158,65 @@ def test_approve_file_request(monkeypatch):
     )
     assert expected_message in data["message"]
 
+    # 첨부 파일은 디스크를 거치지 않고 bytes로 전달
+    filename, content, mimetype = sent_emails[-1]["attachments"][0]
+    assert filename == "Region1_도로추천.csv"
+    assert content.decode().startswith("rds_id,road_name")
+    assert mimetype == "text/csv"
+
+
+# === 테스트 케이스: 추천 결과 파일 다운로드 (GET /file-requests/{log_id}/export) ===
+def test_download_file_request_xlsx(monkeypatch):
+    fake_request = {
+        "recommended_roads": json.dumps(
+            {
+                "rds_rg": "Region2",
+                "recommended_roads": [
+                    {
+                        "rds_id": "r1",
+                        "road_name": "Road1",
+                        "rbp": "data",
+                        "rep": "data",
+                        "rd_slope": 1.5,
+                        "acc_occ": 2,
+                        "acc_sc": 3,
+                        "rd_fr": 4,
+                        "pred_idx": 0.9,
+                    }
+                ],
+            }
+        ),
+    }
+    fake_cursor = FakeCursor(fetchone_data=fake_request)
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        yield fake_cursor
+
+    monkeypatch.setattr("app.api.routes.admin.db_cursor", fake_db_cursor)
+
+    response = client.get("/admin/file-requests/2/export?format=xlsx")
+    assert response.status_code == 200
+    assert response.content[:2] == b"PK"  # zip (xlsx)
+    assert "filename*=UTF-8''Region2_" in response.headers["content-disposition"]
+
+    response = client.get("/admin/file-requests/2/export?format=pdf")
+    assert response.status_code == 400
+
+
+def test_download_file_request_connection_error(monkeypatch):
+    """커넥션을 못 얻으면 원래 오류 그대로 (정리 코드에서 UnboundLocalError가 나지 않음)"""
+
+    @contextmanager
+    def failing_db_cursor(dictionary=False, commit=False):
+        raise RuntimeError("pool exhausted")
+        yield
+
+    monkeypatch.setattr("app.api.routes.admin.db_cursor", failing_db_cursor)
+
+    with pytest.raises(RuntimeError, match="pool exhausted"):
+        client.get("/admin/file-requests/2/export?format=csv")
+
 
 # === 테스트 케이스: 파일 거부 (POST /file-requests/reject/{log_id}) ===
 def test_reject_file_request(monkeypatch):
@@ -67,7 +67,7 @@ def fake_find_user(email: str):
     return {"user_email": email, "user_ps": "hashed_password", "user_name": "Test User"}
 
 
-def fake_verify_password(password, hashed):
+async def fake_verify_password(password, hashed):
     return password == "correct_password"
 
 
@@ -95,17 +95,28 @@ def fake_add_token_to_blacklist(token, remaining_time):
     return True
 
 
-def fake_hash_password(password):
+async def fake_hash_password(password):
     return "hashed_" + password
 
 
+def async_return(value):
+    async def fake(*args, **kwargs):
+        return value
+
+    return fake
+
+
+async def fake_verify_hashed(password, hashed):
+    return hashed == "hashed"
+
+
 # --- 오버라이드할 전역 변수 (인증 관련) ---
 import app.api.routes.auth as auth_module
 
 auth_module.find_user_by_email = fake_find_user_none
 auth_module.is_admin = fake_is_admin
-auth_module.hash_password = fake_hash_password
-auth_module.verify_password = fake_verify_password
+auth_module.hash_password_async = fake_hash_password
+auth_module.verify_password_async = fake_verify_password
 auth_module.create_access_token = fake_create_access_token
 auth_module.create_refresh_token = fake_create_refresh_token
 auth_module.send_signup_email = fake_send_signup_email
@@ -247,10 +258,17 @@ def test_findpwd(monkeypatch):
     monkeypatch.setattr(
         auth_module, "send_verification_email", lambda email, code: True
     )
+    saved_codes = {}
+    monkeypatch.setattr(
+        auth_module,
+        "save_verification_code",
+        lambda email, code: saved_codes.update({email: code}),
+    )
 
     data = {"email": "test@gmail.com"}
     response = client.post("auth/findpwd", json=data)
     assert response.status_code == 200
+    assert saved_codes == {"test@gmail.com": "123456"}
     res_data = response.json()
     assert "인증번호가 이메일로 발송되었습니다." in res_data.get("message", "")
 
@@ -260,8 +278,12 @@ def test_verify_code(monkeypatch):
     POST /verify-code
     올바른 인증코드 입력 시, reset_token 발급
     """
-    # 먼저, 테스트 전에 global verification_codes에 값을 셋팅
-    auth_module.verification_codes["test@gmail.com"] = "123456"
+    # 인증번호 저장소: 코드 일치로 응답
+    monkeypatch.setattr(
+        auth_module,
+        "check_verification_code",
+        lambda email, code: "ok" if code == "123456" else "invalid",
+    )
     monkeypatch.setattr(auth_module, "find_user_by_email", fake_find_user)
 
     data = {"email": "test@gmail.com", "code": "123456"}
@@ -274,6 +296,20 @@ def test_verify_code(monkeypatch):
     assert "reset_token" in res_data
 
 
+def test_verify_code_too_many_attempts(monkeypatch):
+    """
+    POST /verify-code
+    틀린 인증번호를 한도 이상 입력하면 429
+    """
+    monkeypatch.setattr(
+        auth_module, "check_verification_code", lambda email, code: "locked"
+    )
+
+    data = {"email": "test@gmail.com", "code": "000000"}
+    response = client.post("auth/verify-code", json=data)
+    assert response.status_code == 429
+
+
 def test_reset_password(monkeypatch):
     """
     POST /reset-password
@@ -286,7 +322,7 @@ def test_reset_password(monkeypatch):
         lambda token, **kwargs: {"sub": "test@gmail.com", "action": "password_reset"},
     )
     monkeypatch.setattr(auth_module, "find_user_by_email", fake_find_user)
-    monkeypatch.setattr(auth_module, "hash_password", lambda pwd: "hashed_new_password")
+    monkeypatch.setattr(auth_module, "hash_password_async", async_return("hashed_new_password"))
 
     # Fake DB 연결 (UPDATE 쿼리 기록용)
     fake_cursor = FakeCursor()
@@ -302,3 +338,25 @@ def test_reset_password(monkeypatch):
     assert response.status_code == 200
     res_data = response.json()
     assert "비밀번호가 성공적으로 재설정되었습니다." in res_data.get("message", "")
+
+
+def test_login_checks_password_from_db(monkeypatch):
+    """
+    POST /login
+    비밀번호는 캐시된 사용자 정보가 아니라 DB에서 직접 읽은 값과 비교
+    """
+    monkeypatch.setattr(
+        auth_module,
+        "find_user_by_email",
+        lambda email: {"user_email": email, "user_name": "Test User", "is_admin": 1},
+    )
+    monkeypatch.setattr(auth_module, "is_admin", lambda email: 1)
+    monkeypatch.setattr(auth_module, "get_stored_password", lambda email: "hashed")
+    monkeypatch.setattr(auth_module, "verify_password_async", fake_verify_hashed)
+    monkeypatch.setattr(auth_module.presence, "touch", lambda email, force=False: None)
+
+    response = client.post(
+        "auth/login", json={"email": "test@gmail.com", "password": "whatever"}
+    )
+    assert response.status_code == 200
+    assert response.json().get("access_token") == "fake_access_token"
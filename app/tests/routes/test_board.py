@@ -6,6 +6,7 @@ import tempfile
 from datetime import datetime
 from io import BytesIO
 import pytest
+from contextlib import asynccontextmanager
 from fastapi.testclient import TestClient
 
 from main import app
@@ -49,6 +50,32 @@ class FakeConnection:
         return True
 
 
+# --- Fake Async Cursor (async_cursor 대체) ---
+class FakeAsyncCursor:
+    def __init__(self, fetchone_data=None, fetchall_data=None, lastrowid=1):
+        self._fetchone_data = fetchone_data
+        self._fetchall_data = fetchall_data or []
+        self.lastrowid = lastrowid
+        self.executed_queries = []
+
+    async def execute(self, query, params=None):
+        self.executed_queries.append((query, params))
+
+    async def fetchall(self):
+        return self._fetchall_data
+
+    async def fetchone(self):
+        return self._fetchone_data
+
+
+def fake_async_cursor_factory(cursor_instance):
+    @asynccontextmanager
+    async def fake_async_cursor(commit=False):
+        yield cursor_instance
+
+    return fake_async_cursor
+
+
 # --- Fake Redis ---
 class FakeRedis:
     def __init__(self):
@@ -227,9 +254,9 @@ def test_add_comment(monkeypatch):
         "comment": "This is a test comment.",
         "comment_date": datetime(2023, 10, 10, 11, 0, 0),
     }
-    fake_cursor = FakeCursor(fetchone_data=fake_comment)
+    fake_cursor = FakeAsyncCursor(fetchone_data=fake_comment)
     monkeypatch.setattr(
-        board_module, "get_connection", lambda: FakeConnection(fake_cursor)
+        board_module, "async_cursor", fake_async_cursor_factory(fake_cursor)
     )
     # Fake notification for new comment
     monkeypatch.setattr(board_module, "notify_new_comment", fake_notify_new_post)
@@ -247,3 +274,72 @@ def test_add_comment(monkeypatch):
 
 
 # 필요하다면 update_post, delete_post, add_answer, delete_answer, 파일 다운로드 등 추가 테스트 케이스를 작성합니다.
+
+
+GIF_BYTES = b"GIF89a\x01\x00\x01\x00\x00\x00\x00;"
+
+
+@pytest.fixture
+def post_with_file(monkeypatch, tmp_path):
+    """기존 첨부 파일이 하나 있는 게시글"""
+    old_file = tmp_path / "old.gif"
+    old_file.write_bytes(GIF_BYTES)
+    fake_cursor = FakeAsyncCursor(
+        fetchone_data={
+            "post_id": 1,
+            "board_id": 1,
+            "user_email": "user@example.com",
+            "post_title": "Updated",
+            "post_category": "General",
+            "post_text": "text",
+            "post_time": datetime(2023, 10, 10, 10, 0, 0),
+            "views": 0,
+        },
+        fetchall_data=[{"file_id": 1, "file_path": str(old_file)}],
+    )
+    monkeypatch.setattr(board_module, "UPLOAD_FOLDER", str(tmp_path / "uploads"))
+    os.makedirs(board_module.UPLOAD_FOLDER)
+    monkeypatch.setattr(
+        board_module, "async_cursor", fake_async_cursor_factory(fake_cursor)
+    )
+    monkeypatch.setattr(board_module, "notify_updated_post", fake_notify_new_post)
+    return old_file, fake_cursor
+
+
+def update_with(file_name, content):
+    return client.put(
+        "/board/1",
+        data={
+            "board_id": "1",
+            "post_title": "Updated",
+            "post_category": "General",
+            "post_text": "text",
+        },
+        files=[("files", (file_name, BytesIO(content), "image/gif"))],
+    )
+
+
+def test_update_post_rejected_upload_keeps_old_files(post_with_file):
+    """새 파일 검사에 실패하면 DB도 기존 파일도 건드리지 않음"""
+    old_file, fake_cursor = post_with_file
+
+    response = update_with("evil.gif", b"#!/bin/sh\necho hi\n")
+
+    assert response.status_code != 200
+    assert old_file.exists()
+    assert fake_cursor.executed_queries == []
+    assert os.listdir(board_module.UPLOAD_FOLDER) == []
+
+
+def test_update_post_removes_old_files_after_commit(post_with_file):
+    old_file, fake_cursor = post_with_file
+
+    response = update_with("new.gif", GIF_BYTES)
+
+    assert response.status_code == 200
+    assert not old_file.exists()
+    assert os.listdir(board_module.UPLOAD_FOLDER) == ["new.gif"]
+    assert any(
+        q.strip().startswith("DELETE FROM file_metadata")
+        for q, _ in fake_cursor.executed_queries
+    )
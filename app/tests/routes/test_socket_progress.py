@@ -0,0 +1,54 @@
+# tests/routes/test_socket_progress.py
+
+import asyncio
+import pytest
+import app.api.socket as socket_module
+from app.api.socket import ProgressReporter, user_room
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    events = []
+
+    async def fake_emit(event, data=None, room=None, **kwargs):
+        events.append((event, data, room))
+
+    monkeypatch.setattr(socket_module.sio, "emit", fake_emit)
+    monkeypatch.setattr(socket_module, "user_connections", {"user@test.com": {"sid1"}})
+    monkeypatch.setattr(socket_module, "_last_progress", {})
+    return events
+
+
+def run_stages(reporter, stages):
+    async def scenario():
+        for name in stages:
+            await reporter.stage(name)
+
+    asyncio.run(scenario())
+
+
+def test_progress_goes_only_to_user_room(emitted):
+    reporter = ProgressReporter("user@test.com", min_interval=0)
+    run_stages(reporter, ["fetch", "infer", "rank", "persist", "done"])
+
+    assert [data["stage"] for _, data, _ in emitted] == [
+        "fetch", "infer", "rank", "persist", "done"
+    ]
+    assert [data["progress"] for _, data, _ in emitted] == [10, 30, 60, 85, 100]
+    assert {room for _, _, room in emitted} == {user_room("user@test.com")}
+    assert all(event == "progressUpdate" for event, _, _ in emitted)
+
+
+def test_fast_stages_are_throttled_but_done_is_sent(emitted):
+    reporter = ProgressReporter("user@test.com", min_interval=60)
+    run_stages(reporter, ["fetch", "infer", "rank", "persist", "done"])
+
+    assert [data["stage"] for _, data, _ in emitted] == ["fetch", "done"]
+    assert reporter.sent == 2
+
+
+def test_nothing_sent_without_connection(emitted):
+    reporter = ProgressReporter("offline@test.com", min_interval=0)
+    run_stages(reporter, ["fetch", "done"])
+
+    assert emitted == []
@@ -0,0 +1,175 @@
+# tests/services/test_broadcast.py
+
+import threading
+from contextlib import contextmanager
+import pytest
+import app.services.broadcast as broadcast_module
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self._calls.append((getattr(self._redis, name), args, kwargs))
+
+        return call
+
+    def execute(self):
+        for method, args, kwargs in self._calls:
+            method(*args, **kwargs)
+
+
+class FakeRedis:
+    """hash만 (진행 상황은 다른 워커에서도 같은 Redis로 조회)"""
+
+    def __init__(self):
+        self.hashes = {}
+        self._lock = threading.Lock()
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        with self._lock:
+            entry = self.hashes.setdefault(key, {})
+            for k, v in (mapping or {field: value}).items():
+                entry[k.encode()] = str(v).encode()
+
+    def hdel(self, key, *fields):
+        with self._lock:
+            for field in fields:
+                self.hashes.get(key, {}).pop(field.encode(), None)
+
+    def hincrby(self, key, field, amount=1):
+        with self._lock:
+            entry = self.hashes.setdefault(key, {})
+            entry[field.encode()] = str(int(entry.get(field.encode(), 0)) + amount).encode()
+
+    def expire(self, key, ttl):
+        pass
+
+    def hgetall(self, key):
+        with self._lock:
+            return dict(self.hashes.get(key, {}))
+
+
+class FakeSession:
+    """SMTP 연결 대신 발송 기록 (연결 수 확인용)"""
+
+    sessions = []
+    db_open = None  # 발송 시점에 DB 연결을 잡고 있는지 확인용
+
+    def __init__(self):
+        self.sent = []
+        self.connected = False
+        FakeSession.sessions.append(self)
+
+    def send(self, msg):
+        assert not FakeSession.db_open["open"], "DB 연결을 잡은 채로 발송"
+        if msg["To"].startswith("bad"):
+            raise Exception("550 mailbox unavailable")
+        self.connected = True
+        self.sent.append((msg["To"], msg["Subject"]))
+
+    def close(self):
+        self.connected = False
+
+
+class FakeCursor:
+    def __init__(self, emails):
+        self.emails = emails
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+
+    def __iter__(self):
+        return iter([(email,) for email in self.emails])
+
+
+@pytest.fixture
+def env(monkeypatch):
+    FakeSession.sessions = []
+    cursor = FakeCursor([f"user{i}@test.com" for i in range(20)] + ["bad@test.com"])
+
+    FakeSession.db_open = {"open": False}
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        FakeSession.db_open["open"] = True
+        try:
+            yield cursor
+        finally:
+            FakeSession.db_open["open"] = False
+
+    monkeypatch.setattr(broadcast_module, "db_cursor", fake_db_cursor)
+    monkeypatch.setattr(broadcast_module, "redis_client", FakeRedis())
+    monkeypatch.setattr(broadcast_module, "_make_session", FakeSession)
+    return cursor
+
+
+def test_broadcast_delivers_over_fixed_connection_pool(env):
+    broadcast = broadcast_module.Broadcast(
+        "공지", "내용", jurisdiction="강남구", connections=3
+    )
+    broadcast.run()
+
+    progress = broadcast_module.get_broadcast(broadcast.id)
+    assert progress["status"] == "done"
+    assert progress["total"] == 21
+    assert progress["sent"] == 20 and progress["failed"] == 1
+    assert "550" in progress["failures"]["bad@test.com"]
+
+    # 연결(세션)은 워커 수만큼만, 수신자마다 To만 바뀐 같은 메시지
+    assert len(FakeSession.sessions) == 3
+    delivered = [to for s in FakeSession.sessions for to, _ in s.sent]
+    assert sorted(delivered) == sorted(f"user{i}@test.com" for i in range(20))
+
+    # 수신자 조회는 조건 포함 한 번
+    assert len(env.queries) == 1
+    assert "jurisdiction = %s" in env.queries[0][0]
+    assert env.queries[0][1] == ("강남구",)
+
+
+def test_start_broadcast_returns_before_delivery(env, monkeypatch):
+    release = threading.Event()
+    original_send = FakeSession.send
+
+    def slow_send(self, msg):
+        release.wait(5)
+        original_send(self, msg)
+
+    monkeypatch.setattr(FakeSession, "send", slow_send)
+    broadcast = broadcast_module.start_broadcast("공지", "내용", connections=2)
+    progress = broadcast_module.get_broadcast(broadcast.id)
+    assert progress["sent"] == 0
+    assert progress["status"] in ("queued", "running")
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == f"broadcast-{broadcast.id[:8]}":
+            thread.join(5)
+    progress = broadcast_module.get_broadcast(broadcast.id, include_results=True)
+    assert progress["status"] == "done"
+    assert progress["results"]["user0@test.com"] == "sent"
+    assert broadcast_module.get_broadcast("unknown") is None
+
+
+def test_recipient_query_failure_is_recorded(env, monkeypatch):
+    @contextmanager
+    def broken_db_cursor(dictionary=False, commit=False):
+        raise Exception("pool exhausted")
+        yield
+
+    monkeypatch.setattr(broadcast_module, "db_cursor", broken_db_cursor)
+    broadcast = broadcast_module.Broadcast("공지", "내용", connections=2)
+    broadcast.run()
+
+    progress = broadcast_module.get_broadcast(broadcast.id)
+    assert progress["status"] == "failed"
+    assert progress["error"] == "pool exhausted"
+    assert progress["total"] == 0 and progress["finished_at"]
+    assert FakeSession.sessions == []
@@ -0,0 +1,154 @@
+# tests/services/test_inference_executor.py
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fastapi import HTTPException
+import app.services.inference_executor as executor_module
+from app.services.inference_executor import InferenceExecutor
+
+
+def slow_job(seconds: float):
+    time.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def executor():
+    executor = InferenceExecutor(kind="thread", workers=1, max_pending=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_event_loop_keeps_running_during_job(executor):
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        timings = {}
+        result = await executor.run("infer", slow_job, 0.2, timings=timings)
+        task.cancel()
+        return result, ticks, timings
+
+    result, ticks, timings = asyncio.run(scenario())
+    assert result == 0.2
+    assert ticks >= 5  # 작업 중에도 다른 코루틴이 실행됨
+    assert timings["infer"] >= 150
+    assert executor.stats()["stages"]["infer"]["count"] == 1
+
+
+def test_rejects_when_pending_limit_reached(executor):
+    async def scenario():
+        jobs = [
+            asyncio.create_task(executor.run("infer", slow_job, 0.2)) for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        with pytest.raises(HTTPException) as exc:
+            await executor.run("infer", slow_job, 0)
+        await asyncio.gather(*jobs)
+        return exc.value
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 503
+    assert error.headers["Retry-After"]
+    assert executor.stats()["rejected"] == 1
+
+
+def test_queue_timeout_skips_stale_job():
+    executor = InferenceExecutor(kind="thread", workers=1, queue_timeout=0.05)
+
+    async def scenario():
+        first = asyncio.create_task(executor.run("infer", slow_job, 0.2))
+        await asyncio.sleep(0.01)
+        with pytest.raises(HTTPException):
+            await executor.run("infer", slow_job, 0)
+        await first
+
+    try:
+        asyncio.run(scenario())
+        stats = executor.stats()
+        assert stats["timeouts"] == 1
+        assert stats["stages"]["infer"]["count"] == 1
+        assert stats["pending"] == 0
+    finally:
+        executor.shutdown()
+
+
+def test_process_executor():
+    executor = InferenceExecutor(kind="process", workers=1)
+    try:
+        assert asyncio.run(executor.run("rank", sum, [1, 2, 3])) == 6
+    finally:
+        executor.shutdown()
+
+
+def test_process_executor_runs_in_thread_jobs_without_pickling():
+    executor = InferenceExecutor(kind="process", workers=1)
+    unpicklable = threading.Lock()  # 프로세스로 넘기면 피클링 실패
+    try:
+        result = asyncio.run(
+            executor.run("rank", lambda lock: lock.locked(), unpicklable, in_thread=True)
+        )
+        assert result is False
+        assert executor.stats()["stages"]["rank"]["count"] == 1
+    finally:
+        executor.shutdown()
+
+
+class FakeActive:
+    def __init__(self, version, factor):
+        self.version = version
+        self.factor = factor
+
+    def predict(self, features):
+        return [x * self.factor for x in features]
+
+
+@pytest.fixture
+def worker_file(monkeypatch):
+    """프로세스 워커가 읽는 모델 파일 (버전을 바꿔 가며)"""
+    state = {"version": "v1", "loads": 0}
+
+    def fake_load():
+        state["loads"] += 1
+        return FakeActive(state["version"], 10 if state["version"] == "v1" else 20)
+
+    monkeypatch.setattr(executor_module, "load_active_model", fake_load)
+    monkeypatch.setattr(executor_module, "_worker_model", None)
+    return state
+
+
+def test_worker_model_is_labelled_by_the_file_it_loaded(worker_file):
+    assert executor_module._worker_predict("v1", [1]) == [10]
+    assert executor_module._worker_predict("v1", [2]) == [20]
+    assert worker_file["loads"] == 1
+
+    # 부모는 v2로 교체했는데 파일은 아직 v1 - v2 이름으로 v1 모델을 쓰지 않음
+    with pytest.raises(executor_module.WorkerModelMismatch):
+        executor_module._worker_predict("v2", [1])
+    assert executor_module._worker_model.version == "v1"
+
+    worker_file["version"] = "v2"
+    assert executor_module._worker_predict("v2", [1]) == [20]
+    assert executor_module._worker_model.version == "v2"
+
+
+def test_process_predict_falls_back_to_request_model_on_mismatch(worker_file):
+    executor = InferenceExecutor(kind="process", workers=1)
+    # 프로세스 대신 같은 프로세스의 스레드에서 _worker_predict 실행 (파일 적재를 바꿔 끼우기 위해)
+    executor._executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        worker_file["version"] = "v2"
+        active = FakeActive("v1", 3)
+        assert asyncio.run(executor.predict(active, [1, 2])) == [3, 6]
+        assert executor.stats()["stages"]["infer"]["count"] == 1
+    finally:
+        executor.shutdown()
@@ -0,0 +1,95 @@
+# tests/services/test_log_writer.py
+
+import time
+from contextlib import contextmanager
+import pytest
+import app.services.log_writer as log_writer_module
+from app.services.log_writer import BufferedLogWriter
+
+
+# --- Fake DB Cursor (executemany 기록용) ---
+class FakeCursor:
+    def __init__(self):
+        self.batches = []
+
+    def executemany(self, query, rows):
+        self.batches.append((query, list(rows)))
+
+
+@pytest.fixture
+def fake_cursor(monkeypatch):
+    cursor = FakeCursor()
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        yield cursor
+
+    monkeypatch.setattr(log_writer_module, "db_cursor", fake_db_cursor)
+    return cursor
+
+
+def test_flush_pending_writes_in_batches(fake_cursor):
+    writer = BufferedLogWriter("test", "INSERT", max_queue=100, batch_size=3)
+    for i in range(7):
+        assert writer.put((i,))
+
+    writer.flush_pending()
+
+    assert [len(rows) for _, rows in fake_cursor.batches] == [3, 3, 1]
+    stats = writer.stats()
+    assert stats["flushed"] == 7
+    assert stats["batches"] == 3
+    assert stats["queued"] == 0
+
+
+def test_full_queue_drops_rows(fake_cursor):
+    writer = BufferedLogWriter("test", "INSERT", max_queue=2)
+    assert writer.put((1,))
+    assert writer.put((2,))
+    assert not writer.put((3,))
+
+    assert writer.stats()["dropped"] == 1
+
+
+def test_background_thread_flushes_on_interval(fake_cursor):
+    writer = BufferedLogWriter(
+        "test", "INSERT", max_queue=100, batch_size=100, flush_interval=0.05
+    )
+    writer.start()
+    writer.put((1,))
+    writer.put((2,))
+
+    deadline = time.monotonic() + 2
+    while not fake_cursor.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.stop()
+
+    assert fake_cursor.batches[0][1] == [(1,), (2,)]
+
+
+def test_stop_drains_queue(fake_cursor):
+    writer = BufferedLogWriter(
+        "test", "INSERT", max_queue=100, batch_size=100, flush_interval=60
+    )
+    writer.start()
+    for i in range(5):
+        writer.put((i,))
+    writer.stop()
+
+    assert sum(len(rows) for _, rows in fake_cursor.batches) == 5
+    assert writer.stats()["flushed"] == 5
+
+
+def test_failed_write_is_counted(monkeypatch):
+    @contextmanager
+    def broken_db_cursor(dictionary=False, commit=False):
+        raise Exception("db down")
+        yield
+
+    monkeypatch.setattr(log_writer_module, "db_cursor", broken_db_cursor)
+    writer = BufferedLogWriter("test", "INSERT", max_queue=10)
+    writer.put((1,))
+    writer.flush_pending()
+
+    assert writer.stats()["failed"] == 1
+    assert writer.stats()["flushed"] == 0
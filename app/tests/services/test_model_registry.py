@@ -0,0 +1,185 @@
+# tests/services/test_model_registry.py
+
+import threading
+from contextlib import contextmanager
+import numpy as np
+import pytest
+import app.services.model_registry as registry_module
+from app.services.model_registry import ModelRegistry
+
+
+class FakeModel:
+    def __init__(self, factor):
+        self.factor = factor
+
+
+class FakeScores:
+    def __init__(self):
+        self.versions = []
+
+    def set_model(self, model, scaler, predict, version=None):
+        self.versions.append(version)
+
+
+class Loader:
+    def __init__(self):
+        self.factor = 1.0
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise FileNotFoundError("model.pkl")
+        return FakeModel(self.factor), None
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value):
+        self.store[key] = value
+
+
+@pytest.fixture
+def published(monkeypatch):
+    messages = []
+    monkeypatch.setattr(
+        registry_module, "publish", lambda channel, data: messages.append((channel, data))
+    )
+    monkeypatch.setattr(registry_module, "redis_client", FakeRedis())
+    return messages
+
+
+@pytest.fixture
+def registry(monkeypatch, published):
+    monkeypatch.setattr(
+        registry_module,
+        "predict",
+        lambda model, scaler, X: np.asarray(X).sum(axis=1) * model.factor,
+    )
+    loader, scores = Loader(), FakeScores()
+    return ModelRegistry(loader=loader, scores=scores), loader, scores
+
+
+def test_loads_lazily_once_with_warm_up(registry):
+    registry, loader, scores = registry
+    assert not registry.loaded
+    assert loader.calls == 0
+
+    np.testing.assert_allclose(registry.predict(np.ones((2, 5))), [5.0, 5.0])
+    registry.ensure_loaded()
+
+    assert loader.calls == 1
+    stats = registry.stats()
+    assert stats["loaded"] is True
+    assert stats["warmup_ms"] is not None
+    assert scores.versions == [registry.version]
+
+
+def test_reload_swaps_version_but_in_flight_model_is_kept(registry):
+    registry, loader, scores = registry
+    in_flight = registry.active()
+    old_version = registry.version
+
+    loader.factor = 2.0
+    result = registry.reload()
+
+    assert result["previous_version"] == old_version
+    assert registry.version != old_version
+    assert scores.versions == [old_version, registry.version]
+    # 교체 전에 가져간 모델은 그대로 이전 결과
+    np.testing.assert_allclose(in_flight.predict(np.ones((1, 5))), [5.0])
+    np.testing.assert_allclose(registry.predict(np.ones((1, 5))), [10.0])
+
+
+def test_failed_reload_keeps_current_model(registry):
+    registry, loader, scores = registry
+    registry.ensure_loaded()
+    version = registry.version
+
+    loader.fail = True
+    with pytest.raises(FileNotFoundError):
+        registry.reload()
+
+    assert registry.version == version
+    assert registry.stats()["last_error"] == "model.pkl"
+    assert registry.stats()["reloads"] == 0
+
+
+def test_reload_is_announced_to_other_workers(registry, published):
+    registry, loader, scores = registry
+    registry.ensure_loaded()
+    assert published == []  # 첫 적재는 알리지 않음
+
+    loader.factor = 2.0
+    registry.reload()
+
+    assert published == [(registry_module.RELOAD_CHANNEL, registry.version)]
+    assert registry_module.redis_client.get(registry_module.ACTIVE_VERSION_KEY) == (
+        registry.version
+    )
+
+
+def test_other_worker_follows_announced_version(registry, published, monkeypatch):
+    registry, loader, scores = registry
+    registry.ensure_loaded()
+    old_version = registry.version
+
+    # 다른 워커가 교체 (같은 파일을 새로 배포)
+    loader.factor = 2.0
+    other = ModelRegistry(loader=loader, scores=FakeScores())
+    other.ensure_loaded()
+    new_version = other.version
+    assert new_version != old_version
+
+    # 자기 자신이 보낸 (이미 같은 버전) 이벤트는 무시
+    registry.sync_version(old_version)
+    assert registry.reloads == 0
+
+    registry.sync_version(new_version)
+    assert registry.version == new_version
+    assert registry.reloads == 1
+    assert published == []  # 이벤트로 따라 바꾼 교체는 다시 알리지 않음
+
+
+def test_missed_reload_is_caught_up_on_reconnect(registry, monkeypatch):
+    registry, loader, scores = registry
+    registry.ensure_loaded()
+    synced = []
+    monkeypatch.setattr(registry, "sync_version", synced.append)
+
+    registry_module.redis_client.set(registry_module.ACTIVE_VERSION_KEY, b"v9")
+    registry._on_connect()
+    for thread in threading.enumerate():
+        if thread.name == "model-sync":
+            thread.join(5)
+    assert synced == ["v9"]
+
+
+def test_startup_column_check_runs_no_ddl(registry, monkeypatch, capsys):
+    registry, loader, scores = registry
+    queries, opened = [], []
+
+    class FakeCursor:
+        def execute(self, query, params=None):
+            queries.append(query)
+
+        def fetchone(self):
+            return (0,)  # 마이그레이션 전
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        opened.append(commit)
+        yield FakeCursor()
+
+    monkeypatch.setattr(registry_module, "db_cursor", fake_db_cursor)
+    registry.check_log_column()
+
+    assert opened == [False]
+    assert len(queries) == 1 and "information_schema" in queries[0]
+    assert "001_predicts_log_model_version.sql" in capsys.readouterr().out
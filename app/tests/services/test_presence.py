@@ -0,0 +1,101 @@
+# tests/services/test_presence.py
+
+import pytest
+import app.services.presence as presence_module
+
+
+# --- Fake Redis (sorted set 일부 명령만) ---
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def zadd(self, key, mapping):
+        self._calls.append(lambda: self._redis.zadd(key, mapping))
+
+    def zremrangebyscore(self, key, low, high):
+        self._calls.append(lambda: self._redis.zremrangebyscore(key, low, high))
+
+    def execute(self):
+        self._redis.writes += 1
+        return [call() for call in self._calls]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.zsets = {}
+        self.writes = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, s in zset.items() if float(low) <= s <= float(high)]:
+            del zset[member]
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def zcount(self, key, low, high):
+        return len(self.zrevrangebyscore(key, high, low))
+
+    def zrevrangebyscore(self, key, high, low):
+        zset = self.zsets.get(key, {})
+        members = [m for m, s in zset.items() if float(low) <= s <= float(high)]
+        return [m.encode() for m in sorted(members, key=zset.get, reverse=True)]
+
+    def zscore(self, key, member):
+        return self.zsets.get(key, {}).get(member)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    clock = {"now": 1_000_000.0}
+    monkeypatch.setattr(presence_module, "redis_client", fake)
+    monkeypatch.setattr(presence_module.time, "time", lambda: clock["now"])
+    monkeypatch.setattr(presence_module, "_last_touch", {})
+    fake.clock = clock
+    return fake
+
+
+def test_touch_is_throttled_per_user(fake_redis):
+    """쓰기 제한 간격 안의 반복 요청은 Redis에 한 번만 기록"""
+    assert presence_module.touch("a@test.com") is True
+    assert presence_module.touch("a@test.com") is False
+    assert presence_module.touch("b@test.com") is True
+    assert fake_redis.writes == 2
+
+    fake_redis.clock["now"] += presence_module.PRESENCE_TOUCH_INTERVAL
+    assert presence_module.touch("a@test.com") is True
+    assert presence_module.touch("a@test.com", force=True) is True
+    assert fake_redis.writes == 4
+
+
+def test_active_window_and_last_seen(fake_redis):
+    """최근 N분 활동 유저만 집계, 로그아웃하면 제외"""
+    presence_module.touch("old@test.com")
+    fake_redis.clock["now"] += 10 * 60
+    presence_module.touch("new@test.com")
+
+    assert presence_module.active_count(5) == 1
+    assert presence_module.active_users(5) == ["new@test.com"]
+    assert presence_module.active_users(15) == ["new@test.com", "old@test.com"]
+    assert presence_module.last_seen("old@test.com").timestamp() == 1_000_000.0
+    assert presence_module.last_seen("none@test.com") is None
+
+    presence_module.remove("new@test.com")
+    assert presence_module.active_count(5) == 0
+
+
+def test_touch_trims_entries_past_retention(fake_redis):
+    """기록 시 보관 기간이 지난 항목 정리"""
+    presence_module.touch("stale@test.com")
+    fake_redis.clock["now"] += presence_module.PRESENCE_RETENTION_HOURS * 3600 + 1
+    presence_module.touch("fresh@test.com")
+
+    assert set(fake_redis.zsets[presence_module.PRESENCE_KEY]) == {"fresh@test.com"}
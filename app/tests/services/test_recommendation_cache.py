@@ -0,0 +1,116 @@
+# tests/services/test_recommendation_cache.py
+
+import asyncio
+import threading
+import pytest
+import app.services.recommendation_cache as cache_module
+from app.services.recommendation_cache import (
+    cache_key,
+    get_cached,
+    get_cached_async,
+    quantize_weights,
+    set_cached,
+    set_cached_async,
+    invalidate_all,
+    recommend_cache_stats,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.threads = []  # 호출된 스레드 (이벤트 루프 스레드에서 부르지 않는지 확인용)
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.threads.append(threading.current_thread())
+        self.store[key] = value
+
+
+class Weights:
+    def __init__(self, *values):
+        (
+            self.rd_slope_weight,
+            self.acc_occ_weight,
+            self.acc_sc_weight,
+            self.rd_fr_weight,
+            self.traff_weight,
+        ) = values
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(cache_module, "redis_client", fake)
+    monkeypatch.setattr(cache_module, "_local", cache_module.OrderedDict())
+    monkeypatch.setattr(cache_module, "_stats", dict.fromkeys(cache_module._stats, 0))
+    return fake
+
+
+def test_proportional_weights_share_a_key():
+    default = quantize_weights(Weights(2.5, 3.0, 1.5, 1.5, 1.5))
+    doubled = quantize_weights(Weights(5.0, 6.0, 3.0, 3.0, 3.0))
+    nudged = quantize_weights(Weights(2.501, 3.0, 1.5, 1.5, 1.5))
+    other = quantize_weights(Weights(1.0, 3.0, 1.5, 1.5, 1.5))
+
+    key = cache_key("역삼동", 1, "v1", default)
+    assert key == cache_key("역삼동", 1, "v1", doubled)
+    assert key == cache_key("역삼동", 1, "v1", nudged)
+    assert key != cache_key("역삼동", 1, "v1", other)
+    # 모델 / 데이터 버전이 바뀌면 다른 키
+    assert key != cache_key("역삼동", 2, "v1", default)
+    assert key != cache_key("역삼동", 1, "v2", default)
+
+
+def test_hit_miss_and_redis_fallback(redis_store):
+    roads = [{"rds_id": "R1", "pred_idx": 100.0}]
+    assert get_cached("k") is None
+    set_cached("k", roads)
+    assert get_cached("k") == roads
+
+    # 다른 워커(로컬 캐시 없음)는 Redis에서 읽음
+    invalidate_all()
+    assert get_cached("k") == roads
+
+    stats = recommend_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["local_hits"] == 1
+    assert stats["redis_hits"] == 1
+    assert stats["invalidations"] == 1
+
+
+def test_local_cache_evicts_oldest(redis_store, monkeypatch):
+    monkeypatch.setattr(cache_module, "RECOMMEND_CACHE_SIZE", 2)
+    for key in ("a", "b", "c"):
+        set_cached(key, [])
+
+    stats = recommend_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["local_size"] == 2
+    assert "a" not in cache_module._local
+
+
+def test_async_lookups_keep_redis_off_the_event_loop(redis_store):
+    roads = [{"rds_id": "R1", "pred_idx": 100.0}]
+
+    async def scenario():
+        loop_thread = threading.current_thread()
+        missed = await get_cached_async("k")
+        await set_cached_async("k", roads)
+        local = await get_cached_async("k")
+        invalidate_all()
+        remote = await get_cached_async("k")
+        return loop_thread, missed, local, remote
+
+    loop_thread, missed, local, remote = asyncio.run(scenario())
+    assert missed is None
+    assert local == roads and remote == roads
+    # get(미스) + setex + get(다른 워커) - 로컬 히트는 Redis를 부르지 않음
+    assert len(redis_store.threads) == 3
+    assert loop_thread not in redis_store.threads
+
+    stats = recommend_cache_stats()
+    assert (stats["misses"], stats["local_hits"], stats["redis_hits"]) == (1, 1, 1)
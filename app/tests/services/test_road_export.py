@@ -0,0 +1,61 @@
+# tests/services/test_road_export.py
+
+import csv
+import gzip
+import io
+import zipfile
+import pytest
+import app.services.road_export as export_module
+
+ROADS = [
+    {
+        "rds_id": f"r{i}",
+        "road_name": f"도로<{i}>&",
+        "rbp": "시작",
+        "rep": "끝",
+        "rd_slope": 1.5,
+        "acc_occ": i,
+        "acc_sc": 3,
+        "rd_fr": 0,
+        "pred_idx": 0.25,
+    }
+    for i in range(3)
+]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(export_module, "_cache", type(export_module._cache)())
+    monkeypatch.setattr(export_module, "_stats", {"hits": 0, "builds": 0})
+
+
+def test_csv_and_gzip_exports_match():
+    name, data, mimetype = export_module.build_export(1, "강남구", ROADS, "csv")
+    assert name == "강남구_도로추천.csv" and mimetype == "text/csv"
+    rows = list(csv.reader(io.StringIO(data.decode())))
+    assert rows[0] == export_module.EXPORT_COLUMNS
+    assert rows[1][1] == "도로<0>&"
+
+    name, gz_data, _ = export_module.build_export(1, "강남구", ROADS, "csv.gz")
+    assert name.endswith(".csv.gz")
+    assert gzip.decompress(gz_data) == data
+
+
+def test_xlsx_export_is_valid_workbook():
+    _, data, _ = export_module.build_export(1, "강남구", ROADS, "xlsx")
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert "xl/worksheets/sheet1.xml" in archive.namelist()
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode()
+    assert "도로&lt;1&gt;&amp;" in sheet  # 문자열은 XML 이스케이프
+    assert '<c r="E2"><v>1.5</v></c>' in sheet  # 숫자는 숫자 셀
+    assert '<row r="4">' in sheet
+
+
+def test_exports_are_cached_by_log_id_and_format():
+    first = export_module.build_export(7, "강남구", ROADS, "csv")
+    again = export_module.build_export(7, "강남구", [], "csv")
+    assert again is first
+    export_module.build_export(7, "강남구", ROADS, "xlsx")
+
+    stats = export_module.export_cache_stats()
+    assert stats["hits"] == 1 and stats["builds"] == 2 and stats["entries"] == 2
@@ -0,0 +1,112 @@
+# tests/services/test_road_features.py
+
+from contextlib import contextmanager
+import numpy as np
+import pytest
+import app.services.road_features as features_module
+from app.services.road_features import RoadFeatureStore, FEATURE_COLUMNS
+
+
+ROWS = [
+    ("역삼동", "R2", "테헤란로", "A", "B", 3.5, 2, 1, 0.4, 1200),
+    ("삼성동", "R3", "봉은사로", "C", "D", 1.0, 0, 0, 0.1, 800),
+    ("역삼동", "R1", "논현로", "E", "F", 7.0, 5, None, 0.9, 3000),
+]
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+
+    def execute(self, query, params=None):
+        self.db.queries.append(query)
+
+    def fetchone(self):
+        return ("ongil.seoul_info", self.db.version)
+
+    def fetchall(self):
+        return list(self.db.rows)
+
+
+class FakeDB:
+    def __init__(self):
+        self.rows = list(ROWS)
+        self.version = 1
+        self.queries = []
+
+    def loads(self):
+        return sum(1 for q in self.queries if q == features_module.LOAD_QUERY)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDB()
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        yield FakeCursor(db)
+
+    monkeypatch.setattr(features_module, "db_cursor", fake_db_cursor)
+    return db
+
+
+def test_region_is_slice_of_columns(db):
+    store = RoadFeatureStore()
+    region = store.region("역삼동")
+
+    assert len(region) == 2
+    assert region.matrix.shape == (2, len(FEATURE_COLUMNS))
+    assert set(region.columns["rds_id"]) == {"R1", "R2"}
+    # 복사본이 아닌 전체 배열의 view
+    assert np.shares_memory(region.matrix, store._snapshot.matrix)
+    # NULL은 NaN
+    assert np.isnan(region.matrix).sum() == 1
+    assert store.region("없는동") is None
+    assert store.has_region("삼성동")
+    assert db.loads() == 1
+
+
+def test_refresh_reloads_only_when_version_changes(db):
+    store = RoadFeatureStore()
+    store.ensure_loaded()
+
+    store.refresh()
+    assert db.loads() == 1
+
+    db.version = 2
+    db.rows.append(("대치동", "R4", "삼성로", "G", "H", 2.0, 1, 1, 0.2, 500))
+    store.refresh()
+    assert db.loads() == 2
+    assert store.has_region("대치동")
+    assert store.stats()["version"] == 2
+
+
+def test_reload_failure_keeps_previous_snapshot(db, monkeypatch):
+    store = RoadFeatureStore()
+    store.ensure_loaded()
+
+    @contextmanager
+    def broken_db_cursor(dictionary=False, commit=False):
+        raise ConnectionError("db down")
+        yield
+
+    monkeypatch.setattr(features_module, "db_cursor", broken_db_cursor)
+    store.refresh()
+
+    stats = store.stats()
+    assert stats["loaded"] is True
+    assert stats["last_error"] == "db down"
+    assert store.has_region("역삼동")
+
+
+def test_stats_report_memory(db):
+    store = RoadFeatureStore()
+    assert store.stats()["loaded"] is False
+
+    store.ensure_loaded()
+    stats = store.stats()
+    assert stats["roads"] == 3
+    assert stats["regions"] == 2
+    memory = stats["memory_bytes"]
+    assert memory["total"] == memory["numeric"] + memory["text"] + memory["index"]
+    assert memory["numeric"] >= 3 * len(FEATURE_COLUMNS) * 8
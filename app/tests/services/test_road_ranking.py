@@ -0,0 +1,171 @@
+# tests/services/test_road_ranking.py
+
+import math
+import numpy as np
+import pandas as pd
+import pytest
+from app.services.road_features import FeatureSnapshot, ROAD_COLUMNS
+from app.services.road_ranking import (
+    rank_batch,
+    rank_citywide,
+    rank_region,
+    top_k,
+    weight_vector,
+)
+
+
+class Weights:
+    def __init__(self, **weights):
+        self.rd_slope_weight = weights.get("rd_slope", 2.5)
+        self.acc_occ_weight = weights.get("acc_occ", 3.0)
+        self.acc_sc_weight = weights.get("acc_sc", 1.5)
+        self.rd_fr_weight = weights.get("rd_fr", 1.5)
+        self.traff_weight = weights.get("traff", 1.5)
+
+
+def pandas_rank(region, model_scores, weights):
+    """이전 pandas 구현 (비교 기준)"""
+    df = pd.DataFrame(region.columns, columns=ROAD_COLUMNS)
+    df["예측점수"] = model_scores
+    w = {
+        "rd_slope": weights.rd_slope_weight,
+        "acc_occ": weights.acc_occ_weight,
+        "acc_sc": weights.acc_sc_weight,
+        "rd_fr": weights.rd_fr_weight,
+        "traff": weights.traff_weight,
+    }
+    total = sum(w.values())
+    if total > 0:
+        w = {k: v / total for k, v in w.items()}
+    else:
+        w = {k: 1 / len(w) for k in w}
+    df["pred_idx"] = df["예측점수"] * 0.3 + sum(df[k] * v for k, v in w.items())
+    min_score, max_score = df["pred_idx"].min(), df["pred_idx"].max()
+    if max_score - min_score > 0:
+        df["pred_idx"] = (df["pred_idx"] - min_score) / (max_score - min_score) * 100
+    else:
+        df["pred_idx"] = 50
+    return df.sort_values("pred_idx", ascending=False).head(10).to_dict(orient="records")
+
+
+def make_region(size, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = [
+        (
+            "역삼동", f"R{i}", f"도로{i}", "A", "B",
+            float(rng.uniform(0, 10)), int(rng.integers(0, 20)),
+            int(rng.integers(0, 5)), float(rng.uniform(0, 1)),
+            int(rng.integers(100, 5000)),
+        )
+        for i in range(size)
+    ]
+    region = FeatureSnapshot(rows, 1).region("역삼동")
+    return region, rng.uniform(0, 1, size)
+
+
+def assert_same_records(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert list(a) == list(e)
+        for key in a:
+            if isinstance(e[key], float):
+                assert a[key] == pytest.approx(e[key], rel=1e-9, abs=1e-9)
+            else:
+                assert a[key] == e[key]
+
+
+@pytest.mark.parametrize("size", [1, 7, 10, 500])
+def test_matches_pandas_pipeline(size):
+    region, model_scores = make_region(size)
+    weights = Weights()
+    assert_same_records(
+        rank_region(region, model_scores, weights),
+        pandas_rank(region, model_scores, weights),
+    )
+
+
+def test_matches_pandas_with_zero_weights():
+    region, model_scores = make_region(50, seed=3)
+    weights = Weights(rd_slope=0, acc_occ=0, acc_sc=0, rd_fr=0, traff=0)
+    assert_same_records(
+        rank_region(region, model_scores, weights),
+        pandas_rank(region, model_scores, weights),
+    )
+    np.testing.assert_allclose(weight_vector(weights), [0.2] * 5)
+
+
+def test_top_k_orders_descending_and_puts_nan_last():
+    scores = np.array([0.5, np.nan, 3.0, 1.0, 2.0])
+    assert top_k(scores, 3).tolist() == [2, 4, 3]
+    assert top_k(scores, 10).tolist() == [2, 4, 3, 0, 1]
+    assert len(top_k(scores, 0)) == 0
+
+
+def test_results_are_plain_python_values():
+    region, model_scores = make_region(20)
+    record = rank_region(region, model_scores, Weights())[0]
+    assert type(record["acc_occ"]) is int
+    assert type(record["pred_idx"]) is float
+    assert not math.isnan(record["pred_idx"])
+
+
+def test_batch_matches_single_region_ranking():
+    region_a, scores_a = make_region(30, seed=1)
+    region_b, scores_b = make_region(5, seed=2)
+    profiles = [Weights(), Weights(traff=10), Weights(rd_slope=0, acc_occ=0)]
+
+    results = rank_batch([region_a, region_b], [scores_a, scores_b], profiles, k=10)
+
+    assert len(results) == 2 and all(len(ranked) == 3 for ranked in results)
+    for (region, scores), ranked in zip([(region_a, scores_a), (region_b, scores_b)], results):
+        for profile, roads in zip(profiles, ranked):
+            assert_same_records(roads, rank_region(region, scores, profile))
+
+
+def make_city(sizes, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for name, size in sizes.items():
+        rows += [
+            (
+                name, f"{name}-{i}", f"도로{i}", "A", "B",
+                float(rng.uniform(0, 10)), int(rng.integers(0, 20)),
+                int(rng.integers(0, 5)), float(rng.uniform(0, 1)),
+                int(rng.integers(100, 5000)),
+            )
+            for i in range(size)
+        ]
+    snapshot = FeatureSnapshot(rows, 1)
+    return snapshot, rng.uniform(0, 1, len(snapshot.matrix))
+
+
+@pytest.mark.parametrize("chunk_size", [7, 100000])
+def test_citywide_matches_full_sort(chunk_size):
+    snapshot, model_scores = make_city({"역삼동": 40, "삼성동": 25, "대치동": 60})
+    weights = Weights()
+
+    result = rank_citywide(snapshot, model_scores, weights, 15, chunk_size=chunk_size)
+
+    full = snapshot.matrix @ weight_vector(weights) + 0.3 * model_scores
+    expected = np.argsort(-full, kind="stable")[:15]
+    roads = result["recommended_roads"]
+    assert result["scored_roads"] == 125
+    expected_ids = snapshot.columns["rds_id"][expected].tolist()
+    assert [road["rds_id"] for road in roads] == expected_ids
+    assert [road["rds_rg"] for road in roads] == [r.split("-")[0] for r in expected_ids]
+    # 전체 기준 정규화 - 1등은 100
+    assert roads[0]["pred_idx"] == pytest.approx(100)
+    assert all(0 <= road["pred_idx"] <= 100 for road in roads)
+
+
+def test_citywide_region_filter():
+    snapshot, model_scores = make_city({"역삼동": 40, "삼성동": 25, "대치동": 60})
+
+    result = rank_citywide(
+        snapshot, model_scores, Weights(), 100, regions=["삼성동", "없는동"], chunk_size=10
+    )
+
+    roads = result["recommended_roads"]
+    assert result["scored_roads"] == len(roads) == 25
+    assert {road["rds_rg"] for road in roads} == {"삼성동"}
+    assert roads[-1]["pred_idx"] == pytest.approx(0)
@@ -0,0 +1,209 @@
+# tests/services/test_road_scores.py
+
+import threading
+import time
+from contextlib import contextmanager
+import numpy as np
+import pytest
+import app.services.road_features as features_module
+import app.services.road_scores as scores_module
+from app.services.road_features import RoadFeatureStore
+from app.services.road_scores import RoadScoreStore
+
+
+ROWS = [
+    ("역삼동", "R1", "테헤란로", "A", "B", 3.5, 2, 1, 0.4, 1200),
+    ("역삼동", "R2", "논현로", "C", "D", 7.0, 5, 0, 0.9, 3000),
+    ("삼성동", "R3", "봉은사로", "E", "F", 1.0, 0, 0, 0.1, 800),
+]
+
+
+class FakeDB:
+    def __init__(self):
+        self.version = 1
+        self.scores = {}  # rds_id -> (score, model_version, data_version)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.result = []
+
+    def execute(self, query, params=None):
+        if query.startswith("CHECKSUM"):
+            self.result = [("seoul_info", self.db.version)]
+        elif query == features_module.LOAD_QUERY:
+            self.result = list(ROWS)
+        elif "SELECT rds_id, model_score" in query:
+            self.result = [
+                (rds_id, score)
+                for rds_id, (score, model, data) in self.db.scores.items()
+                if (model, data) == params
+            ]
+        elif query.startswith("DELETE"):
+            self.db.scores = {
+                k: v for k, v in self.db.scores.items() if v[1:] == params
+            }
+
+    def executemany(self, query, rows):
+        for rds_id, score, model, data, _ in rows:
+            self.db.scores[rds_id] = (score, model, data)
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def fetchall(self):
+        return self.result
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDB()
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        yield db.cursor()
+
+    monkeypatch.setattr(features_module, "db_cursor", fake_db_cursor)
+    monkeypatch.setattr(scores_module, "db_cursor", fake_db_cursor)
+    return db
+
+
+class CountingModel:
+    def __init__(self, factor=1.0):
+        self.factor = factor
+        self.calls = 0
+
+    def predict(self, model, scaler, X):
+        self.calls += 1
+        return np.asarray(X).sum(axis=1) * self.factor
+
+
+def make_stores(model, version="v1"):
+    features = RoadFeatureStore()
+    scores = RoadScoreStore(features)
+    scores.set_model(object(), None, model.predict, version=version)
+    return features, scores
+
+
+def test_scores_computed_once_and_sliced_per_region(db):
+    model = CountingModel()
+    features, scores = make_stores(model)
+    features.ensure_loaded()
+
+    region = features.region("역삼동")
+    region_scores = scores.region_scores(region)
+    np.testing.assert_allclose(region_scores, region.matrix.sum(axis=1))
+    assert model.calls == 1
+    assert {v[1] for v in db.scores.values()} == {"v1"}
+    assert len(db.scores) == 3
+
+
+def test_stored_scores_reused_without_inference(db):
+    features, scores = make_stores(CountingModel())
+    features.ensure_loaded()
+
+    model = CountingModel()
+    features, scores = make_stores(model)
+    features.ensure_loaded()
+
+    assert model.calls == 0
+    assert scores.stats()["last_source"] == "stored"
+    assert scores.region_scores(features.region("삼성동")) is not None
+
+
+def test_data_change_triggers_rescore(db):
+    model = CountingModel()
+    features, scores = make_stores(model)
+    features.ensure_loaded()
+    old_region = features.region("역삼동")
+
+    db.version = 2
+    features.refresh()
+
+    assert model.calls == 2
+    # 이전 snapshot의 region은 현재 점수와 맞지 않음
+    assert scores.region_scores(old_region) is None
+    assert scores.region_scores(features.region("역삼동")) is not None
+    assert {v[2] for v in db.scores.values()} == {"2"}
+
+
+def test_consistency_check_detects_model_drift(db):
+    model = CountingModel()
+    features, scores = make_stores(model)
+    features.ensure_loaded()
+
+    assert scores.check_consistency()["ok"] is True
+
+    model.factor = 2.0
+    result = scores.check_consistency()
+    assert result["ok"] is False
+    assert result["mismatches"] == result["sampled"] == 3
+
+
+def test_model_swap_waits_for_running_rebuild(db):
+    """재계산 도중 모델이 바뀌어도 한 재계산은 한 모델로만, 저장 버전도 그 모델"""
+    started, release = threading.Event(), threading.Event()
+
+    def slow_predict(model, scaler, X):
+        if db.version == 2:  # 데이터가 바뀐 뒤의 재계산만 멈춰 둠
+            started.set()
+            release.wait(2)
+        return np.asarray(X).sum(axis=1)
+
+    features, scores = make_stores(CountingModel())
+    scores.set_model(object(), None, slow_predict, version="old")
+    features.ensure_loaded()
+
+    db.version = 2
+    rebuild = threading.Thread(target=features.refresh)
+    rebuild.start()
+    assert started.wait(2)
+
+    new_model = CountingModel(factor=2.0)
+    swap = threading.Thread(
+        target=scores.set_model, args=(object(), None, new_model.predict, "new")
+    )
+    swap.start()
+    time.sleep(0.05)
+    assert scores.model_version == "old"  # 재계산이 끝날 때까지 교체 대기
+
+    release.set()
+    rebuild.join(2)
+    swap.join(2)
+
+    region = features.region("역삼동")
+    np.testing.assert_allclose(
+        scores.region_scores(region), region.matrix.sum(axis=1) * 2.0
+    )
+    assert {v[1] for v in db.scores.values()} == {"new"}
+    stored = {rds_id: v[0] for rds_id, v in db.scores.items()}
+    assert stored["R1"] == pytest.approx(region.matrix[0].sum() * 2.0)
+
+
+def test_background_rebuild_runs_once(db):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_predict(model, scaler, X):
+        started.set()
+        release.wait(2)
+        return np.asarray(X).sum(axis=1)
+
+    features = RoadFeatureStore()
+    scores = RoadScoreStore(features)
+    features.ensure_loaded()
+    scores._model, scores._predict, scores.model_version = object(), slow_predict, "v1"
+
+    assert scores.rebuild_in_background() is True
+    assert started.wait(2)
+    assert scores.rebuild_in_background() is False  # 이미 진행 중
+
+    release.set()
+    for _ in range(100):
+        if scores.snapshot_scores(features.snapshot) is not None:
+            break
+        time.sleep(0.01)
+    assert scores.snapshot_scores(features.snapshot) is not None
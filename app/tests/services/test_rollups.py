@@ -0,0 +1,158 @@
+# tests/services/test_rollups.py
+
+from datetime import date, timedelta
+import pytest
+import app.services.rollups as rollups_module
+
+
+# --- Fake MySQL Connection (실행한 SQL 기록) ---
+class FakeCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._result = None
+
+    def execute(self, query, params=()):
+        self._conn.queries.append((" ".join(query.split()), params))
+        if "GET_LOCK" in query:
+            self._result = (1 if self._conn.lock_free else 0,)
+        elif "FROM rollup_state" in query:
+            self._result = self._conn.state
+        else:
+            self._result = None
+
+    def fetchone(self):
+        return self._result
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, lock_free=True, state=None):
+        self.lock_free = lock_free
+        self.state = state
+        self.queries = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def connect(monkeypatch):
+    monkeypatch.setattr(rollups_module, "_tables_ready", True)
+    monkeypatch.setattr(rollups_module, "_status", dict(rollups_module._status, skipped=0))
+
+    def use(conn):
+        monkeypatch.setattr(rollups_module, "get_connection", lambda: conn)
+        return conn
+
+    return use
+
+
+def statements(conn):
+    return [query for query, _ in conn.queries]
+
+
+def test_refresh_reads_logs_only_for_new_days(connect):
+    last_day = date.today()
+    conn = connect(FakeConnection(state=(last_day,)))
+
+    rollups_module.refresh_rollups()
+
+    log_reads = [(q, p) for q, p in conn.queries if "FROM visit_logs" in q]
+    assert len(log_reads) == 1
+    assert log_reads[0][1][0].date() == last_day - timedelta(days=1)
+    assert conn.commits == 1
+    assert rollups_module.rollup_status()["last_error"] is None
+
+
+def test_monthly_unique_visitors_come_from_daily_ips(connect):
+    conn = connect(FakeConnection(state=(date.today(),)))
+
+    rollups_module.refresh_rollups()
+
+    monthly = [q for q in statements(conn) if "INTO visit_monthly_rollup" in q]
+    assert monthly
+    assert all("FROM visit_daily_ips" in q for q in monthly)
+    daily = next(q for q in statements(conn) if "INTO visit_daily_rollup" in q)
+    assert "FROM visit_daily_ips" in daily
+
+
+def test_first_run_backfills_from_start_of_month(connect):
+    conn = connect(FakeConnection(state=None))
+
+    rollups_module.refresh_rollups()
+
+    start = next(p[0] for q, p in conn.queries if q.startswith("DELETE FROM visit_daily_ips"))
+    assert start.day == 1
+    assert (date.today() - start).days >= rollups_module.ROLLUP_BACKFILL_DAYS
+    state = next(p for q, p in conn.queries if "INTO rollup_state" in q)
+    assert state == (rollups_module.ROLLUP_STATE_NAME, date.today())
+
+
+def test_skips_when_another_worker_holds_lock(connect):
+    conn = connect(FakeConnection(lock_free=False))
+
+    rollups_module.refresh_rollups()
+
+    assert statements(conn) == ["SELECT GET_LOCK(%s, 0)"]
+    assert conn.commits == 0
+    assert rollups_module.rollup_status()["skipped"] == 1
+
+
+def test_failure_rolls_back_and_releases_lock(connect, monkeypatch):
+    conn = connect(FakeConnection(state=(date.today(),)))
+
+    def broken(cursor, start, end):
+        raise RuntimeError("deadlock")
+
+    monkeypatch.setattr(rollups_module, "_refresh", broken)
+    rollups_module.refresh_rollups()
+
+    assert conn.rollbacks == 1
+    assert statements(conn)[-1] == "SELECT RELEASE_LOCK(%s)"
+    assert rollups_module.rollup_status()["last_error"] == "deadlock"
+
+
+def test_error_rollup_records_as_of_watermark(connect):
+    conn = connect(FakeConnection(state=(date.today(),)))
+
+    rollups_module.refresh_rollups()
+
+    error_insert = next(p for q, p in conn.queries if "INTO error_daily_rollup" in q)
+    watermark = next(p for q, p in conn.queries if "INTO rollup_runs" in q)
+    assert watermark[0] == rollups_module.ROLLUP_STATE_NAME
+    # 집계 상한과 기록한 as_of가 같아야 조회 시 이후 로그만 더함
+    assert error_insert[1] == watermark[1]
+
+
+def test_today_error_counts_adds_logs_after_watermark():
+    conn = FakeConnection()
+    cursor = conn.cursor()
+
+    rollups_module.today_error_counts(cursor, "route")
+
+    query, params = conn.queries[0]
+    assert "FROM error_daily_rollup" in query
+    assert "FROM error_logs" in query
+    assert "SELECT as_of FROM rollup_runs" in query
+    assert params == (rollups_module.ROLLUP_STATE_NAME,)
+    with pytest.raises(ValueError):
+        rollups_module.today_error_counts(cursor, "user_email; DROP TABLE x")
@@ -0,0 +1,166 @@
+# tests/services/test_user_cache.py
+
+from contextlib import contextmanager
+from datetime import datetime
+import pytest
+import app.services.user_cache as cache_module
+
+
+class FakePipeline:
+    """WATCH한 키가 바뀌었으면 execute에서 WatchError"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._watched = {}
+        self._calls = []
+
+    def watch(self, key):
+        self._watched[key] = self._redis.store.get(key)
+
+    def multi(self):
+        pass
+
+    def setex(self, key, ttl, value):
+        self._calls.append(("setex", key, value))
+
+    def incr(self, key):
+        self._calls.append(("incr", key, None))
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, key):
+        self._calls.append(("delete", key, None))
+
+    def execute(self):
+        for key, value in self._watched.items():
+            if self._redis.store.get(key) != value:
+                raise cache_module.redis.WatchError()
+        for name, key, value in self._calls:
+            if name == "setex":
+                self._redis.setex(key, None, value)
+            elif name == "incr":
+                self._redis.store[key] = self._redis.store.get(key, 0) + 1
+            else:
+                self._redis.delete(key)
+
+    def reset(self):
+        self._watched = {}
+        self._calls = []
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.on_fetch = None  # 조회 도중 다른 요청이 끼어드는 상황 재현용
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+
+    def fetchone(self):
+        if self.on_fetch:
+            self.on_fetch()
+        return self.rows.get(self.queries[-1][1][0])
+
+
+@pytest.fixture
+def env(monkeypatch):
+    cursor = FakeCursor(
+        {
+            "user@test.com": {
+                "user_email": "user@test.com",
+                "user_name": "Test User",
+                "CreatDt": datetime(2025, 1, 1),
+                "is_admin": 1,
+            }
+        }
+    )
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        yield cursor
+
+    published = []
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(cache_module, "db_cursor", fake_db_cursor)
+    monkeypatch.setattr(cache_module, "redis_client", fake_redis)
+    monkeypatch.setattr(cache_module, "publish", lambda ch, data: published.append((ch, data)))
+    cache_module._clear_local()
+    return cursor, fake_redis, published
+
+
+def test_login_lookups_share_one_joined_query(env):
+    """사용자 조회 + 관리자 확인이 조인 쿼리 한 번으로 끝남"""
+    cursor, fake_redis, _ = env
+
+    user = cache_module.get_user_profile("user@test.com")
+    assert user["user_name"] == "Test User"
+    assert cache_module.get_admin_level("user@test.com") == 1
+    assert len(cursor.queries) == 1
+    assert "JOIN permissions" in cursor.queries[0][0]
+    assert cache_module.PROFILE_KEY.format("user@test.com") in fake_redis.store
+
+    # 다른 워커 (로컬 캐시 없음) → Redis에서 읽음
+    cache_module._clear_local()
+    assert cache_module.get_admin_level("user@test.com") == 1
+    assert len(cursor.queries) == 1
+
+
+def test_missing_user_is_not_cached(env):
+    cursor, _, _ = env
+    assert cache_module.get_user_profile("none@test.com") is None
+    assert cache_module.get_admin_level("none@test.com") is None
+    assert len(cursor.queries) == 2
+
+
+def test_invalidate_drops_all_layers(env):
+    """쓰기 후 무효화 - 로컬/Redis 제거 + 다른 워커에 전파"""
+    cursor, fake_redis, published = env
+    cache_module.get_user_profile("user@test.com")
+
+    cache_module.invalidate_user("user@test.com")
+
+    assert cache_module.PROFILE_KEY.format("user@test.com") not in fake_redis.store
+    assert published == [(cache_module.INVALIDATE_CHANNEL, "user@test.com")]
+    cache_module.get_user_profile("user@test.com")
+    assert len(cursor.queries) == 2
+
+
+def test_password_is_never_selected():
+    """비밀번호는 프로세스 메모리에도 Redis에도 캐시하지 않음"""
+    query = cache_module.PROFILE_QUERY
+    assert "user_ps" not in query
+    assert "u.*" not in query
+
+
+def test_read_during_invalidate_is_not_cached(env):
+    """쓰기 커밋 전에 시작한 조회가 무효화 이후 옛 값을 다시 넣지 않음"""
+    cursor, fake_redis, _ = env
+    cursor.on_fetch = lambda: cache_module.invalidate_user("user@test.com")
+
+    assert cache_module.get_user_profile("user@test.com") is not None
+    assert cache_module.PROFILE_KEY.format("user@test.com") not in fake_redis.store
+    assert cache_module.user_cache_stats()["local_size"] == 0
+
+    cursor.on_fetch = None
+    cache_module.get_user_profile("user@test.com")
+    assert len(cursor.queries) == 2
+    assert cache_module.PROFILE_KEY.format("user@test.com") in fake_redis.store
@@ -0,0 +1,201 @@
+# tests/services/test_visitor_counter.py
+
+from contextlib import contextmanager
+from datetime import date, datetime
+import pytest
+import app.services.visitor_counter as counter_module
+
+
+# --- Fake Redis (HyperLogLog 대신 set으로 정확히 계산) ---
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    def pfadd(self, key, *values):
+        self._calls.append(("pfadd", key, values))
+
+    def pfcount(self, key):
+        self._calls.append(("pfcount", key, ()))
+
+    def expire(self, key, ttl):
+        self._calls.append(("expire", key, (ttl,)))
+
+    def execute(self):
+        results = []
+        for name, key, args in self._calls:
+            if name == "pfadd":
+                results.append(self._redis.pfadd(key, *args))
+            elif name == "pfcount":
+                results.append(self._redis.pfcount(key))
+            else:
+                self._redis.ttls[key] = args[0]
+                results.append(True)
+        self._redis.pipelines += 1
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.ttls = {}
+        self.pipelines = 0
+        self.counted_keys = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value.encode()
+        return True
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def pfadd(self, key, *values):
+        self.sets.setdefault(key, set()).update(values)
+        return 1
+
+    def pfcount(self, *keys):
+        self.counted_keys.append(keys)
+        merged = set()
+        for key in keys:
+            merged |= self.sets.get(key, set())
+        return len(merged)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(counter_module, "redis_client", redis)
+    # 2024년 날짜로 검증하므로 일 키 보관 기간을 넉넉히
+    monkeypatch.setattr(counter_module, "DAY_KEY_TTL", 60 * 60 * 24 * 365 * 10)
+    return redis
+
+
+@pytest.fixture
+def backfilled(fake_redis):
+    fake_redis.set(counter_module.COVERAGE_KEY, "2024-01-01")
+    return fake_redis
+
+
+# --- Fake DB Cursor (visit_logs 조회) ---
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = []
+
+    def execute(self, query, params=()):
+        self.queries.append((query, params))
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+@pytest.fixture
+def visit_logs(monkeypatch):
+    cursor = FakeCursor([])
+
+    @contextmanager
+    def fake_db_cursor(dictionary=False, commit=False):
+        yield cursor
+
+    monkeypatch.setattr(counter_module, "db_cursor", fake_db_cursor)
+    return cursor
+
+
+def test_record_visits_uses_one_pipeline(fake_redis):
+    rows = [
+        (None, "/board/", "1.1.1.1", datetime(2024, 3, 1, 9, 0)),
+        ("a@gmail.com", "/board/1", "1.1.1.1", datetime(2024, 3, 1, 10, 0)),
+        (None, "/board/", "2.2.2.2", datetime(2024, 3, 2, 9, 0)),
+    ]
+    counter_module.record_visits(rows)
+
+    assert fake_redis.pipelines == 1
+    assert counter_module.count_day(date(2024, 3, 1)) == 1
+    assert counter_module.count_day(date(2024, 3, 2)) == 1
+    assert fake_redis.pfcount("visitors:month:2024-03") == 2
+    assert "visitors:day:2024-03-01" in fake_redis.ttls
+
+
+def test_count_range_uses_month_keys_for_full_months(fake_redis, backfilled):
+    fake_redis.pfadd("visitors:day:2024-01-31", "1.1.1.1")
+    fake_redis.pfadd("visitors:month:2024-02", "1.1.1.1", "2.2.2.2")
+    fake_redis.pfadd("visitors:day:2024-03-01", "3.3.3.3")
+
+    count = counter_module.count_range(date(2024, 1, 31), date(2024, 3, 1))
+
+    assert count == 3
+    keys = fake_redis.counted_keys[-1]
+    assert keys == (
+        "visitors:day:2024-01-31",
+        "visitors:month:2024-02",
+        "visitors:day:2024-03-01",
+    )
+
+
+def test_monthly_series(fake_redis, backfilled):
+    fake_redis.pfadd("visitors:month:2024-01", "1.1.1.1")
+    fake_redis.pfadd("visitors:month:2024-03", "1.1.1.1", "2.2.2.2")
+
+    series = counter_module.monthly_series(date(2024, 1, 15), date(2024, 3, 2))
+
+    assert series == [
+        {"month": "2024-01", "count": 1},
+        {"month": "2024-02", "count": 0},
+        {"month": "2024-03", "count": 2},
+    ]
+
+
+def test_falls_back_to_exact_count_before_backfill(fake_redis, monkeypatch):
+    exact = []
+    monkeypatch.setattr(
+        counter_module,
+        "exact_count_range",
+        lambda start, end: exact.append((start, end)) or 7,
+    )
+    monkeypatch.setattr(
+        counter_module,
+        "exact_monthly_counts",
+        lambda first, last: {date(2023, 12, 1): 4},
+    )
+
+    assert counter_module.count_range(date(2024, 1, 1), date(2024, 1, 31)) == 7
+    assert exact == [(date(2024, 1, 1), date(2024, 1, 31))]
+
+    fake_redis.set(counter_module.COVERAGE_KEY, "2024-01-01")
+    fake_redis.pfadd("visitors:month:2024-01", "1.1.1.1")
+    series = counter_module.monthly_series(date(2023, 12, 1), date(2024, 1, 31))
+    assert series == [
+        {"month": "2023-12", "count": 4},
+        {"month": "2024-01", "count": 1},
+    ]
+
+
+def test_backfill_from_logs_fills_keys_once(fake_redis, visit_logs, monkeypatch):
+    monkeypatch.setattr(counter_module, "VISITOR_BACKFILL_BATCH", 2)
+    visit_logs.rows = [
+        (None, None, "1.1.1.1", datetime(2024, 3, 1, 9, 0)),
+        (None, None, "2.2.2.2", datetime(2024, 3, 1, 10, 0)),
+        (None, None, "1.1.1.1", datetime(2024, 3, 2, 9, 0)),
+    ]
+
+    result = counter_module.backfill_from_logs(days=30)
+
+    assert result["rows"] == 3
+    assert result["since"].day == 1
+    assert fake_redis.pipelines == 2
+    assert counter_module.count_day(date(2024, 3, 1)) == 2
+    assert counter_module.covered_since() == result["since"]
+    assert counter_module.BACKFILL_LOCK_KEY not in fake_redis.values
+
+    assert counter_module.backfill_from_logs(days=30)["skipped"] is True
+    assert len(visit_logs.queries) == 1
@@ -0,0 +1,99 @@
+# 로그인 폭주 벤치마크
+# - 동시 로그인 요청을 계속 보내면서 다른 엔드포인트(게시판 목록 등)의 응답 지연을 측정
+# - 실행 중인 서버 대상:
+#   python benchmarks/login_storm.py --base-url http://localhost:8000/api \
+#       --email test@test.com --password pw --probe-path /board/
+import argparse
+import asyncio
+import time
+import aiohttp
+
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(int(round(p / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+def summary(latencies: list) -> str:
+    return (
+        f"n={len(latencies)} "
+        f"p50={percentile(latencies, 50):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms "
+        f"max={max(latencies, default=0):.1f}ms"
+    )
+
+
+async def login_worker(session, args, deadline, results):
+    body = {"email": args.email, "password": args.password}
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        async with session.post(f"{args.base_url}/auth/login", json=body) as resp:
+            await resp.read()
+            results.setdefault(resp.status, []).append(
+                (time.perf_counter() - started) * 1000
+            )
+
+
+async def probe_worker(session, args, token, deadline, latencies):
+    headers = {"token": token}
+    while time.monotonic() < deadline:
+        started = time.perf_counter()
+        async with session.get(f"{args.base_url}{args.probe_path}", headers=headers) as resp:
+            await resp.read()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(args.probe_interval)
+
+
+async def measure_probe(session, args, token, seconds):
+    latencies = []
+    await probe_worker(session, args, token, time.monotonic() + seconds, latencies)
+    return latencies
+
+
+async def main(args):
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            f"{args.base_url}/auth/login",
+            json={"email": args.email, "password": args.password},
+        ) as resp:
+            resp.raise_for_status()
+            token = (await resp.json())["access_token"]
+
+        # 1. 기준선 - 로그인 부하 없이 프로브만
+        baseline = await measure_probe(session, args, token, args.baseline)
+        print(f"[baseline] {args.probe_path}: {summary(baseline)}")
+
+        # 2. 로그인 폭주 중 프로브
+        deadline = time.monotonic() + args.duration
+        login_results = {}
+        probe_latencies = []
+        await asyncio.gather(
+            *[
+                login_worker(session, args, deadline, login_results)
+                for _ in range(args.concurrency)
+            ],
+            probe_worker(session, args, token, deadline, probe_latencies),
+        )
+
+    for status, latencies in sorted(login_results.items()):
+        print(
+            f"[storm] login {status}: {summary(latencies)} "
+            f"({len(latencies) / args.duration:.1f} req/s)"
+        )
+    print(f"[storm] {args.probe_path}: {summary(probe_latencies)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 다른 엔드포인트 지연 측정")
+    parser.add_argument("--base-url", default="http://localhost:8000/api")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--probe-path", default="/board/")
+    parser.add_argument("--concurrency", type=int, default=64, help="동시 로그인 수")
+    parser.add_argument("--duration", type=float, default=30, help="폭주 시간(초)")
+    parser.add_argument("--baseline", type=float, default=10, help="기준선 측정 시간(초)")
+    parser.add_argument("--probe-interval", type=float, default=0.05)
+    asyncio.run(main(parser.parse_args()))
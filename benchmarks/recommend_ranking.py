@@ -0,0 +1,88 @@
+# 도로 추천 순위 계산 벤치마크 (이전 pandas 경로 vs NumPy top-k)
+# - 모델 추론은 제외하고 가중치 점수 / 정규화 / 상위 10개 선택 / dict 변환만 측정
+#   python -m benchmarks.recommend_ranking --sizes 100 1000 10000 100000 --repeat 50
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from app.services.road_features import FeatureSnapshot, ROAD_COLUMNS
+from app.services.road_ranking import rank_region
+
+
+class DefaultWeights:
+    rd_slope_weight = 2.5
+    acc_occ_weight = 3.0
+    acc_sc_weight = 1.5
+    rd_fr_weight = 1.5
+    traff_weight = 1.5
+
+
+def pandas_rank(region, model_scores, weights):
+    """이전 road_recommendations의 pandas 구현"""
+    df = pd.DataFrame(region.columns, columns=ROAD_COLUMNS)
+    df["예측점수"] = model_scores
+    w = {
+        "rd_slope": weights.rd_slope_weight,
+        "acc_occ": weights.acc_occ_weight,
+        "acc_sc": weights.acc_sc_weight,
+        "rd_fr": weights.rd_fr_weight,
+        "traff": weights.traff_weight,
+    }
+    total = sum(w.values())
+    w = {k: v / total for k, v in w.items()}
+    df["pred_idx"] = (
+        df["예측점수"] * 0.3
+        + df["rd_slope"] * w["rd_slope"]
+        + df["acc_occ"] * w["acc_occ"]
+        + df["acc_sc"] * w["acc_sc"]
+        + df["rd_fr"] * w["rd_fr"]
+        + df["traff"] * w["traff"]
+    )
+    min_score, max_score = df["pred_idx"].min(), df["pred_idx"].max()
+    if max_score - min_score > 0:
+        df["pred_idx"] = (df["pred_idx"] - min_score) / (max_score - min_score) * 100
+    else:
+        df["pred_idx"] = 50
+    return df.sort_values("pred_idx", ascending=False).head(10).to_dict(orient="records")
+
+
+def make_region(size: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    rows = [
+        (
+            "벤치동", f"R{i}", f"도로{i}", "시점", "종점",
+            float(rng.uniform(0, 10)), int(rng.integers(0, 20)),
+            int(rng.integers(0, 5)), float(rng.uniform(0, 1)),
+            int(rng.integers(100, 5000)),
+        )
+        for i in range(size)
+    ]
+    return FeatureSnapshot(rows, 1).region("벤치동"), rng.uniform(0, 1, size)
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return float(np.median(timings))
+
+
+def main(args):
+    weights = DefaultWeights()
+    print(f"{'roads':>8} {'pandas(ms)':>11} {'numpy(ms)':>10} {'speedup':>8}")
+    for size in args.sizes:
+        region, model_scores = make_region(size)
+        old = measure(lambda: pandas_rank(region, model_scores, weights), args.repeat)
+        new = measure(lambda: rank_region(region, model_scores, weights), args.repeat)
+        print(f"{size:>8} {old:>11.3f} {new:>10.3f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000]
+    )
+    parser.add_argument("--repeat", type=int, default=30)
+    main(parser.parse_args())
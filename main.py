@@ -6,16 +6,31 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from apscheduler.schedulers.background import BackgroundScheduler
 from contextlib import asynccontextmanager
+from datetime import datetime
 from starlette.responses import JSONResponse
-from app.database.mysql_connect import get_connection
+from app.database.mysql_connect import close_pool
+from app.database.async_mysql import close_async_pool
 from app.api.routes import admin, auth, board, mypage, roads, dev
-from app.core.token_blacklist import is_token_blacklisted
-from app.core.jwt_utils import verify_token
+from app.core.jwt_utils import authenticate
+from app.core.redis_events import start_event_listener, stop_event_listener
+from app.core.email_utils import email_outbox
+from app.core.token_blacklist import rebuild_revocation_filter
 from app.services.sync_views import sync_redis_to_mysql
+from app.services.rollups import refresh_rollups, ROLLUP_INTERVAL_MINUTES
+from app.services.visitor_counter import record_visits, backfill_from_logs
+from app.services.road_features import feature_store, FEATURE_STORE_CHECK_MINUTES
+from app.services.model_registry import model_registry
+from app.services.inference_executor import inference_executor
+from app.services.presence import touch as touch_presence
+from app.services.log_writer import (
+    visit_log_writer,
+    error_log_writer,
+    start_log_writers,
+    stop_log_writers,
+)
 from app.api.socket import socket_app
 from dotenv import load_dotenv
 import os
-import redis
 
 # 환경변수 로드
 env_path = os.path.join(os.path.dirname(__file__), ".env")
@@ -27,14 +42,6 @@ engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-# Redis 연결
-try:
-    redis_client = redis.StrictRedis(host="ongil_redis", port=6379, db=0)
-except Exception as e:
-    print(f"Redis connection failed: {e}")
-    redis_client = None
-
-
 # DB 종속성
 def get_db():
     db = SessionLocal()
@@ -50,11 +57,39 @@ async def lifespan(app: FastAPI):
     print("🚀 App is starting... Initializing scheduler")
     scheduler = BackgroundScheduler()
     scheduler.add_job(sync_redis_to_mysql, "interval", minutes=10)
+    scheduler.add_job(
+        refresh_rollups,
+        "interval",
+        minutes=ROLLUP_INTERVAL_MINUTES,
+        next_run_time=datetime.now(),
+    )
+    # 도로 특성 저장소 적재 (이후 seoul_info가 바뀌었을 때만 재적재)
+    scheduler.add_job(
+        feature_store.refresh,
+        "interval",
+        minutes=FEATURE_STORE_CHECK_MINUTES,
+        next_run_time=datetime.now(),
+    )
+    # 순방문자 HyperLogLog 키를 visit_logs로 한 번 채움 (이미 채워졌으면 건너뜀)
+    scheduler.add_job(backfill_from_logs, next_run_time=datetime.now())
+    # 폐기 토큰 filter 주기적 재생성 (만료된 ID 정리)
+    scheduler.add_job(rebuild_revocation_filter, "interval", minutes=60)
     scheduler.start()
     app.state.scheduler = scheduler
+    # 추천 모델은 요청 처리를 막지 않도록 백그라운드에서 적재 + 시험 추론
+    model_registry.start_background_load()
+    start_log_writers()
+    start_event_listener()
+    email_outbox.start()
     yield
     print("🛑 Shutting down scheduler...")
     scheduler.shutdown()
+    stop_event_listener()
+    email_outbox.stop()
+    inference_executor.shutdown()
+    stop_log_writers()
+    close_pool()
+    await close_async_pool()
 
 
 # FastAPI 앱 설정
@@ -75,6 +110,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     )
 
 
+# 방문 로그가 기록될 때 순방문자 HyperLogLog도 함께 갱신
+visit_log_writer.add_flush_hook(record_visits)
+
+
 # 제외 경로 설정
 EXCLUDED_PATHS = [
     "/auth/login",
@@ -101,14 +140,13 @@ async def unified_tracking_middleware(request: Request, call_next):
     # 토큰 검증 및 접속자 등록
     if not is_excluded and token:
         try:
-            if is_token_blacklisted(token):
-                raise HTTPException(
-                    status_code=401, detail="토큰이 블랙리스트에 등록되었습니다."
-                )
-            payload = verify_token(token)
+            payload = authenticate(token)
+            # 라우트 의존성(get_authenticated_user)에서 다시 검증하지 않도록 보관
+            request.state.user = payload
+            request.state.token = token
             email = payload.get("sub")
-            if email and redis_client:
-                redis_client.sadd("online_users", email)
+            if email:
+                touch_presence(email)
         except Exception as e:
             print(f"[토큰 검증 실패] {e}")
             raise HTTPException(status_code=401, detail="유효하지 않은 토큰입니다.")
@@ -117,37 +155,14 @@ async def unified_tracking_middleware(request: Request, call_next):
     response = await call_next(request)
     status_code = response.status_code
 
-    # 방문 로그 저장
-    try:
-        if not path.startswith(("/socket.io", "/docs", "/favicon.ico")):
-            connection = get_connection()
-            cursor = connection.cursor()
-            query = "INSERT INTO visit_logs (user_email, route, ip_address) VALUES (%s, %s, %s)"
-            cursor.execute(query, (email, path, request.client.host))
-            connection.commit()
-    except Exception as e:
-        print(f"[방문 로그 기록 실패] {e}")
-    finally:
-        if "cursor" in locals() and cursor:
-            cursor.close()
-        if "connection" in locals() and connection.is_connected():
-            connection.close()
+    # 방문 로그 저장 (일괄 기록 큐에 적재)
+    now = datetime.now()
+    if not path.startswith(("/socket.io", "/docs", "/favicon.ico")):
+        visit_log_writer.put((email, path, request.client.host, now))
 
     # 에러 로그 저장
     if status_code >= 400:
-        try:
-            connection = get_connection()
-            cursor = connection.cursor()
-            query = "INSERT INTO error_logs (user_email, route, status_code) VALUES (%s, %s, %s)"
-            cursor.execute(query, (email, path, status_code))
-            connection.commit()
-        except Exception as e:
-            print(f"[에러 로그 기록 실패] {e}")
-        finally:
-            if "cursor" in locals() and cursor:
-                cursor.close()
-            if "connection" in locals() and connection.is_connected():
-                connection.close()
+        error_log_writer.put((email, path, status_code, now))
 
     return response
 